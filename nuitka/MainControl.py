@@ -37,9 +37,9 @@ from nuitka.PythonVersions import isUninstalledPython, python_version
 from nuitka.tree import SyntaxErrors
 from nuitka.utils import InstanceCounters, MemoryUsage, Utils
 
-from . import ModuleRegistry, Options, Tracing, TreeXML
+from . import ModuleRegistry, Options, Reports, Tracing, TreeXML
 from .build import SconsInterface
-from .codegen import CodeGeneration, ConstantCodes
+from .codegen import CodeGeneration, ConstantCodes, ParallelCodeGeneration
 from .finalizations import Finalization
 from .freezer.BytecodeModuleFreezer import generateBytecodeFrozenCode
 from .freezer.Standalone import copyUsedDLLs, detectEarlyImports
@@ -57,12 +57,13 @@ def createNodeTree(filename):
     """
 
     # First, build the raw node tree from the source code.
-    main_module = Building.buildModuleTree(
-        filename = filename,
-        package  = None,
-        is_top   = True,
-        is_main  = not Options.shallMakeModule()
-    )
+    with Reports.withPhase("tree_building"):
+        main_module = Building.buildModuleTree(
+            filename = filename,
+            package  = None,
+            is_top   = True,
+            is_main  = not Options.shallMakeModule()
+        )
     ModuleRegistry.addRootModule(main_module)
 
     # First remove old object files and old generated files, old binary or
@@ -98,7 +99,8 @@ def createNodeTree(filename):
 
 
     # Then optimize the tree and potentially recursed modules.
-    Optimization.optimize()
+    with Reports.withPhase("optimization"):
+        Optimization.optimize()
 
     return main_module
 
@@ -312,9 +314,10 @@ def makeSourceDirectory(main_module):
             )
 
     # Prepare code generation, i.e. execute finalization for it.
-    for module in ModuleRegistry.getDoneModules():
-        if module.isCompiledPythonModule():
-            Finalization.prepareCodeGeneration(module)
+    with Reports.withPhase("finalization"):
+        for module in ModuleRegistry.getDoneModules():
+            if module.isCompiledPythonModule():
+                Finalization.prepareCodeGeneration(module)
 
     # Pick filenames.
     source_dir = getSourceDirectoryPath(main_module)
@@ -329,19 +332,43 @@ def makeSourceDirectory(main_module):
     # end only.
     prepared_modules = {}
 
-    for module in ModuleRegistry.getDoneModules():
-        if module.isCompiledPythonModule():
-            cpp_filename = module_filenames[module]
-
-            prepared_modules[cpp_filename] = CodeGeneration.prepareModuleCode(
+    compiled_modules = [
+        module
+        for module in
+        ModuleRegistry.getDoneModules()
+        if module.isCompiledPythonModule()
+    ]
+
+    with Reports.withPhase("code_generation"):
+        if ParallelCodeGeneration.canPrepareModulesInParallel(
+                job_limit = Options.getJobLimit(),
+                modules   = compiled_modules
+            ):
+            prepared_module_codes = ParallelCodeGeneration.prepareModulesCode(
                 global_context = global_context,
-                module         = module,
-                module_name    = module.getFullName(),
+                modules        = compiled_modules,
+                job_limit      = Options.getJobLimit()
             )
+        else:
+            prepared_module_codes = [
+                CodeGeneration.prepareModuleCode(
+                    global_context = global_context,
+                    module         = module,
+                    module_name    = module.getFullName(),
+                )
+                for module in
+                compiled_modules
+            ]
+
+    for module, prepared_module_code in zip(compiled_modules,
+                                            prepared_module_codes):
+        cpp_filename = module_filenames[module]
+
+        prepared_modules[cpp_filename] = prepared_module_code
 
-            # Main code constants need to be allocated already too.
-            if module is main_module and not Options.shallMakeModule():
-                prepared_modules[cpp_filename][1].getConstantCode(0)
+        # Main code constants need to be allocated already too.
+        if module is main_module and not Options.shallMakeModule():
+            prepared_module_code[1].getConstantCode(0)
 
     # Second pass, generate the actual module code into the files.
     for module in ModuleRegistry.getDoneModules():
@@ -350,16 +377,26 @@ def makeSourceDirectory(main_module):
 
             template_values, module_context = prepared_modules[cpp_filename]
 
-            source_code = CodeGeneration.generateModuleCode(
-                module_context  = module_context,
-                template_values = template_values
-            )
+            with Reports.withPhase(
+                "module_code_generation",
+                module = module.getFullName()
+            ):
+                source_code = CodeGeneration.generateModuleCode(
+                    module_context  = module_context,
+                    template_values = template_values
+                )
 
             writeSourceCode(
                 filename    = cpp_filename,
                 source_code = source_code
             )
 
+            Reports.onModuleCode(
+                module_name = module.getFullName(),
+                filename    = cpp_filename,
+                source_code = source_code
+            )
+
             if Options.isShowInclusion():
                 info("Included compiled module '%s'." % module.getFullName())
         elif module.isPythonShlibModule():
@@ -391,17 +428,21 @@ def makeSourceDirectory(main_module):
         else:
             assert False, module
 
-    writeSourceCode(
-        filename    = Utils.joinpath(source_dir, "__constants.cpp"),
-        source_code = ConstantCodes.getConstantsDefinitionCode(
+    with Reports.withPhase("constants_generation"):
+        constants_code = ConstantCodes.getConstantsDefinitionCode(
             context = global_context
         )
-    )
 
-    helper_decl_code, helper_impl_code = CodeGeneration.generateHelpersCode(
-        ModuleRegistry.getDoneUserModules()
+    writeSourceCode(
+        filename    = Utils.joinpath(source_dir, "__constants.cpp"),
+        source_code = constants_code
     )
 
+    with Reports.withPhase("helpers_generation"):
+        helper_decl_code, helper_impl_code = CodeGeneration.generateHelpersCode(
+            ModuleRegistry.getDoneUserModules()
+        )
+
     writeSourceCode(
         filename    = Utils.joinpath(source_dir, "__helpers.hpp"),
         source_code = helper_decl_code
@@ -413,7 +454,7 @@ def makeSourceDirectory(main_module):
     )
 
 
-def runScons(main_module, quiet):
+def runScons(main_module, quiet, pgo_mode):
     # Scons gets transported many details, that we express as variables, and
     # have checks for them, leading to many branches, pylint: disable=R0912
 
@@ -465,6 +506,9 @@ def runScons(main_module, quiet):
     if Options.isLto():
         options["lto_mode"] = "true"
 
+    if pgo_mode is not None:
+        options["pgo_mode"] = pgo_mode
+
     if Options.shallDisableConsoleWindow():
         options["win_disable_console"] = "true"
 
@@ -505,6 +549,12 @@ def runScons(main_module, quiet):
     if Options.isProfile():
         options["profile_mode"] = "true"
 
+    if Options.isNativeProfile():
+        options["native_profile_mode"] = "true"
+
+    if Options.shallMakeConstantsImmortal():
+        options["immortal_constants_mode"] = "true"
+
     if "no_warnings" in getPythonFlags():
         options["no_python_warnings"] = "true"
 
@@ -566,16 +616,60 @@ def callExec(args, clean_path, add_path):
         else:
             os.environ["PYTHONPATH"] = Options.getOutputDir()
 
-    # We better flush these, "os.execl" won't do it anymore.
+    # We better flush these, "os.execl" won't do it anymore, and neither
+    # will it run the exit handler writing the report.
     sys.stdout.flush()
     sys.stderr.flush()
 
+    if Reports.isReporting():
+        Reports.writeReport()
+
     # Add the main arguments, previous separated.
     args += Options.getPositionalArgs()[1:] + Options.getMainArgs()
 
     Utils.callExec(args)
 
 
+def getPgoProfileFilenames(source_dir):
+    # The profile files are created next to the object files.
+    return [
+        filename
+        for filename in
+        Utils.getFileList(source_dir)
+        if Utils.getExtension(filename) == ".gcda"
+    ]
+
+
+def runPgoTraining(main_module):
+    # Relative paths would be searched in PATH, and the training command may
+    # change directory, so make it absolute.
+    binary_filename = Utils.abspath(getResultFullpath(main_module))
+
+    if Options.getPgoExecutable() is not None:
+        command = Options.getPgoExecutable()
+        shell = True
+    else:
+        command = [binary_filename] + Options.getPgoArgs()
+        shell = False
+
+    env = dict(os.environ)
+    env["NUITKA_PGO_BINARY"] = binary_filename
+
+    info("Running PGO training of '%s'." % binary_filename)
+
+    result = subprocess.call(
+        command,
+        shell = shell,
+        env   = env
+    )
+
+    if result != 0:
+        warning(
+            "PGO training run exited with %d, profile may be incomplete.",
+            result
+        )
+
+
 def executeMain(binary_filename, clean_path):
     args = (binary_filename, binary_filename)
 
@@ -649,11 +743,25 @@ def compileTree(main_module):
     if Options.shallNotDoExecCppCall():
         return True, {}
 
+    if not Options.isPgo():
+        pgo_mode = None
+    elif Options.shallReusePgoProfile() and \
+         getPgoProfileFilenames(source_dir):
+        pgo_mode = "use"
+    else:
+        # Old profiles would be merged with the new ones, remove them.
+        for profile_filename in getPgoProfileFilenames(source_dir):
+            Utils.deleteFile(profile_filename, True)
+
+        pgo_mode = "generate"
+
     # Run the Scons to build things.
-    result, options = runScons(
-        main_module = main_module,
-        quiet       = not Options.isShowScons()
-    )
+    with Reports.withPhase("scons", pgo_mode = pgo_mode):
+        result, options = runScons(
+            main_module = main_module,
+            quiet       = not Options.isShowScons(),
+            pgo_mode    = pgo_mode
+        )
 
     return result, options
 
@@ -679,6 +787,9 @@ def main():
 
     filename = Options.getPositionalArgs()[0]
 
+    if Reports.isReporting():
+        Reports.startReporting(filename)
+
     # Inform the importing layer about the main script directory, so it can use
     # it when attempting to follow imports.
     Importing.setMainScriptDirectory(
@@ -688,7 +799,10 @@ def main():
     # Detect to be frozen modules if any, so we can consider to not recurse
     # to them.
     if Options.isStandaloneMode():
-        for module in detectEarlyImports():
+        with Reports.withPhase("early_imports_detection"):
+            early_modules = detectEarlyImports()
+
+        for module in early_modules:
             ModuleRegistry.addUncompiledModule(module)
 
             if module.getName() == "site":
@@ -730,12 +844,6 @@ def main():
         if Options.shallNotDoExecCppCall():
             sys.exit(0)
 
-        # Remove the source directory (now build directory too) if asked to.
-        if Options.isRemoveBuildDir():
-            shutil.rmtree(
-                getSourceDirectoryPath(main_module)
-            )
-
         if Options.isStandaloneMode():
             binary_filename = options["result_name"] + ".exe"
 
@@ -756,10 +864,11 @@ def main():
                     Plugins.considerExtraDlls(dist_dir, module)
                 )
 
-            copyUsedDLLs(
-                dist_dir                = dist_dir,
-                standalone_entry_points = standalone_entry_points
-            )
+            with Reports.withPhase("dll_copy"):
+                copyUsedDLLs(
+                    dist_dir                = dist_dir,
+                    standalone_entry_points = standalone_entry_points
+                )
 
 
             for module in ModuleRegistry.getDoneModules():
@@ -780,6 +889,28 @@ def main():
                     target_filename
                 )
 
+        # Train the instrumented binary, and build again with the profile
+        # gained, which goes to the build directory, for reuse by later builds.
+        if options.get("pgo_mode") == "generate":
+            with Reports.withPhase("pgo_training"):
+                runPgoTraining(main_module)
+
+            with Reports.withPhase("scons", pgo_mode = "use"):
+                result, options = runScons(
+                    main_module = main_module,
+                    quiet       = not Options.isShowScons(),
+                    pgo_mode    = "use"
+                )
+
+            if not result:
+                sys.exit(1)
+
+        # Remove the source directory (now build directory too) if asked to.
+        if Options.isRemoveBuildDir():
+            shutil.rmtree(
+                getSourceDirectoryPath(main_module)
+            )
+
         # Modules should not be executable, but Scons creates them like it, fix
         # it up here.
         if Utils.getOS() != "Windows" and Options.shallMakeModule():
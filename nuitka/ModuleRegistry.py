@@ -195,6 +195,14 @@ def getDoneUserModules():
     )
 
 
+def getDoneModuleFromName(module_name):
+    for module in done_modules:
+        if module.getFullName() == module_name:
+            return module
+
+    return None
+
+
 def removeDoneModule(module):
     done_modules.remove(module)
 
@@ -22,6 +22,7 @@ Nuitka V0.5.22rc5
 Copyright (C) 2016 Kay Hayen."""
 
 import logging
+import shlex
 import sys
 from optparse import SUPPRESS_HELP, OptionGroup, OptionParser
 
@@ -336,6 +337,55 @@ compatibility reasons, the "__file__" value will always have ".py" suffix
 independent of what it really is."""
 )
 
+codegen_group.add_option(
+    "--stackless-generators",
+    action  = "store_true",
+    dest    = "stackless_generators",
+    default = False,
+    help    = """\
+Compile generators to resumable functions that keep their state on the heap,
+instead of running them on a separate stack each. This makes creating them
+cheaper and uses less memory. Coroutines and generators that use "yield from"
+are not affected. Defaults to off."""
+)
+
+codegen_group.add_option(
+    "--tree-shaking",
+    action  = "store_true",
+    dest    = "tree_shaking",
+    default = False,
+    help    = """\
+Remove module level functions that no code of the program can reach, so they
+are neither compiled nor created at startup. Code that finds functions through
+reflection not visible at compile time, e.g. "sys.modules" lookups, will not
+find them anymore, use "--tree-shaking-keep" for such modules. Requires
+"--standalone" mode. Defaults to off."""
+)
+
+codegen_group.add_option(
+    "--tree-shaking-keep",
+    action  = "append",
+    dest    = "tree_shaking_keep",
+    metavar = "MODULE/PACKAGE",
+    default = [],
+    help    = """\
+Keep all functions of that module, or if a package, of the whole package with
+"--tree-shaking". Can be given multiple times. Default empty."""
+)
+
+codegen_group.add_option(
+    "--immortal-constants",
+    action  = "store_true",
+    dest    = "immortal_constants",
+    default = False,
+    help    = """\
+Make the constants of the compiled program immortal. They are moved to memory
+of their own where possible, and the compiled code does not count references
+to them, nor does the garbage collector visit them. This keeps more memory
+shared between processes forked after loading, e.g. by pre-fork servers.
+Defaults to off."""
+)
+
 codegen_group.add_option(
     "--no-optimization",
     action  = "store_true",
@@ -417,6 +467,18 @@ debug_group.add_option(
 Enable vmprof based profiling of time spent. Defaults to off."""
 )
 
+debug_group.add_option(
+    "--native-profile",
+    action  = "store_true",
+    dest    = "native_profile",
+    default = False,
+    help    = """\
+Enable profiling of the compiled code itself. Compiled functions and generator
+resumptions record their calls and the time spent, which is written to the
+file "nuitka-native-profile-<pid>.dat" at program exit. Report it with
+"python -m nuitka.profiler.NativeProfile". Defaults to off."""
+)
+
 debug_group.add_option(
     "--graph",
     action  = "store_true",
@@ -535,8 +597,8 @@ cpp_compiler_group.add_option(
     metavar = 'N',
     default = Utils.getCoreCount(),
     help    = """\
-Specify the allowed number of parallel C++ compiler jobs. Defaults to the
-system CPU count.""",
+Specify the allowed number of parallel C++ compiler jobs, also used for the
+number of code generation processes. Defaults to the system CPU count.""",
 )
 
 cpp_compiler_group.add_option(
@@ -549,6 +611,49 @@ Use link time optimizations if available and usable (g++ 4.6 and higher).
 Defaults to off."""
 )
 
+cpp_compiler_group.add_option(
+    "--pgo",
+    action  = "store_true",
+    dest    = "pgo",
+    default = False,
+    help    = """\
+Use profile guided optimization (g++ only). An instrumented binary is built
+first, a training run of it is made, and then the final binary is built with
+the recorded profile. Defaults to off."""
+)
+
+cpp_compiler_group.add_option(
+    "--pgo-args",
+    action  = "store",
+    dest    = "pgo_args",
+    default = "",
+    help    = """\
+Arguments to give to the compiled program for the training run of "--pgo"
+mode. Defaults to none."""
+)
+
+cpp_compiler_group.add_option(
+    "--pgo-executable",
+    action  = "store",
+    dest    = "pgo_executable",
+    default = None,
+    help    = """\
+Command to use for the training run of "--pgo" mode instead of the compiled
+program, required for modules. The instrumented binary name is given to it
+in the "NUITKA_PGO_BINARY" environment variable. Defaults to none."""
+)
+
+cpp_compiler_group.add_option(
+    "--pgo-reuse",
+    action  = "store_true",
+    dest    = "pgo_reuse",
+    default = False,
+    help    = """\
+For "--pgo" mode, use the profile files kept in the build directory from
+a previous training run, if there are any, instead of making a new one.
+Defaults to off."""
+)
+
 parser.add_option_group(cpp_compiler_group)
 
 tracing_group = OptionGroup(
@@ -594,6 +699,19 @@ tracing_group.add_option(
 Defaults to off."""
 )
 
+tracing_group.add_option(
+    "--report",
+    action  = "store",
+    dest    = "report_filename",
+    metavar = "REPORT_FILENAME",
+    default = None,
+    help    = """\
+Write a report of the compilation to the given file, with the time and
+memory used by each phase, e.g. optimization of every module in every
+pass, and the size of the C++ code generated per module. The format is
+JSON for a ".json" filename, XML otherwise. Defaults to off."""
+)
+
 tracing_group.add_option(
     "--verbose",
     action  = "store_true",
@@ -718,6 +836,18 @@ if options.is_standalone:
     if Utils.getOS() == "NetBSD":
         logging.warning("Standalone mode on NetBSD is not functional, due to $ORIGIN linkage not being supported.")
 
+if options.pgo and not options.executable and options.pgo_executable is None:
+    parser.print_help()
+
+    sys.exit("""
+Error, "--pgo" for modules needs a training command with "--pgo-executable".""")
+
+if options.tree_shaking and not options.is_standalone:
+    parser.print_help()
+
+    sys.exit("""
+Error, "--tree-shaking" needs to see the whole program, use "--standalone".""")
+
 def shallTraceExecution():
     return options.trace_execution
 
@@ -742,6 +872,18 @@ def shallNotDoExecCppCall():
 def shallHaveStatementLines():
     return options.statement_lines
 
+def shallMakeStacklessGenerators():
+    return options.stackless_generators
+
+def shallShakeTree():
+    return options.tree_shaking
+
+def getTreeShakingKeepModules():
+    return sum([ x.split(',') for x in options.tree_shaking_keep ], [])
+
+def shallMakeConstantsImmortal():
+    return options.immortal_constants
+
 def getFileReferenceMode():
     if options.file_reference_mode is None:
         value = ("runtime"
@@ -830,6 +972,9 @@ def isUnstripped():
 def isProfile():
     return options.profile
 
+def isNativeProfile():
+    return options.native_profile
+
 def shouldCreateGraph():
     return options.graph
 
@@ -863,6 +1008,18 @@ def getJobLimit():
 def isLto():
     return options.lto
 
+def isPgo():
+    return options.pgo
+
+def getPgoArgs():
+    return shlex.split(options.pgo_args)
+
+def getPgoExecutable():
+    return options.pgo_executable
+
+def shallReusePgoProfile():
+    return options.pgo_reuse
+
 def isClang():
     return options.clang
 
@@ -887,6 +1044,9 @@ def isShowMemory():
 def isShowInclusion():
     return options.show_inclusion
 
+def getReportFilename():
+    return options.report_filename
+
 def isRemoveBuildDir():
     return options.remove_build and not options.generate_cpp_only
 
@@ -0,0 +1,185 @@
+#     Copyright 2016, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Report of the compilation, where the time and memory goes.
+
+With "--report", the phases of the compilation are timed, and the memory
+usage after each one is recorded, as is the size of the C++ code generated
+for each module. Phases nest, e.g. the optimization of a module in a pass is
+part of the optimization phase. At the end, this is written as XML or JSON,
+so compile time regressions can be tracked across Nuitka versions.
+
+The "tree_building" phase covers only the main module. Modules found by
+recursion are built when their imports are optimized, so these have their
+"module_tree_building" phases nested in the optimization phase, and their
+time is included in its total.
+"""
+
+import atexit
+import contextlib
+import json
+import os
+import sys
+import time
+
+from nuitka import Options, TreeXML
+from nuitka.utils import MemoryUsage
+
+# The report, and the phases not yet finished, the innermost last, with the
+# report holding the top level ones.
+_report = {
+    "phases"  : [],
+    "modules" : []
+}
+_phase_stack = [_report]
+
+_report_written = False
+
+
+class PhaseTimer:
+    def __init__(self):
+        self.start_wall = time.time()
+        self.start_times = os.times()
+        self.start_memory = MemoryUsage.getOwnProcessMemoryUsage()
+
+    def asDict(self):
+        stop_times = os.times()
+        stop_memory = MemoryUsage.getOwnProcessMemoryUsage()
+
+        return {
+            "wall_time"      : time.time() - self.start_wall,
+            "cpu_time"       : sum(stop_times[0:2]) - \
+                               sum(self.start_times[0:2]),
+            # Child processes, i.e. Scons and the C++ compiler, only count,
+            # once they were waited for.
+            "child_cpu_time" : sum(stop_times[2:4]) - \
+                               sum(self.start_times[2:4]),
+            # This is the peak usage so far on POSIX systems.
+            "memory_usage"   : stop_memory,
+            "memory_change"  : stop_memory - self.start_memory
+        }
+
+
+def isReporting():
+    return Options.getReportFilename() is not None
+
+
+@contextlib.contextmanager
+def withPhase(name, **attributes):
+    """ Record the time and memory used by a phase of the compilation.
+
+        The attributes given identify it further, e.g. the module, values
+        of None are left out.
+    """
+
+    if not isReporting():
+        yield
+        return
+
+    phase = {
+        "name"   : name,
+        "phases" : []
+    }
+
+    for key, value in attributes.items():
+        if value is not None:
+            phase[key] = value
+
+    _phase_stack[-1]["phases"].append(phase)
+    _phase_stack.append(phase)
+
+    timer = PhaseTimer()
+
+    try:
+        yield
+    finally:
+        phase.update(timer.asDict())
+
+        assert _phase_stack[-1] is phase
+        _phase_stack.pop()
+
+
+def onModuleCode(module_name, filename, source_code):
+    if isReporting():
+        _report["modules"].append(
+            {
+                "name"      : module_name,
+                "filename"  : os.path.basename(filename),
+                "code_size" : len(source_code)
+            }
+        )
+
+
+def _makeReportXML(values, tag):
+    result = TreeXML.Element(tag)
+
+    for key, value in sorted(values.items()):
+        if key in ("phases", "modules"):
+            continue
+
+        if type(value) is float:
+            value = "%.3f" % value
+
+        result.set(key, str(value))
+
+    for phase in values.get("phases", ()):
+        result.append(_makeReportXML(phase, "phase"))
+
+    for module in values.get("modules", ()):
+        result.append(_makeReportXML(module, "module"))
+
+    return result
+
+
+def startReporting(filename):
+    """ Start the report, it is written when Nuitka exits. """
+
+    _report["nuitka_version"] = Options.getVersion()
+    _report["python_version"] = "%d.%d.%d" % sys.version_info[0:3]
+    _report["filename"] = filename
+    _report["timer"] = PhaseTimer()
+
+    atexit.register(writeReport)
+
+
+def writeReport():
+    """ Write the report, unless it was done already.
+
+        Normally called at exit, but executing the result replaces the
+        process, so it must be done before that explicitly.
+    """
+
+    # Singleton, pylint: disable=W0603
+    global _report_written
+
+    if _report_written:
+        return
+    _report_written = True
+
+    _report.update(_report.pop("timer").asDict())
+
+    report_filename = Options.getReportFilename()
+
+    if report_filename.lower().endswith(".json"):
+        contents = json.dumps(_report, indent = 2, sort_keys = True)
+    else:
+        contents = TreeXML.toString(
+            _makeReportXML(_report, "nuitka-compilation-report")
+        )
+
+    with open(report_filename, 'w') as output_file:
+        output_file.write(contents)
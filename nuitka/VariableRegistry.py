@@ -170,6 +170,20 @@ class GlobalVariableTrace:
 
         return None
 
+    def getSingleAssignTrace(self):
+        """ The only assignment trace of the variable, or None. """
+
+        result = None
+
+        for trace in self.traces:
+            if trace.isAssignTrace():
+                if result is not None:
+                    return None
+
+                result = trace
+
+        return result
+
     def hasWritesOutsideOf(self, provider):
         if provider in self.writers:
             return len(self.writers) > 1
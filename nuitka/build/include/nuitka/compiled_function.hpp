@@ -120,4 +120,30 @@ extern PyObject *Nuitka_CallFunctionPosArgsKwArgs( Nuitka_FunctionObject const *
 extern PyObject *Nuitka_CallMethodFunctionNoArgs( Nuitka_FunctionObject const *function, PyObject *object );
 extern PyObject *Nuitka_CallMethodFunctionPosArgsKwArgs( Nuitka_FunctionObject const *function, PyObject *object, PyObject **args, Py_ssize_t args_size, PyObject *kw );
 
+// Call a compiled function, of which the code is known to take exactly the
+// given positional arguments, which are not consumed.
+static inline PyObject *Nuitka_CallFunctionDirect( PyObject *called, function_impl_code c_code, PyObject **args, Py_ssize_t args_size )
+{
+    assert( Nuitka_Function_Check( called ) );
+    assert( ((Nuitka_FunctionObject *)called)->m_c_code == c_code );
+    assert( ((Nuitka_FunctionObject *)called)->m_args_simple );
+    assert( ((Nuitka_FunctionObject *)called)->m_args_positional_count == args_size );
+
+    if (unlikely( Py_EnterRecursiveCall( (char *)" while calling a Python object" ) ))
+    {
+        return NULL;
+    }
+
+    for( Py_ssize_t i = 0; i < args_size; i++ )
+    {
+        Py_INCREF( args[ i ] );
+    }
+
+    PyObject *result = c_code( (Nuitka_FunctionObject *)called, args );
+
+    Py_LeaveRecursiveCall();
+
+    return result;
+}
+
 #endif
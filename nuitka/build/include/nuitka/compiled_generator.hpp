@@ -48,9 +48,6 @@ typedef struct {
     PyObject *m_yieldfrom;
 #endif
 
-    Fiber m_yielder_context;
-    Fiber m_caller_context;
-
     // Weak references are supported for generator objects in CPython.
     PyObject *m_weakrefs;
 
@@ -72,16 +69,38 @@ typedef struct {
     // Was it ever used, is it still running, or already finished.
     Generator_Status m_status;
 
+#if _NUITKA_NATIVE_PROFILE
+    // Resumptions are profiled with this entry, if any.
+    struct Nuitka_ProfileEntry *m_profile_entry;
+#endif
+
+    // Stackless generators resume their code at the yield given by index,
+    // and keep the values that must survive a yield in the heap storage.
+    bool m_stackless;
+    int m_yield_return_index;
+    void *m_heap_storage;
+
+    // Only for generators not stackless, they are not allocated otherwise,
+    // so this must come last.
+    Fiber m_yielder_context;
+    Fiber m_caller_context;
+
 } Nuitka_GeneratorObject;
 
 extern PyTypeObject Nuitka_Generator_Type;
 
 typedef void (*generator_code)( Nuitka_GeneratorObject * );
 
+// Stackless generator code gets the value sent, and returns the value yielded,
+// or NULL when finished.
+typedef PyObject *(*stackless_generator_code)( Nuitka_GeneratorObject *, PyObject * );
+
 #if PYTHON_VERSION < 350
 extern PyObject *Nuitka_Generator_New( generator_code code, PyObject *name, PyCodeObject *code_object, PyCellObject **closure, Py_ssize_t closure_given );
+extern PyObject *Nuitka_Generator_NewStackless( stackless_generator_code code, PyObject *name, PyCodeObject *code_object, PyCellObject **closure, Py_ssize_t closure_given );
 #else
 extern PyObject *Nuitka_Generator_New( generator_code code, PyObject *name, PyObject *qualname, PyCodeObject *code_object, PyCellObject **closure, Py_ssize_t closure_given );
+extern PyObject *Nuitka_Generator_NewStackless( stackless_generator_code code, PyObject *name, PyObject *qualname, PyCodeObject *code_object, PyCellObject **closure, Py_ssize_t closure_given );
 #endif
 
 static inline bool Nuitka_Generator_Check( PyObject *object )
@@ -95,6 +114,27 @@ static inline PyObject *Nuitka_Generator_GetName( PyObject *object )
 }
 
 
+// Check for an exception thrown into the generator while it was suspended.
+static inline bool CHECK_GENERATOR_THROWN( Nuitka_GeneratorObject *generator )
+{
+    if (unlikely( generator->m_exception_type ))
+    {
+        RESTORE_ERROR_OCCURRED(
+            generator->m_exception_type,
+            generator->m_exception_value,
+            generator->m_exception_tb
+        );
+
+        generator->m_exception_type = NULL;
+        generator->m_exception_value = NULL;
+        generator->m_exception_tb = NULL;
+
+        return true;
+    }
+
+    return false;
+}
+
 static inline PyObject *YIELD( Nuitka_GeneratorObject *generator, PyObject *value )
 {
     CHECK_OBJECT( value );
@@ -113,18 +153,8 @@ static inline PyObject *YIELD( Nuitka_GeneratorObject *generator, PyObject *valu
 #endif
 
     // Check for thrown exception.
-    if (unlikely( generator->m_exception_type ))
+    if ( CHECK_GENERATOR_THROWN( generator ) )
     {
-        RESTORE_ERROR_OCCURRED(
-            generator->m_exception_type,
-            generator->m_exception_value,
-            generator->m_exception_tb
-        );
-
-        generator->m_exception_type = NULL;
-        generator->m_exception_value = NULL;
-        generator->m_exception_tb = NULL;
-
         return NULL;
     }
 
@@ -132,15 +162,42 @@ static inline PyObject *YIELD( Nuitka_GeneratorObject *generator, PyObject *valu
     return generator->m_yielded;
 }
 
-#if PYTHON_VERSION >= 300
-static inline PyObject *YIELD_IN_HANDLER( Nuitka_GeneratorObject *generator, PyObject *value )
+// For stackless generators, a yield is a return from the generator code, and
+// resuming is calling it again. These do what needs to be done before the
+// return and after the code was resumed.
+static inline PyObject *YIELD_STACKLESS( Nuitka_GeneratorObject *generator, PyObject *value )
 {
     CHECK_OBJECT( value );
 
-    generator->m_yielded = value;
+#if PYTHON_VERSION >= 340
+    generator->m_frame->f_executing -= 1;
+#endif
+
+    return value;
+}
+
+static inline PyObject *YIELD_STACKLESS_RESUME( Nuitka_GeneratorObject *generator, PyObject *value )
+{
+#if PYTHON_VERSION >= 340
+    generator->m_frame->f_executing += 1;
+#endif
+
+    // Check for thrown exception.
+    if ( CHECK_GENERATOR_THROWN( generator ) )
+    {
+        return NULL;
+    }
+
+    CHECK_OBJECT( value );
+    return value;
+}
 
-    // When yielding from an exception handler in Python3, the exception
-    // preserved to the frame is restore, while the current one is put there.
+#if PYTHON_VERSION >= 300
+// When yielding from an exception handler in Python3, the exception preserved
+// to the frame is restored, while the current one is put there, and when
+// resuming it's the other way around, so it's an exchange both times.
+static inline void EXCHANGE_GENERATOR_HANDLER_EXCEPTION()
+{
     PyThreadState *thread_state = PyThreadState_GET();
 
     PyObject *saved_exception_type = thread_state->exc_type;
@@ -151,14 +208,23 @@ static inline PyObject *YIELD_IN_HANDLER( Nuitka_GeneratorObject *generator, PyO
     thread_state->exc_value = thread_state->frame->f_exc_value;
     thread_state->exc_traceback = thread_state->frame->f_exc_traceback;
 
+    thread_state->frame->f_exc_type = saved_exception_type;
+    thread_state->frame->f_exc_value = saved_exception_value;
+    thread_state->frame->f_exc_traceback = saved_exception_traceback;
+}
+
+static inline PyObject *YIELD_IN_HANDLER( Nuitka_GeneratorObject *generator, PyObject *value )
+{
+    CHECK_OBJECT( value );
+
+    generator->m_yielded = value;
+
 #if _DEBUG_EXCEPTIONS
     PRINT_STRING("YIELD exit:\n");
-    PRINT_EXCEPTION( thread_state->exc_type, thread_state->exc_value, (PyObject *)thread_state->exc_traceback );
+    PRINT_EXCEPTION( PyThreadState_GET()->exc_type, PyThreadState_GET()->exc_value, PyThreadState_GET()->exc_traceback );
 #endif
 
-    thread_state->frame->f_exc_type = saved_exception_type;
-    thread_state->frame->f_exc_value = saved_exception_value;
-    thread_state->frame->f_exc_traceback = saved_exception_traceback;
+    EXCHANGE_GENERATOR_HANDLER_EXCEPTION();
 
 #if PYTHON_VERSION >= 340
     generator->m_frame->f_executing -= 1;
@@ -171,44 +237,50 @@ static inline PyObject *YIELD_IN_HANDLER( Nuitka_GeneratorObject *generator, PyO
     generator->m_frame->f_executing += 1;
 #endif
 
-    // When returning from yield, the exception of the frame is preserved, and
-    // the one that enters should be there.
-    thread_state = PyThreadState_GET();
-
-    saved_exception_type = thread_state->exc_type;
-    saved_exception_value = thread_state->exc_value;
-    saved_exception_traceback = thread_state->exc_traceback;
-
 #if _DEBUG_EXCEPTIONS
     PRINT_STRING("YIELD return:\n");
-    PRINT_EXCEPTION( thread_state->exc_type, thread_state->exc_value, (PyObject *)thread_state->exc_traceback );
+    PRINT_EXCEPTION( PyThreadState_GET()->exc_type, PyThreadState_GET()->exc_value, PyThreadState_GET()->exc_traceback );
 #endif
 
-    thread_state->exc_type = thread_state->frame->f_exc_type;
-    thread_state->exc_value = thread_state->frame->f_exc_value;
-    thread_state->exc_traceback = thread_state->frame->f_exc_traceback;
-
-    thread_state->frame->f_exc_type = saved_exception_type;
-    thread_state->frame->f_exc_value = saved_exception_value;
-    thread_state->frame->f_exc_traceback = saved_exception_traceback;
+    EXCHANGE_GENERATOR_HANDLER_EXCEPTION();
 
     // Check for thrown exception.
-    if (unlikely( generator->m_exception_type ))
+    if ( CHECK_GENERATOR_THROWN( generator ) )
     {
-        RESTORE_ERROR_OCCURRED(
-            generator->m_exception_type,
-            generator->m_exception_value,
-            generator->m_exception_tb
-        );
+        return NULL;
+    }
 
-        generator->m_exception_type = NULL;
-        generator->m_exception_value = NULL;
-        generator->m_exception_tb = NULL;
+    return generator->m_yielded;
+}
 
+static inline PyObject *YIELD_IN_HANDLER_STACKLESS( Nuitka_GeneratorObject *generator, PyObject *value )
+{
+    CHECK_OBJECT( value );
+
+    EXCHANGE_GENERATOR_HANDLER_EXCEPTION();
+
+#if PYTHON_VERSION >= 340
+    generator->m_frame->f_executing -= 1;
+#endif
+
+    return value;
+}
+
+static inline PyObject *YIELD_IN_HANDLER_STACKLESS_RESUME( Nuitka_GeneratorObject *generator, PyObject *value )
+{
+#if PYTHON_VERSION >= 340
+    generator->m_frame->f_executing += 1;
+#endif
+
+    EXCHANGE_GENERATOR_HANDLER_EXCEPTION();
+
+    // Check for thrown exception.
+    if ( CHECK_GENERATOR_THROWN( generator ) )
+    {
         return NULL;
     }
 
-    return generator->m_yielded;
+    return value;
 }
 #endif
 
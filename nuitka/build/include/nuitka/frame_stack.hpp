@@ -172,7 +172,22 @@ static inline void dumpFrameStack( void )
 #endif
 
 // Make a replacement for the traceback frame, that we again own it exclusively
-// enough so that the line numbers are detached.
+// enough so that the line numbers are detached. The locals given may be NULL,
+// and can be completed with "storeDetachedFrameLocal".
 extern void detachFrame( PyTracebackObject *traceback, PyObject *locals );
 
+// Give a local variable value to a frame detached for a traceback. These are
+// only put into a "f_locals" dictionary when that is asked for, using the
+// "co_varnames" of the code object.
+NUITKA_MAY_BE_UNUSED static inline void storeDetachedFrameLocal( PyTracebackObject *traceback, Py_ssize_t index, PyObject *value )
+{
+    PyFrameObject *frame = traceback->tb_frame;
+
+    assert( index < frame->f_code->co_nlocals );
+    assert( frame->f_localsplus[ index ] == NULL );
+
+    frame->f_localsplus[ index ] = value;
+    Py_XINCREF( value );
+}
+
 #endif
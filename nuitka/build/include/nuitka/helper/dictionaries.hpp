@@ -38,20 +38,16 @@ static inline PyDictObject *MODULE_DICT( PyObject *module )
     return MODULE_DICT( (PyModuleObject *)module );
 }
 
-#if PYTHON_VERSION < 330
-// Quick dictionary lookup for a string value.
-
-typedef PyDictEntry *Nuitka_DictEntryHandle;
-
-static PyDictEntry *GET_STRING_DICT_ENTRY( PyDictObject *dict, Nuitka_StringObject *key )
+// The hash value of a string, which is cached in the string object itself,
+// so for constants, it is computed only once.
+static inline Py_hash_t GET_STRING_HASH( Nuitka_StringObject *key )
 {
-    assert( PyDict_CheckExact( dict ) );
-    assert( Nuitka_String_CheckExact( key ) );
-
 #if PYTHON_VERSION < 300
     Py_hash_t hash = key->ob_shash;
-#else
+#elif PYTHON_VERSION < 330
     Py_hash_t hash = key->hash;
+#else
+    Py_hash_t hash = key->_base._base.hash;
 #endif
 
     // Only improvement would be to identify how to ensure that the hash is
@@ -61,13 +57,29 @@ static PyDictEntry *GET_STRING_DICT_ENTRY( PyDictObject *dict, Nuitka_StringObje
 #if PYTHON_VERSION < 300
         hash = PyString_Type.tp_hash( (PyObject *)key );
         key->ob_shash = hash;
-#else
+#elif PYTHON_VERSION < 330
         hash = PyUnicode_Type.tp_hash( (PyObject *)key );
         key->hash = hash;
+#else
+        hash = PyUnicode_Type.tp_hash( (PyObject *)key );
+        key->_base._base.hash = hash;
 #endif
     }
 
-    PyDictEntry *entry = dict->ma_lookup( dict, (PyObject *)key, hash );
+    return hash;
+}
+
+#if PYTHON_VERSION < 330
+// Quick dictionary lookup for a string value.
+
+typedef PyDictEntry *Nuitka_DictEntryHandle;
+
+static PyDictEntry *GET_STRING_DICT_ENTRY( PyDictObject *dict, Nuitka_StringObject *key )
+{
+    assert( PyDict_CheckExact( dict ) );
+    assert( Nuitka_String_CheckExact( key ) );
+
+    PyDictEntry *entry = dict->ma_lookup( dict, (PyObject *)key, GET_STRING_HASH( key ) );
 
     // The "entry" cannot be NULL, it can only be empty for a string dict
     // lookup, but at least assert it.
@@ -92,6 +104,57 @@ static PyObject *GET_STRING_DICT_VALUE( PyDictObject *dict, Nuitka_StringObject
     return GET_STRING_DICT_ENTRY( dict, key )->me_value;
 }
 
+// Lookup of a string key in any dictionary, not only one with string keys.
+// The comparison with other keys of the same hash may raise, in which case
+// NULL is returned with an exception set, otherwise NULL means not found.
+NUITKA_MAY_BE_UNUSED static PyObject *GET_STRING_DICT_VALUE_CHECKED( PyDictObject *dict, Nuitka_StringObject *key )
+{
+    assert( PyDict_CheckExact( dict ) );
+    assert( Nuitka_String_CheckExact( key ) );
+
+    PyDictEntry *entry = dict->ma_lookup( dict, (PyObject *)key, GET_STRING_HASH( key ) );
+
+    if (unlikely( entry == NULL ))
+    {
+        return NULL;
+    }
+
+    return entry->me_value;
+}
+
+// Remembered entry of a string key in a dictionary, used for module variable
+// reads, where dictionary and key are always the same. The entry stays valid
+// for as long as the dictionary uses the same table, and the entry holds the
+// key still, so the lookup can be skipped, while changes of the value are
+// still seen.
+struct Nuitka_DictLookupCache
+{
+    PyDictEntry *m_table;
+    Py_ssize_t m_mask;
+    PyDictEntry *m_entry;
+};
+
+NUITKA_MAY_BE_UNUSED static PyObject *GET_STRING_DICT_VALUE_CACHED( PyDictObject *dict, Nuitka_StringObject *key, Nuitka_DictLookupCache *cache )
+{
+    if (likely( dict->ma_table == cache->m_table && dict->ma_mask == cache->m_mask && cache->m_entry->me_key == (PyObject *)key ))
+    {
+        return cache->m_entry->me_value;
+    }
+
+    PyDictEntry *entry = GET_STRING_DICT_ENTRY( dict, key );
+
+    // Only remember entries holding this very key object, as it cannot be
+    // released, and deleted entries hold a dummy key instead.
+    if ( entry->me_key == (PyObject *)key )
+    {
+        cache->m_table = dict->ma_table;
+        cache->m_mask = dict->ma_mask;
+        cache->m_entry = entry;
+    }
+
+    return entry->me_value;
+}
+
 #else
 
 // Quick dictionary lookup for a string value.
@@ -124,19 +187,9 @@ static Nuitka_DictEntryHandle GET_STRING_DICT_ENTRY( PyDictObject *dict, Nuitka_
     assert( PyDict_CheckExact( dict ) );
     assert( Nuitka_String_CheckExact( key ) );
 
-    Py_hash_t hash = key->_base._base.hash;
-
-    // Only improvement would be to identify how to ensure that the hash is computed
-    // already. Calling hash early on could do that potentially.
-    if ( hash == -1 )
-    {
-        hash = PyUnicode_Type.tp_hash( (PyObject *)key );
-        key->_base._base.hash = hash;
-    }
-
     PyObject **value_addr;
 
-    PyDictKeyEntry *entry = dict->ma_keys->dk_lookup( dict, (PyObject *)key, hash, &value_addr );
+    PyDictKeyEntry *entry = dict->ma_keys->dk_lookup( dict, (PyObject *)key, GET_STRING_HASH( key ), &value_addr );
 
     // The "entry" cannot be NULL, it can only be empty for a string dict lookup, but at
     // least assert it.
@@ -162,6 +215,66 @@ NUITKA_MAY_BE_UNUSED static PyObject *GET_STRING_DICT_VALUE( PyDictObject *dict,
     return GET_DICT_ENTRY_VALUE( handle );
 }
 
+// Lookup of a string key in any dictionary, not only one with string keys.
+// The comparison with other keys of the same hash may raise, in which case
+// NULL is returned with an exception set, otherwise NULL means not found.
+NUITKA_MAY_BE_UNUSED static PyObject *GET_STRING_DICT_VALUE_CHECKED( PyDictObject *dict, Nuitka_StringObject *key )
+{
+    assert( PyDict_CheckExact( dict ) );
+    assert( Nuitka_String_CheckExact( key ) );
+
+    PyObject **value_addr;
+
+    PyDictKeyEntry *entry = dict->ma_keys->dk_lookup( dict, (PyObject *)key, GET_STRING_HASH( key ), &value_addr );
+
+    if (unlikely( entry == NULL ))
+    {
+        return NULL;
+    }
+
+    return *value_addr;
+}
+
+// Remembered entry of a string key in a dictionary, used for module variable
+// reads, where dictionary and key are always the same. The entry stays valid
+// for as long as the dictionary uses the same keys object, and the entry
+// holds the key still, so the lookup can be skipped, while changes of the
+// value are still seen.
+struct Nuitka_DictLookupCache
+{
+    PyDictKeysObject *m_keys;
+    Py_ssize_t m_size;
+    PyDictKeyEntry *m_entry;
+};
+
+NUITKA_MAY_BE_UNUSED static PyObject *GET_STRING_DICT_VALUE_CACHED( PyDictObject *dict, Nuitka_StringObject *key, Nuitka_DictLookupCache *cache )
+{
+    if (likely( dict->ma_keys == cache->m_keys && dict->ma_keys->dk_size == cache->m_size && dict->ma_values == NULL && cache->m_entry->me_key == (PyObject *)key ))
+    {
+        return cache->m_entry->me_value;
+    }
+
+    PyObject **value_addr;
+
+    PyDictKeyEntry *entry = dict->ma_keys->dk_lookup( dict, (PyObject *)key, GET_STRING_HASH( key ), &value_addr );
+
+    // The "entry" cannot be NULL, it can only be empty for a string dict lookup, but at
+    // least assert it.
+    assert( entry != NULL );
+
+    // Only remember entries holding this very key object, as it cannot be
+    // released, and deleted entries hold a dummy key instead. Split tables
+    // keep the values elsewhere, these are not remembered.
+    if ( entry->me_key == (PyObject *)key && dict->ma_values == NULL )
+    {
+        cache->m_keys = dict->ma_keys;
+        cache->m_size = dict->ma_keys->dk_size;
+        cache->m_entry = entry;
+    }
+
+    return *value_addr;
+}
+
 #endif
 
 NUITKA_MAY_BE_UNUSED static bool DICT_SET_ITEM( PyObject *dict, PyObject *key, PyObject *value )
@@ -25,6 +25,10 @@ extern iternextfunc default_iternext;
 extern void _initSlotIternext( void );
 #endif
 
+// Length hint of builtin list, tuple, and range iterators, which are exact and
+// cannot have side effects, for others it is 0.
+extern Py_ssize_t ITERATOR_LENGTH_HINT( PyObject *iterator );
+
 // This is like "PyIter_Check" but without bugs due to shared library pointers.
 NUITKA_MAY_BE_UNUSED static inline bool HAS_ITERNEXT( PyObject *value )
 {
@@ -255,11 +259,8 @@ NUITKA_MAY_BE_UNUSED static PyObject *UNPACK_NEXT( PyObject *iterator, int seq_s
 
     if (unlikely( result == NULL ))
     {
-#if PYTHON_VERSION < 300
-        if (unlikely( !ERROR_OCCURRED() ))
-#else
+        // Foreign iterators may still raise "StopIteration" when exhausted.
         if (unlikely( !ERROR_OCCURRED() || EXCEPTION_MATCH_BOOL_SINGLE( GET_ERROR_OCCURRED(), PyExc_StopIteration ) ))
-#endif
         {
 #if PYTHON_VERSION < 350
             if ( seq_size_so_far == 1 )
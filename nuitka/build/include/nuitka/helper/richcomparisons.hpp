@@ -33,8 +33,352 @@ static inline bool IS_SANE_TYPE( PyTypeObject *type )
 extern PyObject *MY_RICHCOMPARE( PyObject *v, PyObject *w, int op );
 extern PyObject *MY_RICHCOMPARE_NORECURSE( PyObject *v, PyObject *w, int op );
 
+// Give 1 or 0 as the result of comparing with "op", from a "c" that is like
+// the result of "strcmp".
+static inline int _RICH_COMPARE_BOOL_FROM_CMP( int c, int op )
+{
+    switch( op )
+    {
+        case Py_LT: return c <  0;
+        case Py_LE: return c <= 0;
+        case Py_EQ: return c == 0;
+        case Py_NE: return c != 0;
+        case Py_GT: return c >  0;
+        case Py_GE: return c >= 0;
+    }
+
+    assert( false );
+    return 0;
+}
+
+#if PYTHON_VERSION < 300
+static inline int _RICH_COMPARE_BOOL_INT_INT( PyObject *operand1, PyObject *operand2, int op )
+{
+    long a = PyInt_AS_LONG( operand1 );
+    long b = PyInt_AS_LONG( operand2 );
+
+    return _RICH_COMPARE_BOOL_FROM_CMP( ( a > b ) - ( a < b ), op );
+}
+#endif
+
+static inline int _RICH_COMPARE_BOOL_FLOAT_FLOAT( PyObject *operand1, PyObject *operand2, int op )
+{
+    double a = PyFloat_AS_DOUBLE( operand1 );
+    double b = PyFloat_AS_DOUBLE( operand2 );
+
+    // Not using "_RICH_COMPARE_BOOL_FROM_CMP" here, for NaN all comparisons
+    // except "!=" are false.
+    switch( op )
+    {
+        case Py_LT: return a <  b;
+        case Py_LE: return a <= b;
+        case Py_EQ: return a == b;
+        case Py_NE: return a != b;
+        case Py_GT: return a >  b;
+        case Py_GE: return a >= b;
+    }
+
+    assert( false );
+    return 0;
+}
+
+// Exact strings, for Python3 only equality is done, and only for ready
+// strings, otherwise -2 is given.
+static inline int _RICH_COMPARE_BOOL_STR_STR( PyObject *operand1, PyObject *operand2, int op )
+{
+    if ( operand1 == operand2 )
+    {
+        return _RICH_COMPARE_BOOL_FROM_CMP( 0, op );
+    }
+
+#if PYTHON_VERSION < 300
+    bool is_equality = op == Py_EQ || op == Py_NE;
+
+    // Different interned strings cannot be equal.
+    if ( is_equality && PyString_CHECK_INTERNED( operand1 ) && PyString_CHECK_INTERNED( operand2 ) )
+    {
+        return op == Py_NE;
+    }
+
+    Py_ssize_t len1 = PyString_GET_SIZE( operand1 );
+    Py_ssize_t len2 = PyString_GET_SIZE( operand2 );
+
+    if ( is_equality && len1 != len2 )
+    {
+        return op == Py_NE;
+    }
+
+    char const *data1 = PyString_AS_STRING( operand1 );
+    char const *data2 = PyString_AS_STRING( operand2 );
+
+    // Same as CPython does it, the first character is checked without a call.
+    int c = Py_CHARMASK( *data1 ) - Py_CHARMASK( *data2 );
+
+    if ( c == 0 )
+    {
+        c = memcmp( data1, data2, len1 < len2 ? len1 : len2 );
+    }
+
+    if ( c == 0 )
+    {
+        c = ( len1 > len2 ) - ( len1 < len2 );
+    }
+
+    return _RICH_COMPARE_BOOL_FROM_CMP( c, op );
+#elif PYTHON_VERSION >= 330
+    if ( op != Py_EQ && op != Py_NE )
+    {
+        return -2;
+    }
+
+    if ( !PyUnicode_IS_READY( operand1 ) || !PyUnicode_IS_READY( operand2 ) )
+    {
+        return -2;
+    }
+
+    // Different interned strings cannot be equal, neither can strings of
+    // different length or kind.
+    if ( ( PyUnicode_CHECK_INTERNED( operand1 ) && PyUnicode_CHECK_INTERNED( operand2 ) ) ||
+         PyUnicode_GET_LENGTH( operand1 ) != PyUnicode_GET_LENGTH( operand2 ) ||
+         PyUnicode_KIND( operand1 ) != PyUnicode_KIND( operand2 ) )
+    {
+        return op == Py_NE;
+    }
+
+    int c = memcmp(
+        PyUnicode_DATA( operand1 ),
+        PyUnicode_DATA( operand2 ),
+        PyUnicode_GET_LENGTH( operand1 ) * PyUnicode_KIND( operand1 )
+    );
+
+    return _RICH_COMPARE_BOOL_FROM_CMP( c, op );
+#else
+    return -2;
+#endif
+}
+
+// Exact tuples, only equality is done, otherwise -2 is given.
+static inline int _RICH_COMPARE_BOOL_TUPLE_TUPLE( PyObject *operand1, PyObject *operand2, int op )
+{
+    if ( op != Py_EQ && op != Py_NE )
+    {
+        return -2;
+    }
+
+    Py_ssize_t size1 = PyTuple_GET_SIZE( operand1 );
+    Py_ssize_t size2 = PyTuple_GET_SIZE( operand2 );
+
+    // Items are compared up to the shorter size even if the sizes differ,
+    // as CPython does it, their comparison may raise or have side effects.
+    Py_ssize_t size = size1 < size2 ? size1 : size2;
+
+    for ( Py_ssize_t i = 0; i < size; i++ )
+    {
+        PyObject *item1 = PyTuple_GET_ITEM( operand1, i );
+        PyObject *item2 = PyTuple_GET_ITEM( operand2, i );
+
+        // Identical items are considered equal, as CPython does it.
+        if ( item1 == item2 )
+        {
+            continue;
+        }
+
+        PyObject *rich_result = MY_RICHCOMPARE( item1, item2, Py_EQ );
+
+        if (unlikely( rich_result == NULL ))
+        {
+            return -1;
+        }
+
+        int res = CHECK_IF_TRUE( rich_result );
+        Py_DECREF( rich_result );
+
+        if (unlikely( res == -1 ))
+        {
+            return -1;
+        }
+
+        if ( res == 0 )
+        {
+            return op == Py_NE;
+        }
+    }
+
+    return ( size1 == size2 ) == ( op == Py_EQ );
+}
+
+// Compare objects of the same exact type "int", "float", "str", or "tuple"
+// without the generic protocol. Gives 1 or 0, -1 for errors, and -2 if not
+// handled, for other types, or comparisons not done for that type.
+static inline int RICH_COMPARE_BOOL_EXACT( PyObject *operand1, PyObject *operand2, int op )
+{
+    CHECK_OBJECT( operand1 );
+    CHECK_OBJECT( operand2 );
+
+    PyTypeObject *type = Py_TYPE( operand1 );
+
+    if ( type != Py_TYPE( operand2 ) )
+    {
+        return -2;
+    }
+
+#if PYTHON_VERSION < 300
+    if ( type == &PyInt_Type )
+    {
+        return _RICH_COMPARE_BOOL_INT_INT( operand1, operand2, op );
+    }
+    else if ( type == &PyString_Type )
+#else
+    if ( type == &PyUnicode_Type )
+#endif
+    {
+        return _RICH_COMPARE_BOOL_STR_STR( operand1, operand2, op );
+    }
+    else if ( type == &PyFloat_Type )
+    {
+        return _RICH_COMPARE_BOOL_FLOAT_FLOAT( operand1, operand2, op );
+    }
+    else if ( type == &PyTuple_Type )
+    {
+        return _RICH_COMPARE_BOOL_TUPLE_TUPLE( operand1, operand2, op );
+    }
+
+    return -2;
+}
+
+// Like "RICH_COMPARE_BOOL_EXACT" but giving a new reference to the result,
+// or "Py_NotImplemented" without a reference, if not handled.
+static inline PyObject *RICH_COMPARE_EXACT( PyObject *operand1, PyObject *operand2, int op )
+{
+    int result = RICH_COMPARE_BOOL_EXACT( operand1, operand2, op );
+
+    if ( result == -2 )
+    {
+        return Py_NotImplemented;
+    }
+    else if ( result == -1 )
+    {
+        return NULL;
+    }
+    else
+    {
+        return INCREASE_REFCOUNT( BOOL_FROM( result == 1 ) );
+    }
+}
+
+// Convert the result of a rich comparison to 1 or 0, or -1 for errors, and
+// release it.
+static inline int _RICH_COMPARE_BOOL_FROM_RESULT( PyObject *rich_result )
+{
+    if (unlikely( rich_result == NULL ))
+    {
+        return -1;
+    }
+
+    int result;
+
+    if ( rich_result == Py_True )
+    {
+        result = 1;
+    }
+    else if ( rich_result == Py_False || rich_result == Py_None )
+    {
+        result = 0;
+    }
+    else
+    {
+        result = CHECK_IF_TRUE( rich_result );
+    }
+
+    Py_DECREF( rich_result );
+
+    return result;
+}
+
+// Comparisons where one operand is known to be of the type at compile time,
+// typically a constant, so only that type is checked before the generic
+// comparison.
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *RICH_COMPARE_INT( PyObject *operand1, PyObject *operand2, int op )
+{
+    if ( PyInt_CheckExact( operand1 ) && PyInt_CheckExact( operand2 ) )
+    {
+        return INCREASE_REFCOUNT( BOOL_FROM( _RICH_COMPARE_BOOL_INT_INT( operand1, operand2, op ) == 1 ) );
+    }
+
+    return MY_RICHCOMPARE( operand1, operand2, op );
+}
+
+NUITKA_MAY_BE_UNUSED static int RICH_COMPARE_BOOL_INT( PyObject *operand1, PyObject *operand2, int op )
+{
+    if ( PyInt_CheckExact( operand1 ) && PyInt_CheckExact( operand2 ) )
+    {
+        return _RICH_COMPARE_BOOL_INT_INT( operand1, operand2, op );
+    }
+
+    return _RICH_COMPARE_BOOL_FROM_RESULT( MY_RICHCOMPARE( operand1, operand2, op ) );
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *RICH_COMPARE_FLOAT( PyObject *operand1, PyObject *operand2, int op )
+{
+    if ( PyFloat_CheckExact( operand1 ) && PyFloat_CheckExact( operand2 ) )
+    {
+        return INCREASE_REFCOUNT( BOOL_FROM( _RICH_COMPARE_BOOL_FLOAT_FLOAT( operand1, operand2, op ) == 1 ) );
+    }
+
+    return MY_RICHCOMPARE( operand1, operand2, op );
+}
+
+NUITKA_MAY_BE_UNUSED static int RICH_COMPARE_BOOL_FLOAT( PyObject *operand1, PyObject *operand2, int op )
+{
+    if ( PyFloat_CheckExact( operand1 ) && PyFloat_CheckExact( operand2 ) )
+    {
+        return _RICH_COMPARE_BOOL_FLOAT_FLOAT( operand1, operand2, op );
+    }
+
+    return _RICH_COMPARE_BOOL_FROM_RESULT( MY_RICHCOMPARE( operand1, operand2, op ) );
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *RICH_COMPARE_STR( PyObject *operand1, PyObject *operand2, int op )
+{
+    if ( Nuitka_String_CheckExact( operand1 ) && Nuitka_String_CheckExact( operand2 ) )
+    {
+        int result = _RICH_COMPARE_BOOL_STR_STR( operand1, operand2, op );
+
+        if ( result >= 0 )
+        {
+            return INCREASE_REFCOUNT( BOOL_FROM( result == 1 ) );
+        }
+    }
+
+    return MY_RICHCOMPARE( operand1, operand2, op );
+}
+
+NUITKA_MAY_BE_UNUSED static int RICH_COMPARE_BOOL_STR( PyObject *operand1, PyObject *operand2, int op )
+{
+    if ( Nuitka_String_CheckExact( operand1 ) && Nuitka_String_CheckExact( operand2 ) )
+    {
+        int result = _RICH_COMPARE_BOOL_STR_STR( operand1, operand2, op );
+
+        if ( result >= 0 )
+        {
+            return result;
+        }
+    }
+
+    return _RICH_COMPARE_BOOL_FROM_RESULT( MY_RICHCOMPARE( operand1, operand2, op ) );
+}
+
 NUITKA_MAY_BE_UNUSED static PyObject *RICH_COMPARE_LT( PyObject *operand1, PyObject *operand2 )
 {
+    PyObject *exact_result = RICH_COMPARE_EXACT( operand1, operand2, Py_LT );
+
+    if ( exact_result != Py_NotImplemented )
+    {
+        return exact_result;
+    }
+
     PyObject *result = MY_RICHCOMPARE( operand1, operand2, Py_LT );
 
     if (unlikely( result == NULL ))
@@ -53,6 +397,13 @@ NUITKA_MAY_BE_UNUSED static PyObject *RICH_COMPARE_LE( PyObject *operand1, PyObj
         return INCREASE_REFCOUNT( Py_True );
     }
 
+    PyObject *exact_result = RICH_COMPARE_EXACT( operand1, operand2, Py_LE );
+
+    if ( exact_result != Py_NotImplemented )
+    {
+        return exact_result;
+    }
+
     PyObject *result = MY_RICHCOMPARE( operand1, operand2, Py_LE );
 
     if (unlikely( result == NULL ))
@@ -71,6 +422,13 @@ NUITKA_MAY_BE_UNUSED static PyObject *RICH_COMPARE_EQ( PyObject *operand1, PyObj
         return INCREASE_REFCOUNT( Py_True );
     }
 
+    PyObject *exact_result = RICH_COMPARE_EXACT( operand1, operand2, Py_EQ );
+
+    if ( exact_result != Py_NotImplemented )
+    {
+        return exact_result;
+    }
+
     return MY_RICHCOMPARE( operand1, operand2, Py_EQ );
 }
 
@@ -82,6 +440,13 @@ NUITKA_MAY_BE_UNUSED static PyObject *RICH_COMPARE_EQ_NORECURSE( PyObject *opera
         return INCREASE_REFCOUNT( Py_True );
     }
 
+    PyObject *exact_result = RICH_COMPARE_EXACT( operand1, operand2, Py_EQ );
+
+    if ( exact_result != Py_NotImplemented )
+    {
+        return exact_result;
+    }
+
     return MY_RICHCOMPARE_NORECURSE( operand1, operand2, Py_EQ );
 }
 
@@ -95,11 +460,25 @@ NUITKA_MAY_BE_UNUSED static PyObject *RICH_COMPARE_NE( PyObject *operand1, PyObj
         return INCREASE_REFCOUNT( Py_False );
     }
 
+    PyObject *exact_result = RICH_COMPARE_EXACT( operand1, operand2, Py_NE );
+
+    if ( exact_result != Py_NotImplemented )
+    {
+        return exact_result;
+    }
+
     return MY_RICHCOMPARE( operand1, operand2, Py_NE );
 }
 
 NUITKA_MAY_BE_UNUSED static PyObject *RICH_COMPARE_GT( PyObject *operand1, PyObject *operand2 )
 {
+    PyObject *exact_result = RICH_COMPARE_EXACT( operand1, operand2, Py_GT );
+
+    if ( exact_result != Py_NotImplemented )
+    {
+        return exact_result;
+    }
+
     return MY_RICHCOMPARE( operand1, operand2, Py_GT );
 }
 
@@ -111,11 +490,25 @@ NUITKA_MAY_BE_UNUSED static PyObject *RICH_COMPARE_GE( PyObject *operand1, PyObj
         return INCREASE_REFCOUNT( Py_True );
     }
 
+    PyObject *exact_result = RICH_COMPARE_EXACT( operand1, operand2, Py_GE );
+
+    if ( exact_result != Py_NotImplemented )
+    {
+        return exact_result;
+    }
+
     return MY_RICHCOMPARE( operand1, operand2, Py_GE );
 }
 
 NUITKA_MAY_BE_UNUSED static int RICH_COMPARE_BOOL_LT( PyObject *operand1, PyObject *operand2 )
 {
+    int exact_result = RICH_COMPARE_BOOL_EXACT( operand1, operand2, Py_LT );
+
+    if ( exact_result != -2 )
+    {
+        return exact_result;
+    }
+
     PyObject *rich_result = MY_RICHCOMPARE( operand1, operand2, Py_LT );
 
     if (unlikely( rich_result == NULL ))
@@ -153,6 +546,13 @@ NUITKA_MAY_BE_UNUSED static int RICH_COMPARE_BOOL_LE( PyObject *operand1, PyObje
         return 1;
     }
 
+    int exact_result = RICH_COMPARE_BOOL_EXACT( operand1, operand2, Py_LE );
+
+    if ( exact_result != -2 )
+    {
+        return exact_result;
+    }
+
     PyObject *rich_result = MY_RICHCOMPARE( operand1, operand2, Py_LE );
 
     if (unlikely( rich_result == NULL ))
@@ -190,6 +590,13 @@ NUITKA_MAY_BE_UNUSED static int RICH_COMPARE_BOOL_EQ( PyObject *operand1, PyObje
         return 1;
     }
 
+    int exact_result = RICH_COMPARE_BOOL_EXACT( operand1, operand2, Py_EQ );
+
+    if ( exact_result != -2 )
+    {
+        return exact_result;
+    }
+
     PyObject *rich_result = MY_RICHCOMPARE( operand1, operand2, Py_EQ );
 
     if (unlikely( rich_result == NULL ))
@@ -227,6 +634,13 @@ NUITKA_MAY_BE_UNUSED static int RICH_COMPARE_BOOL_EQ_NORECURSE( PyObject *operan
         return 1;
     }
 
+    int exact_result = RICH_COMPARE_BOOL_EXACT( operand1, operand2, Py_EQ );
+
+    if ( exact_result != -2 )
+    {
+        return exact_result;
+    }
+
     PyObject *rich_result = MY_RICHCOMPARE_NORECURSE( operand1, operand2, Py_EQ );
 
     if (unlikely( rich_result == NULL ))
@@ -265,6 +679,13 @@ NUITKA_MAY_BE_UNUSED static int RICH_COMPARE_BOOL_NE( PyObject *operand1, PyObje
         return 0;
     }
 
+    int exact_result = RICH_COMPARE_BOOL_EXACT( operand1, operand2, Py_NE );
+
+    if ( exact_result != -2 )
+    {
+        return exact_result;
+    }
+
     PyObject *rich_result = MY_RICHCOMPARE( operand1, operand2, Py_NE );
 
     if (unlikely( rich_result == NULL ))
@@ -296,6 +717,13 @@ NUITKA_MAY_BE_UNUSED static int RICH_COMPARE_BOOL_NE( PyObject *operand1, PyObje
 
 NUITKA_MAY_BE_UNUSED static int RICH_COMPARE_BOOL_GT( PyObject *operand1, PyObject *operand2 )
 {
+    int exact_result = RICH_COMPARE_BOOL_EXACT( operand1, operand2, Py_GT );
+
+    if ( exact_result != -2 )
+    {
+        return exact_result;
+    }
+
     PyObject *rich_result = MY_RICHCOMPARE( operand1, operand2, Py_GT );
 
     if (unlikely( rich_result == NULL ))
@@ -333,6 +761,13 @@ NUITKA_MAY_BE_UNUSED static int RICH_COMPARE_BOOL_GE( PyObject *operand1, PyObje
         return 1;
     }
 
+    int exact_result = RICH_COMPARE_BOOL_EXACT( operand1, operand2, Py_GE );
+
+    if ( exact_result != -2 )
+    {
+        return exact_result;
+    }
+
     PyObject *rich_result = MY_RICHCOMPARE( operand1, operand2, Py_GE );
 
     if (unlikely( rich_result == NULL ))
@@ -66,6 +66,57 @@ NUITKA_MAY_BE_UNUSED static bool SEQUENCE_CONTAINS_NOT_BOOL( PyObject *element,
     return result == 0;
 }
 
+// Containment check with a constant string element, e.g. "'key' in d". For
+// exact dictionaries, the hash value cached in the constant is used. Returns
+// -1 for error, 0 for false, and 1 for true.
+NUITKA_MAY_BE_UNUSED static int SEQUENCE_CONTAINS_BOOL_STR( PyObject *element, PyObject *sequence )
+{
+    CHECK_OBJECT( element );
+    CHECK_OBJECT( sequence );
+    assert( Nuitka_String_CheckExact( element ) );
+
+    if ( PyDict_CheckExact( sequence ) )
+    {
+        PyObject *value = GET_STRING_DICT_VALUE_CHECKED(
+            (PyDictObject *)sequence,
+            (Nuitka_StringObject *)element
+        );
+
+        if ( value == NULL )
+        {
+            return unlikely( ERROR_OCCURRED() ) ? -1 : 0;
+        }
+
+        return 1;
+    }
+
+    return PySequence_Contains( sequence, element );
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *SEQUENCE_CONTAINS_STR( PyObject *element, PyObject *sequence )
+{
+    int result = SEQUENCE_CONTAINS_BOOL_STR( element, sequence );
+
+    if (unlikely( result == -1 ))
+    {
+        return NULL;
+    }
+
+    return BOOL_FROM( result == 1 );
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *SEQUENCE_CONTAINS_NOT_STR( PyObject *element, PyObject *sequence )
+{
+    int result = SEQUENCE_CONTAINS_BOOL_STR( element, sequence );
+
+    if (unlikely( result == -1 ))
+    {
+        return NULL;
+    }
+
+    return BOOL_FROM( result == 0 );
+}
+
 NUITKA_MAY_BE_UNUSED static bool SEQUENCE_SETITEM( PyObject *sequence, Py_ssize_t index, PyObject *value )
 {
     CHECK_OBJECT( sequence );
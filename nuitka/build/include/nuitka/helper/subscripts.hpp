@@ -386,4 +386,66 @@ NUITKA_MAY_BE_UNUSED static bool DEL_SUBSCRIPT( PyObject *target, PyObject *subs
     return true;
 }
 
+
+// Subscripts with a constant string, e.g. "d['key']". For exact dictionaries,
+// the hash value cached in the constant is used, avoiding the type dispatch.
+NUITKA_MAY_BE_UNUSED static PyObject *LOOKUP_SUBSCRIPT_STRING( PyObject *source, PyObject *const_subscript )
+{
+    CHECK_OBJECT( source );
+    CHECK_OBJECT( const_subscript );
+    assert( Nuitka_String_CheckExact( const_subscript ) );
+
+    if ( PyDict_CheckExact( source ) )
+    {
+        PyObject *result = GET_STRING_DICT_VALUE_CHECKED(
+            (PyDictObject *)source,
+            (Nuitka_StringObject *)const_subscript
+        );
+
+        if (unlikely( result == NULL ))
+        {
+            if ( !ERROR_OCCURRED() )
+            {
+                PyErr_SetObject( PyExc_KeyError, const_subscript );
+            }
+
+            return NULL;
+        }
+
+        return INCREASE_REFCOUNT( result );
+    }
+
+    return LOOKUP_SUBSCRIPT( source, const_subscript );
+}
+
+NUITKA_MAY_BE_UNUSED static bool SET_SUBSCRIPT_STRING( PyObject *target, PyObject *const_subscript, PyObject *value )
+{
+    CHECK_OBJECT( target );
+    CHECK_OBJECT( const_subscript );
+    CHECK_OBJECT( value );
+    assert( Nuitka_String_CheckExact( const_subscript ) );
+
+    // The dictionary code uses the cached hash of exact strings already.
+    if ( PyDict_CheckExact( target ) )
+    {
+        return DICT_SET_ITEM( target, const_subscript, value );
+    }
+
+    return SET_SUBSCRIPT( target, const_subscript, value );
+}
+
+NUITKA_MAY_BE_UNUSED static bool DEL_SUBSCRIPT_STRING( PyObject *target, PyObject *const_subscript )
+{
+    CHECK_OBJECT( target );
+    CHECK_OBJECT( const_subscript );
+    assert( Nuitka_String_CheckExact( const_subscript ) );
+
+    if ( PyDict_CheckExact( target ) )
+    {
+        return DICT_REMOVE_ITEM( target, const_subscript );
+    }
+
+    return DEL_SUBSCRIPT( target, const_subscript );
+}
+
 #endif
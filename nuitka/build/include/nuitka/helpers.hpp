@@ -520,12 +520,51 @@ NUITKA_MAY_BE_UNUSED static PyObject *LIST_COPY( PyObject *list )
     return result;
 }
 
+// Empty list with room for "size" items, for use with "LIST_APPEND" only, as
+// "PyList_Append" would shrink the allocation again.
+NUITKA_MAY_BE_UNUSED static PyObject *MAKE_LIST_RESERVED( Py_ssize_t size )
+{
+    PyObject *result = PyList_New( size );
+
+    if (unlikely( result == NULL ))
+    {
+        return NULL;
+    }
+
+    Py_SIZE( result ) = 0;
+
+    return result;
+}
+
+// Like "PyList_Append", but uses room that is available without asking to
+// resize the list.
+NUITKA_MAY_BE_UNUSED static bool LIST_APPEND( PyObject *list, PyObject *item )
+{
+    CHECK_OBJECT( list );
+    assert( PyList_Check( list ) );
+    CHECK_OBJECT( item );
+
+    PyListObject *list_object = (PyListObject *)list;
+    Py_ssize_t size = Py_SIZE( list_object );
+
+    if ( size < list_object->allocated )
+    {
+        list_object->ob_item[ size ] = INCREASE_REFCOUNT( item );
+        Py_SIZE( list_object ) = size + 1;
+
+        return true;
+    }
+
+    return PyList_Append( list, item ) == 0;
+}
+
 
-// Compile source code given, pretending the file name was given.
+// Compile source code given, pretending the file name was given. With
+// "cached", the code object may be shared with earlier calls.
 #if PYTHON_VERSION < 300
-extern PyObject *COMPILE_CODE( PyObject *source_code, PyObject *file_name, PyObject *mode, PyObject *flags, PyObject *dont_inherit );
+extern PyObject *COMPILE_CODE( PyObject *source_code, PyObject *file_name, PyObject *mode, PyObject *flags, PyObject *dont_inherit, bool cached );
 #else
-extern PyObject *COMPILE_CODE( PyObject *source_code, PyObject *file_name, PyObject *mode, PyObject *flags, PyObject *dont_inherit, PyObject *optimize );
+extern PyObject *COMPILE_CODE( PyObject *source_code, PyObject *file_name, PyObject *mode, PyObject *flags, PyObject *dont_inherit, PyObject *optimize, bool cached );
 #endif
 
 
@@ -0,0 +1,66 @@
+//     Copyright 2016, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+#ifndef __NUITKA_IMMORTAL_CONSTANTS_H__
+#define __NUITKA_IMMORTAL_CONSTANTS_H__
+
+// Immortal constants, for programs that fork workers after loading. The
+// constants get a reference count that cannot drop to zero, and the compiled
+// code does not change the reference count of such objects at all, so their
+// memory pages are not written to, and stay shared with the parent process.
+
+#if _NUITKA_IMMORTAL_CONSTANTS
+
+// The reference count given to immortal objects, and from where on a count
+// means the object is immortal. The difference leaves room for changes done
+// by CPython itself, which does not know about it.
+#define NUITKA_IMMORTAL_REFCNT ( PY_SSIZE_T_MAX / 2 )
+#define NUITKA_IMMORTAL_LIMIT ( PY_SSIZE_T_MAX / 4 )
+
+#define Nuitka_IsImmortal( op ) ( Py_REFCNT( op ) >= NUITKA_IMMORTAL_LIMIT )
+
+// Debug builds of CPython count all references, so these must not be skipped
+// there.
+#ifndef Py_REF_DEBUG
+
+#undef Py_INCREF
+#define Py_INCREF( op )                                                     \
+    do {                                                                    \
+        PyObject *_nuitka_incref_object = (PyObject *)( op );               \
+        if ( likely( !Nuitka_IsImmortal( _nuitka_incref_object ) ) )        \
+            _nuitka_incref_object->ob_refcnt++;                             \
+    } while (0)
+
+#undef Py_DECREF
+#define Py_DECREF( op )                                                     \
+    do {                                                                    \
+        PyObject *_nuitka_decref_object = (PyObject *)( op );               \
+        if ( likely( !Nuitka_IsImmortal( _nuitka_decref_object ) ) &&       \
+             --_nuitka_decref_object->ob_refcnt == 0 )                      \
+            _Py_Dealloc( _nuitka_decref_object );                           \
+    } while (0)
+
+#endif
+
+// Make a constant immortal, taking the reference given. Where possible, it is
+// moved to the constant arena, which holds only immortal constants, and then
+// interned if asked to. Returns the constant to use instead.
+extern PyObject *MAKE_CONSTANT_IMMORTAL( PyObject *value, bool intern );
+
+#endif
+
+#endif
@@ -20,6 +20,10 @@
 
 extern PyObject *IMPORT_MODULE( PyObject *module_name, PyObject *globals, PyObject *locals, PyObject *import_items, PyObject *level );
 
+// Absolute import without using "__import__", returns NULL without an error
+// set, if that cannot be done, and "IMPORT_MODULE" must be used instead.
+extern PyObject *IMPORT_MODULE_FAST( PyObject *module_name, PyObject *top_level_name, PyObject *import_items, char const *embedded_name );
+
 extern bool IMPORT_MODULE_STAR( PyObject *target, bool is_module, PyObject *module );
 
 extern PyObject *IMPORT_EMBEDDED_MODULE( PyObject *module_name, char const *name );
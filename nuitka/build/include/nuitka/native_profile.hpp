@@ -0,0 +1,68 @@
+//     Copyright 2016, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+#ifndef __NUITKA_NATIVE_PROFILE_H__
+#define __NUITKA_NATIVE_PROFILE_H__
+
+// Native profiling of compiled code. The generated code has a static entry
+// for every compiled function, in which calls and time spent get recorded,
+// for function calls and for generator resumptions. At program exit, these
+// are written to a profile file.
+
+#if _NUITKA_NATIVE_PROFILE
+
+struct Nuitka_ProfileEntry
+{
+    // Static information, given by the generated code.
+    char const *m_name;
+    char const *m_filename;
+    int m_line;
+
+    // Collected information, times are in ticks of "getProfileTicks".
+    unsigned long long m_calls;
+    unsigned long long m_self_ticks;
+    unsigned long long m_total_ticks;
+
+    // Calls currently active, for recursion not to be counted twice.
+    int m_active;
+
+    // Used entries are chained, for writing them out at exit.
+    bool m_registered;
+    struct Nuitka_ProfileEntry *m_next;
+};
+
+extern void Nuitka_Profile_Enter( struct Nuitka_ProfileEntry *entry );
+extern void Nuitka_Profile_Leave( void );
+
+// For compiled functions, a scope that is left with every return.
+class Nuitka_ProfileScope
+{
+public:
+    Nuitka_ProfileScope( struct Nuitka_ProfileEntry *entry )
+    {
+        Nuitka_Profile_Enter( entry );
+    }
+
+    ~Nuitka_ProfileScope()
+    {
+        Nuitka_Profile_Leave();
+    }
+};
+
+#endif
+
+#endif
@@ -207,8 +207,12 @@ typedef long Py_hash_t;
 #define Nuitka_GC_UnTrack _PyObject_GC_UNTRACK
 #endif
 
+#include "nuitka/immortal_constants.hpp"
+
 #include "nuitka/helpers.hpp"
 
+#include "nuitka/native_profile.hpp"
+
 #include "nuitka/compiled_function.hpp"
 
 /* Sentinel PyObject to be used for all our call iterator endings. */
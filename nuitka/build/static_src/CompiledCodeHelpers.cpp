@@ -30,10 +30,224 @@ extern PyObject *const_str_plain_compile;
 
 static PythonBuiltin _python_builtin_compile( &const_str_plain_compile );
 
+// Code objects of sources compiled before, e.g. for "eval" of the same
+// expressions in a loop, for use where the code object is not visible. Only
+// sources that are strings, with plain values for the other arguments, are
+// cached. The least recently used entry is replaced once the cache is full.
+#define COMPILE_CODE_CACHE_SIZE 256
+
+struct Nuitka_CompileCodeCacheEntry {
+    PyObject *key;
+    PyObject *code;
+    unsigned long last_used;
+};
+
+static Nuitka_CompileCodeCacheEntry compile_code_cache[ COMPILE_CODE_CACHE_SIZE ];
+static int compile_code_cache_used = 0;
+static unsigned long compile_code_cache_clock = 0;
+
+// Maps the cache keys to their index in "compile_code_cache".
+static PyObject *compile_code_cache_index = NULL;
+
+static bool _getCompileIntArg( PyObject *value, long *result )
+{
+    if ( value == NULL )
+    {
+        *result = 0;
+        return true;
+    }
+
 #if PYTHON_VERSION < 300
-PyObject *COMPILE_CODE( PyObject *source_code, PyObject *file_name, PyObject *mode, PyObject *flags, PyObject *dont_inherit )
+    if ( PyInt_Check( value ) )
+    {
+        *result = PyInt_AS_LONG( value );
+        return true;
+    }
 #else
-PyObject *COMPILE_CODE( PyObject *source_code, PyObject *file_name, PyObject *mode, PyObject *flags, PyObject *dont_inherit, PyObject *optimize )
+    if ( PyLong_Check( value ) )
+    {
+        *result = PyLong_AsLong( value );
+
+        if ( *result == -1 && ERROR_OCCURRED() )
+        {
+            CLEAR_ERROR_OCCURRED();
+            return false;
+        }
+
+        return true;
+    }
+#endif
+
+    return false;
+}
+
+#if PYTHON_VERSION < 300
+static PyObject *MAKE_COMPILE_CODE_CACHE_KEY( PyObject *source_code, PyObject *file_name, PyObject *mode, PyObject *flags, PyObject *dont_inherit )
+#else
+static PyObject *MAKE_COMPILE_CODE_CACHE_KEY( PyObject *source_code, PyObject *file_name, PyObject *mode, PyObject *flags, PyObject *dont_inherit, PyObject *optimize )
+#endif
+{
+    // Equal "str" and "unicode" values also compare equal, so the kind of
+    // source is part of the key.
+    int source_kind;
+
+#if PYTHON_VERSION < 300
+    if ( PyString_CheckExact( source_code ) )
+    {
+        source_kind = 0;
+    }
+#else
+    if ( PyBytes_CheckExact( source_code ) )
+    {
+        source_kind = 0;
+    }
+#endif
+    else if ( PyUnicode_CheckExact( source_code ) )
+    {
+        source_kind = 1;
+    }
+    else
+    {
+        return NULL;
+    }
+
+#if PYTHON_VERSION < 300
+    if ( !PyString_CheckExact( file_name ) || !PyString_CheckExact( mode ) )
+#else
+    if ( !PyUnicode_CheckExact( file_name ) || !PyUnicode_CheckExact( mode ) )
+#endif
+    {
+        return NULL;
+    }
+
+    long flags_value, dont_inherit_value;
+
+    if ( !_getCompileIntArg( flags, &flags_value ) || !_getCompileIntArg( dont_inherit, &dont_inherit_value ) )
+    {
+        return NULL;
+    }
+
+    // Results other than code objects, i.e. AST objects, are mutable.
+    if ( flags_value & PyCF_ONLY_AST )
+    {
+        return NULL;
+    }
+
+    // The future flags of the calling code are inherited, unless told not to.
+    if ( dont_inherit_value == 0 )
+    {
+        PyFrameObject *frame = PyEval_GetFrame();
+
+        if ( frame != NULL )
+        {
+            flags_value |= frame->f_code->co_flags & PyCF_MASK;
+        }
+    }
+
+#if PYTHON_VERSION < 300
+    PyObject *result = Py_BuildValue( "(OOOil)", source_code, file_name, mode, source_kind, flags_value );
+#else
+    long optimize_value;
+
+    if ( optimize == NULL )
+    {
+        optimize_value = -1;
+    }
+    else if ( !_getCompileIntArg( optimize, &optimize_value ) )
+    {
+        return NULL;
+    }
+
+    PyObject *result = Py_BuildValue( "(OOOill)", source_code, file_name, mode, source_kind, flags_value, optimize_value );
+#endif
+
+    // Without a key, the uncached path is taken, which must not see an
+    // error set.
+    if (unlikely( result == NULL ))
+    {
+        CLEAR_ERROR_OCCURRED();
+    }
+
+    return result;
+}
+
+static PyObject *GET_COMPILE_CODE_CACHED( PyObject *cache_key )
+{
+    if ( compile_code_cache_index == NULL )
+    {
+        return NULL;
+    }
+
+    PyObject *index = PyDict_GetItem( compile_code_cache_index, cache_key );
+
+    if ( index == NULL )
+    {
+        return NULL;
+    }
+
+#if PYTHON_VERSION < 300
+    Nuitka_CompileCodeCacheEntry *entry = &compile_code_cache[ PyInt_AS_LONG( index ) ];
+#else
+    Nuitka_CompileCodeCacheEntry *entry = &compile_code_cache[ PyLong_AsLong( index ) ];
+#endif
+    entry->last_used = ++compile_code_cache_clock;
+
+    return INCREASE_REFCOUNT( entry->code );
+}
+
+static void SET_COMPILE_CODE_CACHED( PyObject *cache_key, PyObject *code )
+{
+    if ( compile_code_cache_index == NULL )
+    {
+        compile_code_cache_index = PyDict_New();
+    }
+
+    int slot;
+
+    if ( compile_code_cache_used < COMPILE_CODE_CACHE_SIZE )
+    {
+        slot = compile_code_cache_used++;
+    }
+    else
+    {
+        slot = 0;
+
+        for ( int i = 1; i < COMPILE_CODE_CACHE_SIZE; i++ )
+        {
+            if ( compile_code_cache[ i ].last_used < compile_code_cache[ slot ].last_used )
+            {
+                slot = i;
+            }
+        }
+
+        if (unlikely( PyDict_DelItem( compile_code_cache_index, compile_code_cache[ slot ].key ) != 0 ))
+        {
+            CLEAR_ERROR_OCCURRED();
+        }
+
+        Py_DECREF( compile_code_cache[ slot ].key );
+        Py_DECREF( compile_code_cache[ slot ].code );
+    }
+
+    compile_code_cache[ slot ].key = INCREASE_REFCOUNT( cache_key );
+    compile_code_cache[ slot ].code = INCREASE_REFCOUNT( code );
+    compile_code_cache[ slot ].last_used = ++compile_code_cache_clock;
+
+    // Without the index entry, it is only not found.
+    PyObject *index = PyInt_FromLong( slot );
+
+    if (unlikely( index == NULL || PyDict_SetItem( compile_code_cache_index, cache_key, index ) != 0 ))
+    {
+        CLEAR_ERROR_OCCURRED();
+    }
+
+    Py_XDECREF( index );
+}
+
+#if PYTHON_VERSION < 300
+PyObject *COMPILE_CODE( PyObject *source_code, PyObject *file_name, PyObject *mode, PyObject *flags, PyObject *dont_inherit, bool cached )
+#else
+PyObject *COMPILE_CODE( PyObject *source_code, PyObject *file_name, PyObject *mode, PyObject *flags, PyObject *dont_inherit, PyObject *optimize, bool cached )
 #endif
 {
     // May be a source, but also could already be a compiled object, in which
@@ -43,6 +257,28 @@ PyObject *COMPILE_CODE( PyObject *source_code, PyObject *file_name, PyObject *mo
         return INCREASE_REFCOUNT( source_code );
     }
 
+    PyObject *cache_key = NULL;
+
+    if ( cached )
+    {
+#if PYTHON_VERSION < 300
+        cache_key = MAKE_COMPILE_CODE_CACHE_KEY( source_code, file_name, mode, flags, dont_inherit );
+#else
+        cache_key = MAKE_COMPILE_CODE_CACHE_KEY( source_code, file_name, mode, flags, dont_inherit, optimize );
+#endif
+    }
+
+    if ( cache_key != NULL )
+    {
+        PyObject *result = GET_COMPILE_CODE_CACHED( cache_key );
+
+        if ( result != NULL )
+        {
+            Py_DECREF( cache_key );
+            return result;
+        }
+    }
+
     PyObject *pos_args = PyTuple_New(3);
     PyTuple_SET_ITEM( pos_args, 0, INCREASE_REFCOUNT( source_code ) );
     PyTuple_SET_ITEM( pos_args, 1, INCREASE_REFCOUNT( file_name ) );
@@ -79,6 +315,16 @@ PyObject *COMPILE_CODE( PyObject *source_code, PyObject *file_name, PyObject *mo
     Py_DECREF( pos_args );
     Py_XDECREF( kw_args );
 
+    if ( cache_key != NULL )
+    {
+        if ( result != NULL && PyCode_Check( result ) )
+        {
+            SET_COMPILE_CODE_CACHED( cache_key, result );
+        }
+
+        Py_DECREF( cache_key );
+    }
+
     return result;
 }
 
@@ -494,11 +740,17 @@ PyObject *BUILTIN_TYPE3( PyObject *module_name, PyObject *name, PyObject *bases,
 
     Py_DECREF( pos_args );
 
-    int res = PyObject_SetAttr( result, const_str_plain___module__, module_name );
-
-    if ( res < 0 )
+    // Class statements provide "__module__" in the dictionary, which may also
+    // be overridden there, only otherwise it is to be set.
+    if ( PyDict_GetItem( dict, const_str_plain___module__ ) == NULL )
     {
-        return NULL;
+        int res = PyObject_SetAttr( result, const_str_plain___module__, module_name );
+
+        if (unlikely( res < 0 ))
+        {
+            Py_DECREF( result );
+            return NULL;
+        }
     }
 
     return result;
@@ -893,6 +1145,165 @@ PyObject *IMPORT_MODULE( PyObject *module_name, PyObject *globals, PyObject *loc
     return import_result;
 }
 
+// The "__import__" built-in as found at start-up. Imports only take the fast
+// path below as long as it was not replaced.
+static PyObject *_python_original_builtin_import = NULL;
+
+extern PyObject *const_str_plain___path__;
+
+#if PYTHON_VERSION >= 330
+#if PYTHON_VERSION >= 340
+extern PyObject *const_str_plain___spec__;
+extern PyObject *const_str_plain__initializing;
+#else
+extern PyObject *const_str_plain___initializing__;
+#endif
+
+// Modules are put into "sys.modules" before they are executed, only the import
+// machinery knows how to deal with these, e.g. waiting for other threads.
+static bool isModuleInitializing( PyObject *module )
+{
+#if PYTHON_VERSION >= 340
+    PyObject *spec = PyObject_GetAttr( module, const_str_plain___spec__ );
+
+    if ( spec == NULL )
+    {
+        CLEAR_ERROR_OCCURRED();
+        return false;
+    }
+
+    PyObject *value = PyObject_GetAttr( spec, const_str_plain__initializing );
+    Py_DECREF( spec );
+#else
+    PyObject *value = PyObject_GetAttr( module, const_str_plain___initializing__ );
+#endif
+
+    if ( value == NULL )
+    {
+        CLEAR_ERROR_OCCURRED();
+        return false;
+    }
+
+    int res = PyObject_IsTrue( value );
+    Py_DECREF( value );
+
+    if ( res == -1 )
+    {
+        CLEAR_ERROR_OCCURRED();
+        return true;
+    }
+
+    return res == 1;
+}
+#endif
+
+static PyObject *_IMPORT_MODULE_FAST( PyObject *module_name, PyObject *top_level_name, PyObject *import_items, char const *embedded_name )
+{
+    PyObject *modules_dict = PyImport_GetModuleDict();
+
+    PyObject *module = PyDict_GetItem( modules_dict, module_name );
+
+#if PYTHON_VERSION < 300
+    // Not yet loaded, but we know it is one of ours, so go to our loader
+    // directly, rather than asking all of "sys.meta_path" through "__import__".
+    if ( module == NULL && embedded_name != NULL )
+    {
+        PyObject *loaded = IMPORT_EMBEDDED_MODULE( module_name, embedded_name );
+
+        if (unlikely( loaded == NULL ))
+        {
+            return NULL;
+        }
+
+        Py_DECREF( loaded );
+
+        if ( loaded == Py_None )
+        {
+            return NULL;
+        }
+
+        module = PyDict_GetItem( modules_dict, module_name );
+    }
+#endif
+
+    if ( module == NULL || module == Py_None )
+    {
+        return NULL;
+    }
+
+#if PYTHON_VERSION >= 330
+    if ( isModuleInitializing( module ) )
+    {
+        return NULL;
+    }
+#endif
+
+    if ( import_items == Py_None || PyTuple_GET_SIZE( import_items ) == 0 )
+    {
+        // For "import a.b" the top level package is the result.
+        if ( top_level_name != module_name )
+        {
+            module = PyDict_GetItem( modules_dict, top_level_name );
+
+            if ( module == NULL || module == Py_None )
+            {
+                return NULL;
+            }
+        }
+    }
+    else if ( PyObject_HasAttr( module, const_str_plain___path__ ) )
+    {
+        // For packages, names not yet present may be sub-modules to import,
+        // only "__import__" does that.
+        for ( Py_ssize_t i = 0; i < PyTuple_GET_SIZE( import_items ); i++ )
+        {
+            PyObject *import_item = PyTuple_GET_ITEM( import_items, i );
+
+            if ( Nuitka_String_AsString_Unchecked( import_item )[0] == '*' )
+            {
+                return NULL;
+            }
+
+            if ( !PyObject_HasAttr( module, import_item ) )
+            {
+                return NULL;
+            }
+        }
+    }
+
+    return INCREASE_REFCOUNT( module );
+}
+
+PyObject *IMPORT_MODULE_FAST( PyObject *module_name, PyObject *top_level_name, PyObject *import_items, char const *embedded_name )
+{
+    CHECK_OBJECT( module_name );
+    CHECK_OBJECT( top_level_name );
+    CHECK_OBJECT( import_items );
+
+    // Replacements of "__import__" must be honored, they will want to see all
+    // imports, even of modules already loaded.
+    PyObject *import_function = PyDict_GetItem( (PyObject *)dict_builtin, const_str_plain___import__ );
+
+    if ( import_function == NULL || import_function != _python_original_builtin_import )
+    {
+        return NULL;
+    }
+
+#if PYTHON_VERSION < 330
+    // Like "__import__" does it, wait for other threads to complete imports
+    // before giving out their modules.
+    _PyImport_AcquireLock();
+#endif
+
+    PyObject *result = _IMPORT_MODULE_FAST( module_name, top_level_name, import_items, embedded_name );
+
+#if PYTHON_VERSION < 330
+    _PyImport_ReleaseLock();
+#endif
+
+    return result;
+}
+
 extern PyObject *const_str_plain___all__;
 
 bool IMPORT_MODULE_STAR( PyObject *target, bool is_module, PyObject *module )
@@ -2267,6 +2678,15 @@ void _initBuiltinModule()
     dict_builtin = (PyDictObject *)builtin_module->md_dict;
     assert( PyDict_Check( dict_builtin ) );
 
+    // Only the built-in implementation allows to bypass it for imports, not
+    // something installed before a compiled extension module got loaded.
+    _python_original_builtin_import = PyDict_GetItemString( (PyObject *)dict_builtin, "__import__" );
+
+    if ( _python_original_builtin_import != NULL && !PyCFunction_Check( _python_original_builtin_import ) )
+    {
+        _python_original_builtin_import = NULL;
+    }
+
 #ifdef _NUITKA_STANDALONE
     int res = PyDict_SetItemString(
         (PyObject *)dict_builtin,
@@ -2850,6 +3270,89 @@ void _initSlotIternext()
 }
 #endif
 
+// Builtin iterators, for which the length hint is exact and cannot have side
+// effects, and their "__length_hint__" implementations, found on first use.
+#define ITERATOR_HINT_TYPE_COUNT 3
+
+static PyTypeObject *iterator_hint_types[ ITERATOR_HINT_TYPE_COUNT ];
+static PyCFunction iterator_hint_functions[ ITERATOR_HINT_TYPE_COUNT ];
+static bool iterator_hints_initialized = false;
+
+static void _initIteratorHint( int index, PyObject *iterable )
+{
+    CHECK_OBJECT( iterable );
+
+    PyObject *iterator = PyObject_GetIter( iterable );
+    CHECK_OBJECT( iterator );
+
+    PyTypeObject *type = Py_TYPE( iterator );
+
+    Py_DECREF( iterator );
+    Py_DECREF( iterable );
+
+#if PYTHON_VERSION < 300
+    PyObject *hint_name = PyString_FromString( "__length_hint__" );
+#else
+    PyObject *hint_name = PyUnicode_FromString( "__length_hint__" );
+#endif
+    PyObject *descr = _PyType_Lookup( type, hint_name );
+    Py_DECREF( hint_name );
+
+    // Without a method descriptor, the type is not considered at all. The
+    // type of these is not exported by all Python versions.
+    if ( descr != NULL && strcmp( Py_TYPE( descr )->tp_name, "method_descriptor" ) == 0 )
+    {
+        iterator_hint_types[ index ] = type;
+        iterator_hint_functions[ index ] = ((PyMethodDescrObject *)descr)->d_method->ml_meth;
+    }
+}
+
+Py_ssize_t ITERATOR_LENGTH_HINT( PyObject *iterator )
+{
+    CHECK_OBJECT( iterator );
+
+    if (unlikely( iterator_hints_initialized == false ))
+    {
+        _initIteratorHint( 0, PyList_New( 0 ) );
+        _initIteratorHint( 1, PyTuple_New( 0 ) );
+        _initIteratorHint(
+            2,
+            PyObject_CallFunction( (PyObject *)&PyRange_Type, (char *)"i", 0 )
+        );
+
+        iterator_hints_initialized = true;
+    }
+
+    PyTypeObject *type = Py_TYPE( iterator );
+
+    for ( int i = 0; i < ITERATOR_HINT_TYPE_COUNT; i++ )
+    {
+        if ( type == iterator_hint_types[ i ] )
+        {
+            PyObject *hint = iterator_hint_functions[ i ]( iterator, NULL );
+
+            if (unlikely( hint == NULL ))
+            {
+                CLEAR_ERROR_OCCURRED();
+                return 0;
+            }
+
+            Py_ssize_t result = PyNumber_AsSsize_t( hint, NULL );
+            Py_DECREF( hint );
+
+            if (unlikely( result < 0 ))
+            {
+                CLEAR_ERROR_OCCURRED();
+                return 0;
+            }
+
+            return result;
+        }
+    }
+
+    return 0;
+}
+
 #if PYTHON_VERSION < 300
 
 extern PyObject *const_str_plain___cmp__;
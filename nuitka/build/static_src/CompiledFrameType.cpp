@@ -543,12 +543,16 @@ PyCodeObject *MAKE_CODEOBJ( PyObject *filename, PyObject *function_name, int lin
 
     // TODO: Consider using PyCode_NewEmpty
 
+    // All variable names are local variables, that allows detached frames to
+    // have them as fast locals, see "storeDetachedFrameLocal".
+    int nlocals = (int)PyTuple_GET_SIZE( argnames );
+
     PyCodeObject *result = PyCode_New(
         arg_count,           // argcount
 #if PYTHON_VERSION >= 300
         kw_only_count,       // kw-only count
 #endif
-        0,                   // nlocals
+        nlocals,             // nlocals
         0,                   // stacksize
         flags,               // flags
 #if PYTHON_VERSION < 300
@@ -583,7 +587,11 @@ PyCodeObject *MAKE_CODEOBJ( PyObject *filename, PyObject *function_name, int lin
 
 static PyFrameObject *duplicateFrame( PyFrameObject *old_frame, PyObject *locals )
 {
-    PyFrameObject *new_frame = PyObject_GC_NewVar( PyFrameObject, &PyFrame_Type, 0 );
+    // Room for the local variables only, "PyFrame_FastToLocals" will make the
+    // "f_locals" from them, if ever needed.
+    Py_ssize_t nlocals = old_frame->f_code->co_nlocals;
+
+    PyFrameObject *new_frame = PyObject_GC_NewVar( PyFrameObject, &PyFrame_Type, nlocals );
 
     // Allow only to detach only our tracing frames.
     assert( Py_TYPE( old_frame ) == &Nuitka_Frame_Type );
@@ -611,8 +619,13 @@ static PyFrameObject *duplicateFrame( PyFrameObject *old_frame, PyObject *locals
     new_frame->f_exc_value = NULL;
     new_frame->f_exc_traceback = NULL;
 
-    assert( old_frame->f_valuestack == old_frame->f_localsplus );
-    new_frame->f_valuestack = new_frame->f_localsplus;
+    for ( Py_ssize_t i = 0; i < nlocals; i++ )
+    {
+        new_frame->f_localsplus[i] = NULL;
+    }
+
+    assert( old_frame->f_valuestack == old_frame->f_localsplus + nlocals );
+    new_frame->f_valuestack = new_frame->f_localsplus + nlocals;
 
     assert( old_frame->f_stacktop == old_frame->f_valuestack );
     new_frame->f_stacktop = new_frame->f_valuestack;
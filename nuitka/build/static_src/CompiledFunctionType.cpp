@@ -60,61 +60,66 @@ static PyObject *Nuitka_Function_tp_repr( Nuitka_FunctionObject *function )
     );
 }
 
-static PyObject *Nuitka_Function_tp_call( Nuitka_FunctionObject *function, PyObject *tuple_args, PyObject *kw )
+// Call with positional arguments only, used also when the keyword arguments
+// are an empty dictionary, which is typical for "f( *args, **kw )" forwarding
+// in decorators.
+static PyObject *Nuitka_CallFunctionPosArgs( Nuitka_FunctionObject const *function, PyObject **args, Py_ssize_t args_size )
 {
-    CHECK_OBJECT( tuple_args );
-    assert( PyTuple_CheckExact( tuple_args ) );
+    if ( function->m_args_simple && args_size == function->m_args_positional_count )
+    {
+        for( Py_ssize_t i = 0; i < args_size; i++ )
+        {
+            Py_INCREF( args[ i ] );
+        }
 
-    if ( kw == NULL )
+        return function->m_c_code( function, args );
+    }
+    else if ( function->m_args_simple && args_size + function->m_defaults_given == function->m_args_positional_count )
     {
-        PyObject **args = &PyTuple_GET_ITEM( tuple_args, 0 );
-        Py_ssize_t args_size = PyTuple_GET_SIZE( tuple_args );
+#ifdef _MSC_VER
+        PyObject **python_pars = (PyObject **)_alloca( sizeof( PyObject * ) * function->m_args_overall_count );
+#else
+        PyObject *python_pars[ function->m_args_overall_count ];
+#endif
+        memcpy( python_pars, args, args_size * sizeof(PyObject *) );
+        memcpy( python_pars + args_size, &PyTuple_GET_ITEM( function->m_defaults, 0 ), function->m_defaults_given * sizeof(PyObject *) );
 
-        if ( function->m_args_simple && args_size == function->m_args_positional_count )
+        for( Py_ssize_t i = 0; i < function->m_args_overall_count; i++ )
         {
-            for( Py_ssize_t i = 0; i < args_size; i++ )
-            {
-                Py_INCREF( args[ i ] );
-            }
-
-            return function->m_c_code( function, args );
+            Py_INCREF( python_pars[ i ] );
         }
-        else if ( function->m_args_simple && args_size + function->m_defaults_given == function->m_args_positional_count )
-        {
+
+        return function->m_c_code( function, python_pars );
+    }
+    else
+    {
 #ifdef _MSC_VER
-            PyObject **python_pars = (PyObject **)_alloca( sizeof( PyObject * ) * function->m_args_overall_count );
+        PyObject **python_pars = (PyObject **)_alloca( sizeof( PyObject * ) * function->m_args_overall_count );
 #else
-            PyObject *python_pars[ function->m_args_overall_count ];
+        PyObject *python_pars[ function->m_args_overall_count ];
 #endif
-            memcpy( python_pars, args, args_size * sizeof(PyObject *) );
-            memcpy( python_pars + args_size, &PyTuple_GET_ITEM( function->m_defaults, 0 ), function->m_defaults_given * sizeof(PyObject *) );
-
-            for( Py_ssize_t i = 0; i < function->m_args_overall_count; i++ )
-            {
-                Py_INCREF( python_pars[ i ] );
-            }
+        memset( python_pars, 0, function->m_args_overall_count * sizeof(PyObject *) );
 
+        if ( parseArgumentsPos( function, python_pars, args, args_size ))
+        {
             return function->m_c_code( function, python_pars );
         }
         else
         {
-#ifdef _MSC_VER
-            PyObject **python_pars = (PyObject **)_alloca( sizeof( PyObject * ) * function->m_args_overall_count );
-#else
-            PyObject *python_pars[ function->m_args_overall_count ];
-#endif
-            memset( python_pars, 0, function->m_args_overall_count * sizeof(PyObject *) );
-
-            if ( parseArgumentsPos( function, python_pars, args, args_size ))
-            {
-                return function->m_c_code( function, python_pars );
-            }
-            else
-            {
-                return NULL;
-            }
+            return NULL;
         }
     }
+}
+
+static PyObject *Nuitka_Function_tp_call( Nuitka_FunctionObject *function, PyObject *tuple_args, PyObject *kw )
+{
+    CHECK_OBJECT( tuple_args );
+    assert( PyTuple_CheckExact( tuple_args ) );
+
+    if ( kw == NULL || DICT_SIZE( kw ) == 0 )
+    {
+        return Nuitka_CallFunctionPosArgs( function, &PyTuple_GET_ITEM( tuple_args, 0 ), PyTuple_GET_SIZE( tuple_args ) );
+    }
     else
     {
         return Nuitka_CallFunctionPosArgsKwArgs( function, &PyTuple_GET_ITEM( tuple_args, 0 ), PyTuple_GET_SIZE( tuple_args ), kw );
@@ -61,6 +61,15 @@ static void Nuitka_Generator_release_closure( Nuitka_GeneratorObject *generator
     }
 }
 
+static void Nuitka_Generator_release_heap_storage( Nuitka_GeneratorObject *generator )
+{
+    if ( generator->m_heap_storage )
+    {
+        PyObject_Free( generator->m_heap_storage );
+        generator->m_heap_storage = NULL;
+    }
+}
+
 // For the generator object fiber entry point, we may need to follow what
 // "makecontext" will support and that is only a list of integers, but we will need
 // to push a pointer through it, and so it's two of them, which might be fully
@@ -86,7 +95,10 @@ static void Nuitka_Generator_entry_point( Nuitka_GeneratorObject *generator )
     swapFiber( &generator->m_yielder_context, &generator->m_caller_context );
 }
 
-static PyObject *Nuitka_Generator_send( Nuitka_GeneratorObject *generator, PyObject *value )
+// Resume the generator. When it finishes without an exception, NULL is returned
+// without an exception set, like builtin iterators do, so loops need not
+// create and clear a "StopIteration" for every generator.
+static PyObject *_Nuitka_Generator_send( Nuitka_GeneratorObject *generator, PyObject *value )
 {
     if ( generator->m_status == status_Unused && value != NULL && value != Py_None )
     {
@@ -115,13 +127,16 @@ static PyObject *Nuitka_Generator_send( Nuitka_GeneratorObject *generator, PyObj
 
         if ( generator->m_status == status_Unused )
         {
-            // Prepare the generator context to run.
-            int res = prepareFiber( &generator->m_yielder_context, (void *)Nuitka_Generator_entry_point, (uintptr_t)generator );
-
-            if ( res != 0 )
+            // Prepare the generator context to run, stackless ones need none.
+            if ( !generator->m_stackless )
             {
-                PyErr_Format( PyExc_MemoryError, "generator cannot be allocated" );
-                return NULL;
+                int res = prepareFiber( &generator->m_yielder_context, (void *)Nuitka_Generator_entry_point, (uintptr_t)generator );
+
+                if ( res != 0 )
+                {
+                    PyErr_Format( PyExc_MemoryError, "generator cannot be allocated" );
+                    return NULL;
+                }
             }
 
             generator->m_status = status_Running;
@@ -156,7 +171,28 @@ static PyObject *Nuitka_Generator_send( Nuitka_GeneratorObject *generator, PyObj
         // Continue the yielder function while preventing recursion.
         generator->m_running = true;
 
-        swapFiber( &generator->m_caller_context, &generator->m_yielder_context );
+#if _NUITKA_NATIVE_PROFILE
+        if ( generator->m_profile_entry )
+        {
+            Nuitka_Profile_Enter( generator->m_profile_entry );
+        }
+#endif
+
+        if ( generator->m_stackless )
+        {
+            generator->m_yielded = ((stackless_generator_code)generator->m_code)( generator, value );
+        }
+        else
+        {
+            swapFiber( &generator->m_caller_context, &generator->m_yielder_context );
+        }
+
+#if _NUITKA_NATIVE_PROFILE
+        if ( generator->m_profile_entry )
+        {
+            Nuitka_Profile_Leave();
+        }
+#endif
 
         generator->m_running = false;
 
@@ -175,16 +211,13 @@ static PyObject *Nuitka_Generator_send( Nuitka_GeneratorObject *generator, PyObj
 
         if ( generator->m_yielded == NULL )
         {
-            assert( ERROR_OCCURRED() );
-
             generator->m_status = status_Finished;
 
             Py_XDECREF( generator->m_frame );
             generator->m_frame = NULL;
 
             Nuitka_Generator_release_closure( generator );
-
-            assert( ERROR_OCCURRED() );
+            Nuitka_Generator_release_heap_storage( generator );
 
 #if PYTHON_VERSION < 300
             Py_XDECREF( saved_exception_type );
@@ -244,15 +277,26 @@ static PyObject *Nuitka_Generator_send( Nuitka_GeneratorObject *generator, PyObj
     }
     else
     {
-        PyErr_SetObject( PyExc_StopIteration, (PyObject *)NULL );
-
         return NULL;
     }
 }
 
+static PyObject *Nuitka_Generator_send( Nuitka_GeneratorObject *generator, PyObject *value )
+{
+    PyObject *result = _Nuitka_Generator_send( generator, value );
+
+    // Only the iteration protocol allows to not raise "StopIteration".
+    if ( result == NULL && !ERROR_OCCURRED() )
+    {
+        PyErr_SetObject( PyExc_StopIteration, (PyObject *)NULL );
+    }
+
+    return result;
+}
+
 static PyObject *Nuitka_Generator_tp_iternext( Nuitka_GeneratorObject *generator )
 {
-    return Nuitka_Generator_send( generator, Py_None );
+    return _Nuitka_Generator_send( generator, Py_None );
 }
 
 #if PYTHON_VERSION < 340
@@ -448,13 +492,17 @@ static void Nuitka_Generator_tp_dealloc( Nuitka_GeneratorObject *generator )
     }
 
     Nuitka_Generator_release_closure( generator );
+    Nuitka_Generator_release_heap_storage( generator );
 
     Py_XDECREF( generator->m_frame );
 
     assert( Py_REFCNT( generator ) == 1 );
     Py_REFCNT( generator ) = 0;
 
-    releaseFiber( &generator->m_yielder_context );
+    if ( !generator->m_stackless )
+    {
+        releaseFiber( &generator->m_yielder_context );
+    }
 
     // Now it is safe to release references and memory for it.
     Nuitka_GC_UnTrack( generator );
@@ -670,15 +718,12 @@ PyTypeObject Nuitka_Generator_Type =
 };
 
 #if PYTHON_VERSION < 350
-PyObject *Nuitka_Generator_New( generator_code code, PyObject *name, PyCodeObject *code_object, PyCellObject **closure, Py_ssize_t closure_given )
+static void Nuitka_Generator_init( Nuitka_GeneratorObject *result, void *code, PyObject *name, PyCodeObject *code_object, PyCellObject **closure, Py_ssize_t closure_given )
 #else
-PyObject *Nuitka_Generator_New( generator_code code, PyObject *name, PyObject *qualname, PyCodeObject *code_object, PyCellObject **closure, Py_ssize_t closure_given )
+static void Nuitka_Generator_init( Nuitka_GeneratorObject *result, void *code, PyObject *name, PyObject *qualname, PyCodeObject *code_object, PyCellObject **closure, Py_ssize_t closure_given )
 #endif
 {
-    Nuitka_GeneratorObject *result = PyObject_GC_New( Nuitka_GeneratorObject, &Nuitka_Generator_Type );
-    assert( result != NULL );
-
-    result->m_code = (void *)code;
+    result->m_code = code;
 
     CHECK_OBJECT( name );
     result->m_name = name;
@@ -712,12 +757,63 @@ PyObject *Nuitka_Generator_New( generator_code code, PyObject *name, PyObject *q
     result->m_frame = NULL;
     result->m_code_object = code_object;
 
+    result->m_yield_return_index = 0;
+    result->m_heap_storage = NULL;
+
+#if _NUITKA_NATIVE_PROFILE
+    result->m_profile_entry = NULL;
+#endif
+}
+
+#if PYTHON_VERSION < 350
+PyObject *Nuitka_Generator_New( generator_code code, PyObject *name, PyCodeObject *code_object, PyCellObject **closure, Py_ssize_t closure_given )
+#else
+PyObject *Nuitka_Generator_New( generator_code code, PyObject *name, PyObject *qualname, PyCodeObject *code_object, PyCellObject **closure, Py_ssize_t closure_given )
+#endif
+{
+    Nuitka_GeneratorObject *result = PyObject_GC_New( Nuitka_GeneratorObject, &Nuitka_Generator_Type );
+    assert( result != NULL );
+
+#if PYTHON_VERSION < 350
+    Nuitka_Generator_init( result, (void *)code, name, code_object, closure, closure_given );
+#else
+    Nuitka_Generator_init( result, (void *)code, name, qualname, code_object, closure, closure_given );
+#endif
+
+    result->m_stackless = false;
     initFiber( &result->m_yielder_context );
 
     Nuitka_GC_Track( result );
     return (PyObject *)result;
 }
 
+#if PYTHON_VERSION < 350
+PyObject *Nuitka_Generator_NewStackless( stackless_generator_code code, PyObject *name, PyCodeObject *code_object, PyCellObject **closure, Py_ssize_t closure_given )
+#else
+PyObject *Nuitka_Generator_NewStackless( stackless_generator_code code, PyObject *name, PyObject *qualname, PyCodeObject *code_object, PyCellObject **closure, Py_ssize_t closure_given )
+#endif
+{
+    // Stackless generators never use the fiber contexts at the end of the
+    // object, so these are not allocated at all.
+    Nuitka_GeneratorObject *result = (Nuitka_GeneratorObject *)_PyObject_GC_Malloc(
+        offsetof( Nuitka_GeneratorObject, m_yielder_context )
+    );
+    assert( result != NULL );
+
+    PyObject_INIT( result, &Nuitka_Generator_Type );
+
+#if PYTHON_VERSION < 350
+    Nuitka_Generator_init( result, (void *)code, name, code_object, closure, closure_given );
+#else
+    Nuitka_Generator_init( result, (void *)code, name, qualname, code_object, closure, closure_given );
+#endif
+
+    result->m_stackless = true;
+
+    Nuitka_GC_Track( result );
+    return (PyObject *)result;
+}
+
 #if PYTHON_VERSION >= 330
 
 // This is for CPython iterator objects, the respective code is not exported as
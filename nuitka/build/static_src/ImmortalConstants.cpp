@@ -0,0 +1,196 @@
+//     Copyright 2016, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+/* Immortal constants and their arena.
+ *
+ * Constants of types without pointers into their own memory are copied into
+ * an arena of large blocks, where they share pages only with other immortal
+ * constants, instead of with objects written to, e.g. by reference counting
+ * or garbage collection. Other constants are made immortal where they are.
+ */
+
+#include "nuitka/prelude.hpp"
+
+#if _NUITKA_IMMORTAL_CONSTANTS
+
+// Constants are copied into blocks of this size, or larger ones for larger
+// constants. These are never released.
+#define CONSTANT_ARENA_BLOCK_SIZE ( 256 * 1024 )
+
+// Keep the alignment object allocators give.
+#define CONSTANT_ARENA_ALIGNMENT 16
+
+static char *constant_arena_free = NULL;
+static size_t constant_arena_left = 0;
+
+static void *allocateConstantArena( size_t size )
+{
+    size = ( size + CONSTANT_ARENA_ALIGNMENT - 1 ) & ~(size_t)( CONSTANT_ARENA_ALIGNMENT - 1 );
+
+    if ( size > constant_arena_left )
+    {
+        size_t block_size = size > CONSTANT_ARENA_BLOCK_SIZE ? size : CONSTANT_ARENA_BLOCK_SIZE;
+
+        char *block = (char *)malloc( block_size );
+
+        if (unlikely( block == NULL ))
+        {
+            return NULL;
+        }
+
+        constant_arena_free = block;
+        constant_arena_left = block_size;
+    }
+
+    void *result = constant_arena_free;
+
+    constant_arena_free += size;
+    constant_arena_left -= size;
+
+    return result;
+}
+
+// Types, whose objects are all in one piece of memory, except for references
+// to other objects, and can therefore be copied.
+static bool isConstantArenaType( PyObject *value )
+{
+    PyTypeObject *type = Py_TYPE( value );
+
+#if PYTHON_VERSION < 300
+    if ( type == &PyString_Type )
+    {
+        return !PyString_CHECK_INTERNED( value );
+    }
+
+    if ( type == &PyInt_Type )
+    {
+        return true;
+    }
+#else
+    if ( type == &PyBytes_Type )
+    {
+        return true;
+    }
+#endif
+
+    return
+        type == &PyLong_Type ||
+        type == &PyFloat_Type ||
+        type == &PyComplex_Type ||
+        type == &PyTuple_Type;
+}
+
+static PyObject *moveToConstantArena( PyObject *value )
+{
+    // Only objects not shared, e.g. not cached small integers or characters,
+    // can be replaced with a copy.
+    if ( Py_REFCNT( value ) != 1 || !isConstantArenaType( value ) )
+    {
+        return value;
+    }
+
+    PyTypeObject *type = Py_TYPE( value );
+
+    size_t size = type->tp_basicsize;
+
+    if ( type->tp_itemsize != 0 )
+    {
+        Py_ssize_t item_count = Py_SIZE( value );
+
+        // Negative sizes give the sign of long values.
+        if ( item_count < 0 )
+        {
+            item_count = -item_count;
+        }
+
+        size += item_count * type->tp_itemsize;
+    }
+
+    PyObject *result;
+
+    if ( PyObject_IS_GC( value ) )
+    {
+        // The copy takes the header of the garbage collector too, which then
+        // says it is not tracked.
+        PyObject_GC_UnTrack( value );
+
+        char *memory = (char *)allocateConstantArena( sizeof( PyGC_Head ) + size );
+
+        if (unlikely( memory == NULL ))
+        {
+            return value;
+        }
+
+        memcpy( memory, _Py_AS_GC( value ), sizeof( PyGC_Head ) + size );
+
+        result = (PyObject *)( memory + sizeof( PyGC_Head ) );
+    }
+    else
+    {
+        result = (PyObject *)allocateConstantArena( size );
+
+        if (unlikely( result == NULL ))
+        {
+            return value;
+        }
+
+        memcpy( result, value, size );
+    }
+
+    // The copy holds its own references to the values of tuples, as releasing
+    // the original gives up its ones.
+    if ( type == &PyTuple_Type )
+    {
+        for ( Py_ssize_t i = 0; i < PyTuple_GET_SIZE( result ); i++ )
+        {
+            Py_INCREF( PyTuple_GET_ITEM( result, i ) );
+        }
+    }
+
+    Py_DECREF( value );
+
+    return result;
+}
+
+PyObject *MAKE_CONSTANT_IMMORTAL( PyObject *value, bool intern )
+{
+    CHECK_OBJECT( value );
+
+    value = moveToConstantArena( value );
+
+    // Interning may give another object, then that becomes immortal instead,
+    // while the copy remains unused, as it cannot be released.
+    if ( intern )
+    {
+        Py_REFCNT( value ) = NUITKA_IMMORTAL_REFCNT;
+
+        Nuitka_StringIntern( &value );
+    }
+
+    Py_REFCNT( value ) = NUITKA_IMMORTAL_REFCNT;
+
+    // Collections in the workers would write to tracked objects, and constants
+    // only hold other constants, so there is nothing to collect.
+    if ( PyObject_IS_GC( value ) )
+    {
+        PyObject_GC_UnTrack( value );
+    }
+
+    return value;
+}
+
+#endif
@@ -0,0 +1,234 @@
+//     Copyright 2016, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+/* Native profiling of compiled code.
+ *
+ * Compiled functions and generator resumptions enter and leave their profile
+ * entries, and the time between is accounted for them, minus the time spent
+ * in other profiled code called, which is accounted for that instead. At
+ * exit, the used entries are appended to "nuitka-native-profile-<pid>.dat"
+ * as a chunk, one per binary, and "nuitka.profiler.NativeProfile" reports on
+ * these.
+ */
+
+#include "nuitka/prelude.hpp"
+
+#if _NUITKA_NATIVE_PROFILE
+
+#if defined( _WIN32 )
+#include <windows.h>
+#include <process.h>
+#else
+#include <time.h>
+#include <unistd.h>
+#endif
+
+#if defined( _MSC_VER )
+#include <intrin.h>
+#define NUITKA_THREAD_LOCAL __declspec( thread )
+#else
+#define NUITKA_THREAD_LOCAL __thread
+#endif
+
+// Cheap time stamps, cycles where available.
+static inline unsigned long long getProfileTicks( void )
+{
+#if defined( _MSC_VER )
+    return __rdtsc();
+#elif defined(__GNUC__) && ( defined(__x86_64__) || defined(__i386__) )
+    return __builtin_ia32_rdtsc();
+#elif defined( _WIN32 )
+    LARGE_INTEGER counter;
+    QueryPerformanceCounter( &counter );
+    return counter.QuadPart;
+#else
+    timespec now;
+    clock_gettime( CLOCK_MONOTONIC, &now );
+    return (unsigned long long)now.tv_sec * 1000000000 + now.tv_nsec;
+#endif
+}
+
+// Wall clock in seconds, to calibrate the ticks with.
+static double getProfileSeconds( void )
+{
+#if defined( _WIN32 )
+    LARGE_INTEGER counter, frequency;
+    QueryPerformanceCounter( &counter );
+    QueryPerformanceFrequency( &frequency );
+    return (double)counter.QuadPart / (double)frequency.QuadPart;
+#else
+    timespec now;
+    clock_gettime( CLOCK_MONOTONIC, &now );
+    return now.tv_sec + now.tv_nsec / 1e9;
+#endif
+}
+
+struct Nuitka_ProfileFrame
+{
+    struct Nuitka_ProfileEntry *m_entry;
+    unsigned long long m_start_ticks;
+    unsigned long long m_child_ticks;
+};
+
+// Deeper nesting is still counted, but not timed.
+#define NUITKA_PROFILE_STACK_SIZE 1024
+
+static NUITKA_THREAD_LOCAL struct Nuitka_ProfileFrame profile_stack[ NUITKA_PROFILE_STACK_SIZE ];
+static NUITKA_THREAD_LOCAL int profile_depth = 0;
+
+static struct Nuitka_ProfileEntry *profile_entries = NULL;
+
+static unsigned long long profile_start_ticks;
+static double profile_start_seconds;
+
+static void writeProfile( void );
+
+static void registerProfileEntry( struct Nuitka_ProfileEntry *entry )
+{
+    if ( profile_entries == NULL )
+    {
+        profile_start_ticks = getProfileTicks();
+        profile_start_seconds = getProfileSeconds();
+
+        atexit( writeProfile );
+    }
+
+    entry->m_registered = true;
+
+    entry->m_next = profile_entries;
+    profile_entries = entry;
+}
+
+void Nuitka_Profile_Enter( struct Nuitka_ProfileEntry *entry )
+{
+    if (unlikely( !entry->m_registered ))
+    {
+        registerProfileEntry( entry );
+    }
+
+    entry->m_calls += 1;
+
+    if (likely( profile_depth < NUITKA_PROFILE_STACK_SIZE ))
+    {
+        struct Nuitka_ProfileFrame *frame = &profile_stack[ profile_depth ];
+
+        frame->m_entry = entry;
+        frame->m_child_ticks = 0;
+
+        entry->m_active += 1;
+
+        // Last, so the above is not accounted to the function.
+        frame->m_start_ticks = getProfileTicks();
+    }
+
+    profile_depth += 1;
+}
+
+void Nuitka_Profile_Leave( void )
+{
+    unsigned long long end_ticks = getProfileTicks();
+
+    profile_depth -= 1;
+    assert( profile_depth >= 0 );
+
+    if (likely( profile_depth < NUITKA_PROFILE_STACK_SIZE ))
+    {
+        struct Nuitka_ProfileFrame *frame = &profile_stack[ profile_depth ];
+        struct Nuitka_ProfileEntry *entry = frame->m_entry;
+
+        unsigned long long elapsed = end_ticks - frame->m_start_ticks;
+
+        entry->m_self_ticks += elapsed - frame->m_child_ticks;
+
+        entry->m_active -= 1;
+
+        // Only the outermost of recursive calls adds to the total.
+        if ( entry->m_active == 0 )
+        {
+            entry->m_total_ticks += elapsed;
+        }
+
+        if ( profile_depth > 0 )
+        {
+            profile_stack[ profile_depth - 1 ].m_child_ticks += elapsed;
+        }
+    }
+}
+
+static void writeProfileString( FILE *profile_file, char const *value )
+{
+    uint16_t size = (uint16_t)strlen( value );
+
+    fwrite( &size, sizeof( size ), 1, profile_file );
+    fwrite( value, 1, size, profile_file );
+}
+
+// Format of a chunk, in native byte order: The magic, the ticks per second as
+// a double, the entry count, and then for each entry the calls, self ticks,
+// and total ticks as 64 bit values, the line as 32 bit value, and name and
+// filename as 16 bit size and bytes.
+static void writeProfile( void )
+{
+    double ticks_per_second = ( getProfileTicks() - profile_start_ticks ) /
+        ( getProfileSeconds() - profile_start_seconds );
+
+    char filename[ 128 ];
+#if defined( _WIN32 )
+    sprintf( filename, "nuitka-native-profile-%d.dat", (int)_getpid() );
+#else
+    sprintf( filename, "nuitka-native-profile-%d.dat", (int)getpid() );
+#endif
+
+    FILE *profile_file = fopen( filename, "ab" );
+
+    if ( profile_file == NULL )
+    {
+        fprintf( stderr, "Nuitka: Cannot write native profile to '%s'.\n", filename );
+        return;
+    }
+
+    uint32_t count = 0;
+
+    for ( struct Nuitka_ProfileEntry *entry = profile_entries; entry != NULL; entry = entry->m_next )
+    {
+        count += 1;
+    }
+
+    fwrite( "NUITKAPROF1", 1, 11, profile_file );
+    fwrite( &ticks_per_second, sizeof( ticks_per_second ), 1, profile_file );
+    fwrite( &count, sizeof( count ), 1, profile_file );
+
+    for ( struct Nuitka_ProfileEntry *entry = profile_entries; entry != NULL; entry = entry->m_next )
+    {
+        uint64_t values[3] = {
+            entry->m_calls,
+            entry->m_self_ticks,
+            entry->m_total_ticks
+        };
+        int32_t line = entry->m_line;
+
+        fwrite( values, sizeof( values[0] ), 3, profile_file );
+        fwrite( &line, sizeof( line ), 1, profile_file );
+
+        writeProfileString( profile_file, entry->m_name );
+        writeProfileString( profile_file, entry->m_filename );
+    }
+
+    fclose( profile_file );
+}
+
+#endif
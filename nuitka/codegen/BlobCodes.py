@@ -22,23 +22,72 @@ efficiently. The "StreamData" class is used in two places, for constants
 and for freezing of bytecode.
 """
 
+import re
+
+_stream_data_request_re = re.compile(r"&constant_bin_request\[ (\d+) \]")
+
+
 class StreamData:
     def __init__(self):
         self.stream_data = bytes()
 
+        # When recording, values are not placed, but only remembered, for
+        # them to be replayed in order into another object later.
+        self.requests = None
+
     def getStreamDataCode(self, value, fixed_size = False):
-        offset = self.stream_data.find(value)
-        if offset == -1:
-            offset = len(self.stream_data)
-            self.stream_data += value
+        if self.requests is not None:
+            code = "&constant_bin_request[ %d ]" % len(self.requests)
+            self.requests.append(value)
+        else:
+            code = "&constant_bin[ %d ]" % self._getStreamDataOffset(value)
 
         if fixed_size:
-            return "&constant_bin[ %d ]" % offset
+            return code
         else:
-            return "&constant_bin[ %d ], %d" % (
-                offset,
+            return "%s, %d" % (
+                code,
                 len(value)
             )
 
+    def _getStreamDataOffset(self, value):
+        offset = self.stream_data.find(value)
+        if offset == -1:
+            offset = len(self.stream_data)
+            self.stream_data += value
+
+        return offset
+
     def getBytes(self):
         return self.stream_data
+
+    def clear(self):
+        self.stream_data = bytes()
+        self.requests = None
+
+    def startRecording(self):
+        self.requests = []
+
+    def getRecordedRequests(self):
+        return self.requests
+
+    def replayRequests(self, requests):
+        """ Place recorded values, return offsets to use for them.
+
+            This gives the same layout as if the values had been requested
+            from this object in the first place, and code created while
+            recording, must then be adapted with "resolveStreamDataCode".
+        """
+
+        return [
+            self._getStreamDataOffset(value)
+            for value in
+            requests
+        ]
+
+
+def resolveStreamDataCode(code, offsets):
+    def resolve(match):
+        return "&constant_bin[ %d ]" % offsets[int(match.group(1))]
+
+    return _stream_data_request_re.sub(resolve, code)
@@ -25,13 +25,16 @@ able to execute them without creating the argument dictionary at all.
 
 from .ConstantCodes import getConstantAccess
 from .ErrorCodes import getErrorExitCode, getReleaseCode, getReleaseCodes
+from .FunctionCodes import getFunctionEntryPointIdentifier
 from .Helpers import generateChildExpressionCode, generateExpressionCode
 from .LineNumberCodes import emitLineNumberUpdateCode
 from .templates.CodeTemplatesCalls import (
     template_call_function_with_args_decl,
     template_call_function_with_args_impl,
     template_call_method_with_args_decl,
-    template_call_method_with_args_impl
+    template_call_method_with_args_impl,
+    template_call_module_function_no_args,
+    template_call_module_function_with_args
 )
 from .templates.CodeTemplatesModules import (
     template_header_guard,
@@ -158,6 +161,86 @@ def _generateCallCodePosOnly(to_name, expression, called_name, called_attribute_
         )
 
 
+def _generateModuleFunctionCallCode(to_name, expression, called_name,
+                                    function_body, emit, context):
+    call_args = expression.getCallArgs()
+
+    call_arg_names = []
+
+    if call_args is None:
+        pass
+    elif call_args.isExpressionConstantRef():
+        for call_arg_element in call_args.getConstant():
+            call_arg_name = context.allocateTempName("call_arg_element")
+
+            getConstantAccess(
+                to_name  = call_arg_name,
+                constant = call_arg_element,
+                emit     = emit,
+                context  = context,
+            )
+
+            call_arg_names.append(call_arg_name)
+    else:
+        for call_arg_element in call_args.getElements():
+            call_arg_name = generateChildExpressionCode(
+                child_name = call_args.getChildName() + "_element",
+                expression = call_arg_element,
+                emit       = emit,
+                context    = context,
+            )
+
+            call_arg_names.append(call_arg_name)
+
+    context.setCurrentSourceCodeReference(
+        expression.getCompatibleSourceReference()
+    )
+
+    emitLineNumberUpdateCode(emit, context)
+
+    function_impl_identifier = getFunctionEntryPointIdentifier(
+        function_identifier = function_body.getCodeName()
+    )
+
+    # The called value is checked to really be the function, as it may have
+    # been changed through other means than assignments.
+    if call_arg_names:
+        quick_calls_used.add(len(call_arg_names))
+
+        emit(
+            template_call_module_function_with_args % {
+                "to_name"                  : to_name,
+                "called_name"              : called_name,
+                "call_arg_names"           : ", ".join(call_arg_names),
+                "args_count"               : len(call_arg_names),
+                "function_impl_identifier" : function_impl_identifier
+            }
+        )
+    else:
+        emit(
+            template_call_module_function_no_args % {
+                "to_name"                  : to_name,
+                "called_name"              : called_name,
+                "function_impl_identifier" : function_impl_identifier
+            }
+        )
+
+    getReleaseCodes(
+        release_names = [called_name] + call_arg_names,
+        emit          = emit,
+        context       = context
+    )
+
+    getErrorExitCode(
+        check_name  = to_name,
+        needs_check = expression.mayRaiseException(BaseException),
+        emit        = emit,
+        context     = context
+    )
+
+    context.addCleanupTempName(to_name)
+
+
 def _generateCallCodeKwOnly(to_name, expression, call_kw, called_name,
                             called_attribute_name, called_instance_name, emit,
                             context):
@@ -217,6 +300,20 @@ def generateCallCode(to_name, expression, emit, context):
             context    = context
         )
 
+    function_body = expression.getModuleFunctionBody()
+
+    if function_body is not None:
+        _generateModuleFunctionCallCode(
+            to_name       = to_name,
+            expression    = expression,
+            called_name   = called_name,
+            function_body = function_body,
+            emit          = emit,
+            context       = context
+        )
+
+        return
+
     call_kw = expression.getCallKw()
 
     if call_kw is None or \
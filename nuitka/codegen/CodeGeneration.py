@@ -87,6 +87,7 @@ from .CoroutineCodes import (
 from .DictCodes import (
     generateBuiltinDictCode,
     generateDictionaryCreationCode,
+    generateDictionaryReservedCreationCode,
     generateDictOperationGetCode,
     generateDictOperationInCode,
     generateDictOperationRemoveCode,
@@ -124,12 +125,14 @@ from .FunctionCodes import (
     generateFunctionOutlineCode,
     getExportScopeCode,
     getFunctionCode,
+    getFunctionCreatedDecl,
     getFunctionDirectDecl
 )
 from .GeneratorCodes import (
     generateGeneratorEntryCode,
     generateMakeGeneratorObjectCode,
-    getGeneratorObjectCode
+    getGeneratorObjectCode,
+    isStacklessGenerator
 )
 from .GlobalsLocalsCodes import (
     generateBuiltinDir1Code,
@@ -163,7 +166,8 @@ from .ListCodes import (
     generateListCreationCode,
     generateListOperationAppendCode,
     generateListOperationExtendCode,
-    generateListOperationPopCode
+    generateListOperationPopCode,
+    generateListReservedCreationCode
 )
 from .LoaderCodes import getMetapathLoaderBodyCode
 from .LoopCodes import (
@@ -233,8 +237,9 @@ def generateFunctionBodyCode(function_body, context):
 
     if function_body.isExpressionGeneratorObjectBody():
         function_context = Contexts.PythonGeneratorObjectContext(
-            parent   = context,
-            function = function_body
+            parent    = context,
+            function  = function_body,
+            stackless = isStacklessGenerator(function_body)
         )
     elif function_body.isExpressionCoroutineObjectBody():
         function_context = Contexts.PythonCoroutineObjectContext(
@@ -382,18 +387,26 @@ def generateStatementSequenceCode(statement_sequence, emit, context,
       statement_context.getCleanupTempnames()
 
 
+def makeModuleContext(global_context, module, module_name):
+    return Contexts.PythonModuleContext(
+        module         = module,
+        module_name    = module_name,
+        code_name      = module.getCodeName(),
+        filename       = module.getFilename(),
+        global_context = global_context
+    )
+
+
 def prepareModuleCode(global_context, module, module_name):
     # As this not only creates all modules, but also functions, it deals
     # also with its functions.
 
     assert module.isCompiledPythonModule(), module
 
-    context = Contexts.PythonModuleContext(
+    context = makeModuleContext(
+        global_context = global_context,
         module         = module,
-        module_name    = module_name,
-        code_name      = module.getCodeName(),
-        filename       = module.getFilename(),
-        global_context = global_context
+        module_name    = module_name
     )
 
     context.setExceptionEscape("module_exception_exit")
@@ -433,13 +446,21 @@ def prepareModuleCode(global_context, module, module_name):
     for function_body in module.getCrossUsedFunctions():
         assert function_body.isCrossModuleUsed()
 
-        function_decl = getFunctionDirectDecl(
-            function_identifier = function_body.getCodeName(),
-            closure_variables   = function_body.getClosureVariables(),
-            file_scope          = getExportScopeCode(
-                cross_module = function_body.isCrossModuleUsed()
+        if function_body.needsCreation():
+            function_decl = getFunctionCreatedDecl(
+                function_identifier = function_body.getCodeName(),
+                file_scope          = getExportScopeCode(
+                    cross_module = True
+                )
+            )
+        else:
+            function_decl = getFunctionDirectDecl(
+                function_identifier = function_body.getCodeName(),
+                closure_variables   = function_body.getClosureVariables(),
+                file_scope          = getExportScopeCode(
+                    cross_module = function_body.isCrossModuleUsed()
+                )
             )
-        )
 
         function_decl_codes.append(function_decl)
 
@@ -596,6 +617,8 @@ Helpers.setExpressionDispatchDict(
         "EXPRESSION_MAKE_TUPLE"                     : generateTupleCreationCode,
         "EXPRESSION_MAKE_LIST"                      : generateListCreationCode,
         "EXPRESSION_MAKE_DICT"                      : generateDictionaryCreationCode,
+        "EXPRESSION_MAKE_LIST_RESERVED"             : generateListReservedCreationCode,
+        "EXPRESSION_MAKE_DICT_RESERVED"             : generateDictionaryReservedCreationCode,
         "EXPRESSION_OPERATION_BINARY"               : generateOperationBinaryCode,
         "EXPRESSION_OPERATION_BINARY_INPLACE"       : generateOperationBinaryCode,
         "EXPRESSION_OPERATION_UNARY"                : generateOperationUnaryCode,
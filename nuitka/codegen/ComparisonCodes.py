@@ -21,6 +21,8 @@ Rich comparisons, "in", and "not in", also "is", and "is not", and the
 "isinstance" check as used in conditions, as well as exception matching.
 """
 
+from nuitka.PythonVersions import python_version
+
 from . import OperatorCodes
 from .ErrorCodes import (
     getErrorExitBoolCode,
@@ -32,6 +34,42 @@ from .Helpers import generateExpressionCode
 from .LabelCodes import getBranchingCode
 
 
+# Types of constants, for which rich comparisons have typed helpers.
+_typed_comparison_types = {
+    float : "FLOAT",
+    str   : "STR"
+}
+
+if python_version < 300:
+    _typed_comparison_types[int] = "INT"
+
+
+def getComparisonTypeName(comparator, left, right):
+    """ Name of the type for a typed comparison helper, or "None".
+
+        One operand being a constant of the type is enough, the helper checks
+        the type of the other one at run time. For "in" and "not in" only a
+        constant string element is considered, which is typically a dictionary
+        key, that has its hash value cached.
+    """
+
+    if comparator in OperatorCodes.normal_comparison_codes:
+        if left.isExpressionConstantRef() and \
+           type(left.getConstant()) is str:
+            return "STR"
+        else:
+            return None
+
+    for operand in (left, right):
+        if operand.isExpressionConstantRef():
+            constant_type = type(operand.getConstant())
+
+            if constant_type in _typed_comparison_types:
+                return _typed_comparison_types[constant_type]
+
+    return None
+
+
 def generateComparisonExpressionCode(to_name, expression, emit, context):
     left_name = context.allocateTempName("compexpr_left")
     right_name = context.allocateTempName("compexpr_right")
@@ -60,6 +98,15 @@ def generateComparisonExpressionCode(to_name, expression, emit, context):
         helper = OperatorCodes.normal_comparison_codes[ comparator ]
         assert helper.startswith("SEQUENCE_CONTAINS")
 
+        type_name = getComparisonTypeName(
+            comparator = comparator,
+            left       = expression.getLeft(),
+            right      = expression.getRight()
+        )
+
+        if type_name is not None:
+            helper += '_' + type_name
+
         emit(
             "%s = %s( %s, %s );" % (
                 to_name,
@@ -89,21 +136,38 @@ def generateComparisonExpressionCode(to_name, expression, emit, context):
     elif comparator in OperatorCodes.rich_comparison_codes:
         needs_check = expression.mayRaiseExceptionBool(BaseException)
 
-        helper = "RICH_COMPARE_%s" % (
-            OperatorCodes.rich_comparison_codes[ comparator ]
+        type_name = getComparisonTypeName(
+            comparator = comparator,
+            left       = expression.getLeft(),
+            right      = expression.getRight()
         )
 
-        if not context.mayRecurse() and comparator == "Eq":
-            helper += "_NORECURSE"
+        if type_name is not None:
+            emit(
+                "%s = RICH_COMPARE_%s( %s, %s, Py_%s );" % (
+                    to_name,
+                    type_name,
+                    left_name,
+                    right_name,
+                    OperatorCodes.rich_comparison_codes[ comparator ]
+                )
+            )
+        else:
+            helper = "RICH_COMPARE_%s" % (
+                OperatorCodes.rich_comparison_codes[ comparator ]
+            )
 
-        emit(
-            "%s = %s( %s, %s );" % (
-                to_name,
-                helper,
-                left_name,
-                right_name
+            if not context.mayRecurse() and comparator == "Eq":
+                helper += "_NORECURSE"
+
+            emit(
+                "%s = %s( %s, %s );" % (
+                    to_name,
+                    helper,
+                    left_name,
+                    right_name
+                )
             )
-        )
 
         getReleaseCodes(
             release_names = (left_name, right_name),
@@ -180,18 +244,28 @@ def generateComparisonExpressionCode(to_name, expression, emit, context):
         assert False, comparator
 
 
-def getComparisonExpressionBoolCode(comparator, left_name, right_name, needs_check,
-                                    emit, context):
+def getComparisonExpressionBoolCode(comparator, left_name, right_name, type_name,
+                                    needs_check, emit, context):
     if comparator in OperatorCodes.normal_comparison_codes:
         operator_res_name = context.allocateTempName("cmp_" + comparator, "int")
 
-        emit(
-             "%s = PySequence_Contains( %s, %s );" % (
-                operator_res_name,
-                right_name, # sequence goes first.
-                left_name
+        if type_name is not None:
+            emit(
+                 "%s = SEQUENCE_CONTAINS_BOOL_%s( %s, %s );" % (
+                    operator_res_name,
+                    type_name,
+                    left_name,
+                    right_name
+                )
+            )
+        else:
+            emit(
+                 "%s = PySequence_Contains( %s, %s );" % (
+                    operator_res_name,
+                    right_name, # sequence goes first.
+                    left_name
+                )
             )
-        )
 
         getErrorExitBoolCode(
             condition   = "%s == -1" % operator_res_name,
@@ -207,18 +281,29 @@ def getComparisonExpressionBoolCode(comparator, left_name, right_name, needs_che
     elif comparator in OperatorCodes.rich_comparison_codes:
         operator_res_name = context.allocateTempName("cmp_" + comparator, "int")
 
-        helper = OperatorCodes.rich_comparison_codes[comparator]
-        if not context.mayRecurse() and comparator == "Eq":
-            helper += "_NORECURSE"
-
-        emit(
-             "%s = RICH_COMPARE_BOOL_%s( %s, %s );" % (
-                operator_res_name,
-                helper,
-                left_name,
-                right_name
+        if type_name is not None:
+            emit(
+                 "%s = RICH_COMPARE_BOOL_%s( %s, %s, Py_%s );" % (
+                    operator_res_name,
+                    type_name,
+                    left_name,
+                    right_name,
+                    OperatorCodes.rich_comparison_codes[comparator]
+                )
+            )
+        else:
+            helper = OperatorCodes.rich_comparison_codes[comparator]
+            if not context.mayRecurse() and comparator == "Eq":
+                helper += "_NORECURSE"
+
+            emit(
+                 "%s = RICH_COMPARE_BOOL_%s( %s, %s );" % (
+                    operator_res_name,
+                    helper,
+                    left_name,
+                    right_name
+                )
             )
-        )
 
         getErrorExitBoolCode(
             condition   = "%s == -1" % operator_res_name,
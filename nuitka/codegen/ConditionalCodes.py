@@ -25,28 +25,142 @@ from nuitka import Options
 from .AttributeCodes import getAttributeCheckBoolCode
 from .ComparisonCodes import (
     getBuiltinIsinstanceBoolCode,
-    getComparisonExpressionBoolCode
+    getComparisonExpressionBoolCode,
+    getComparisonTypeName
 )
 from .Emission import SourceCodeCollector
 from .ErrorCodes import getErrorExitBoolCode, getReleaseCode
 from .Helpers import generateExpressionCode
 from .LabelCodes import getBranchingCode, getGotoCode, getLabelCode
 
+# C operators for comparisons of "len" results with integer constants.
+_len_comparison_operators = {
+    "Lt"    : '<',
+    "LtE"   : "<=",
+    "Eq"    : "==",
+    "NotEq" : "!=",
+    "Gt"    : '>',
+    "GtE"   : ">=",
+}
+
+# The mirrored operators, for when the constant is on the left side.
+_len_comparison_mirrors = {
+    "Lt"    : "Gt",
+    "LtE"   : "GtE",
+    "Eq"    : "Eq",
+    "NotEq" : "NotEq",
+    "Gt"    : "Lt",
+    "GtE"   : "LtE",
+}
+
+
+def _isLenComparisonConstant(node):
+    if not node.isExpressionConstantRef():
+        return False
+
+    constant = node.getConstant()
+
+    # Not "bool", and only values that surely fit a C "Py_ssize_t".
+    return type(constant) is int and -2**31 < constant < 2**31
+
+
+def _getLenComparison(condition):
+    """ Detect "len(x) <op> constant" and its mirror image.
+
+        Returns the "len" node, the comparator with it on the left side, and
+        the constant value, or "None" if not applicable.
+    """
+
+    comparator = condition.getComparator()
+
+    if comparator not in _len_comparison_operators:
+        return None
+
+    left = condition.getLeft()
+    right = condition.getRight()
+
+    if left.isExpressionBuiltinLen() and _isLenComparisonConstant(right):
+        return left, comparator, right.getConstant()
+    elif right.isExpressionBuiltinLen() and _isLenComparisonConstant(left):
+        return right, _len_comparison_mirrors[comparator], left.getConstant()
+    else:
+        return None
+
+
+def _generateLenValueCode(len_node, emit, context):
+    """ Length of the "len" argument as C "Py_ssize_t", no int object. """
+
+    value_name = context.allocateTempName("len_arg")
+
+    generateExpressionCode(
+        to_name    = value_name,
+        expression = len_node.getValue(),
+        emit       = emit,
+        context    = context
+    )
+
+    length_name = context.allocateTempName("len_value", "Py_ssize_t")
+
+    emit(
+        "%s = PyObject_Size( %s );" % (
+            length_name,
+            value_name
+        )
+    )
+
+    getReleaseCode(
+        release_name = value_name,
+        emit         = emit,
+        context      = context
+    )
+
+    old_source_ref = context.setCurrentSourceCodeReference(
+        len_node.getCompatibleSourceReference()
+    )
+
+    getErrorExitBoolCode(
+        condition   = "%s == -1 && ERROR_OCCURRED()" % length_name,
+        needs_check = len_node.mayRaiseException(BaseException),
+        emit        = emit,
+        context     = context
+    )
+
+    context.setCurrentSourceCodeReference(old_source_ref)
+
+    return length_name
+
 
 def generateConditionCode(condition, emit, context):
     # The complexity is needed to avoid unnecessary complex generated C++
     # pylint: disable=R0914,R0915
 
     if condition.isExpressionConstantRef():
-        # TODO: Must not happen, optimization catches this.
-        assert False
-
+        # Can happen for the branches of and/or and conditional expressions
+        # that are used as conditions themselves.
         value = condition.getConstant()
 
         if value:
             getGotoCode(context.getTrueBranchTarget(), emit)
         else:
             getGotoCode(context.getFalseBranchTarget(), emit)
+    elif condition.isExpressionComparison() and _getLenComparison(condition):
+        len_node, comparator, constant = _getLenComparison(condition)
+
+        length_name = _generateLenValueCode(
+            len_node = len_node,
+            emit     = emit,
+            context  = context
+        )
+
+        getBranchingCode(
+            condition = "%s %s %d" % (
+                length_name,
+                _len_comparison_operators[comparator],
+                constant
+            ),
+            emit      = emit,
+            context   = context
+        )
     elif condition.isExpressionComparison():
         left_name = context.allocateTempName("compare_left")
 
@@ -66,12 +180,29 @@ def generateConditionCode(condition, emit, context):
             context    = context
         )
 
+        comparator = condition.getComparator()
+
+        # The result of "in" and "not in" is a bool, but the check itself may
+        # still raise, depending on the container.
+        if comparator in ("In", "NotIn"):
+            needs_check = condition.getRight().mayRaiseExceptionIn(
+                BaseException,
+                condition.getLeft()
+            )
+        else:
+            needs_check = condition.mayRaiseExceptionBool(BaseException)
+
         old_source_ref = context.setCurrentSourceCodeReference(condition.getSourceReference())
         getComparisonExpressionBoolCode(
-            comparator  = condition.getComparator(),
+            comparator  = comparator,
             left_name   = left_name,
             right_name  = right_name,
-            needs_check = condition.mayRaiseExceptionBool(BaseException),
+            type_name   = getComparisonTypeName(
+                comparator = comparator,
+                left       = condition.getLeft(),
+                right      = condition.getRight()
+            ),
+            needs_check = needs_check,
             emit        = emit,
             context     = context
         )
@@ -134,6 +265,48 @@ def generateConditionCode(condition, emit, context):
             context   = context,
         )
         getLabelCode(select_end,emit)
+    elif condition.isExpressionConditionalAND() or \
+         condition.isExpressionConditionalOR():
+        # Short circuit through the branch targets, that way the truth of the
+        # left side is checked only once, and no value object is needed.
+        old_true_target = context.getTrueBranchTarget()
+        old_false_target = context.getFalseBranchTarget()
+
+        if condition.isExpressionConditionalAND():
+            right_label = context.allocateLabel("and_right")
+            context.setTrueBranchTarget(right_label)
+        else:
+            right_label = context.allocateLabel("or_right")
+            context.setFalseBranchTarget(right_label)
+
+        generateConditionCode(
+            condition = condition.getLeft(),
+            emit      = emit,
+            context   = context
+        )
+
+        context.setTrueBranchTarget(old_true_target)
+        context.setFalseBranchTarget(old_false_target)
+
+        getLabelCode(right_label, emit)
+
+        generateConditionCode(
+            condition = condition.getRight(),
+            emit      = emit,
+            context   = context
+        )
+    elif condition.isExpressionBuiltinLen():
+        length_name = _generateLenValueCode(
+            len_node = condition,
+            emit     = emit,
+            context  = context
+        )
+
+        getBranchingCode(
+            condition = "%s != 0" % length_name,
+            emit      = emit,
+            context   = context
+        )
     elif condition.isExpressionBuiltinHasattr():
         source_name = context.allocateTempName("hasattr_source")
         attr_name = context.allocateTempName("hasattr_attr")
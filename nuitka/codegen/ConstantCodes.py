@@ -45,6 +45,7 @@ from nuitka.Constants import (
 
 from .BlobCodes import StreamData
 from .Emission import SourceCodeCollector
+from .ErrorCodes import getErrorExitCode
 from .Indentation import indented
 from .Pickling import getStreamedConstant
 from .templates.CodeTemplatesConstants import template_constants_reading
@@ -123,6 +124,14 @@ def _isAttributeName(value):
     return _match_attribute_names.match(value) or value == ".0"
 
 
+def _getInternFlag(value):
+    # Immortal constants are interned after their move to the arena only.
+    if Options.shallMakeConstantsImmortal():
+        return 0
+    else:
+        return 1 if _isAttributeName(value) else 0
+
+
 
 def _getUnstreamCode2(constant_value):
     saved = getStreamedConstant(
@@ -326,6 +335,18 @@ def _addConstantInitCode(context, emit, check, constant_type, constant_value,
     __addConstantInitCode(context, emit, check, constant_type, constant_value,
                           constant_identifier, module_level)
 
+    # Only if it was created here, it may also not be in this scope.
+    if Options.shallMakeConstantsImmortal() and constant_identifier in done:
+        emit(
+            "%s = MAKE_CONSTANT_IMMORTAL( %s, %s );" % (
+                constant_identifier,
+                constant_identifier,
+                "true"
+                  if constant_type is str and _isAttributeName(constant_value) else
+                "false"
+            )
+        )
+
     if Options.isDebug():
         emit(
              """\
@@ -467,7 +488,7 @@ CHECK_OBJECT( const_int_pos_1 );
                     "%s = UNSTREAM_STRING( %s, %d );" % (
                         constant_identifier,
                         stream_data.getStreamDataCode(encoded),
-                        1 if _isAttributeName(constant_value) else 0
+                        _getInternFlag(constant_value)
                     )
                 )
 
@@ -486,7 +507,7 @@ CHECK_OBJECT( const_int_pos_1 );
                 "%s = UNSTREAM_CHAR( %d, %d );" % (
                     constant_identifier,
                     ord(constant_value[0]),
-                    1 if _isAttributeName(constant_value) else 0
+                    _getInternFlag(constant_value)
                 )
             )
         else:
@@ -494,7 +515,7 @@ CHECK_OBJECT( const_int_pos_1 );
                 "%s = UNSTREAM_STRING( %s, %d );" % (
                     constant_identifier,
                     stream_data.getStreamDataCode(constant_value),
-                    1 if _isAttributeName(constant_value) else 0
+                    _getInternFlag(constant_value)
                 )
             )
 
@@ -827,9 +848,298 @@ def getConstantsDeclCode(context):
     return statements
 
 
+# Mutable constants with up to this many values in them, get a generated
+# function to build copies of them, bigger ones use "DEEP_COPY" at run time.
+_max_copy_builder_size = 256
+
+
+def _getConstantSize(constant):
+    if type(constant) is dict:
+        return 1 + sum(
+            _getConstantSize(value)
+            for value in
+            constant.values()
+        )
+    elif type(constant) in (list, tuple):
+        return 1 + sum(
+            _getConstantSize(value)
+            for value in
+            constant
+        )
+    else:
+        return 1
+
+
+def _getConstantCopyReleaseCode(pending_names):
+    """ Code to release the values not yet owned by a container, and fail. """
+
+    return "\n".join(
+        [
+            "Py_DECREF( %s );" % pending_name
+            for pending_name in
+            reversed(pending_names)
+        ] + ["return NULL;"]
+    )
+
+
+def _getConstantCopyCheckCode(condition, pending_names, emit):
+    emit(
+        "if (unlikely( %s ))\n{\n%s\n}" % (
+            condition,
+            indented(_getConstantCopyReleaseCode(pending_names))
+        )
+    )
+
+
+def _getConstantCopyValueName(value_code, pending_names, emit, value_names):
+    """ Create a value into a new variable, checking it was created. """
+
+    value_name = "tmp_value_%d" % len(value_names)
+    value_names.append(value_name)
+
+    emit(
+        "PyObject *%s = %s;" % (
+            value_name,
+            value_code
+        )
+    )
+
+    _getConstantCopyCheckCode(
+        condition     = "%s == NULL" % value_name,
+        pending_names = pending_names,
+        emit          = emit
+    )
+
+    return value_name
+
+
+def _getConstantCopyBuildCode(constant, emit, context, value_names,
+                              pending_names):
+    """ Code to create a copy of a constant, as a new reference.
+
+        Mutable containers are created with the correct size, and filled
+        directly, immutable values are shared and only get a reference. Every
+        creation is checked, on failure the values in "pending_names", which
+        are not yet owned by a container, are released and NULL is returned.
+    """
+
+    # Many cases, pylint: disable=R0912
+
+    constant_type = type(constant)
+
+    if constant_type is dict:
+        mutable_values = any(
+            isMutable(value)
+            for value in
+            constant.values()
+        )
+    elif constant_type in (list, tuple):
+        mutable_values = any(
+            isMutable(value)
+            for value in
+            constant
+        )
+    else:
+        mutable_values = False
+
+    if constant_type is dict:
+        if not constant:
+            value_code = "PyDict_New()"
+        elif not mutable_values:
+            value_code = "PyDict_Copy( %s )" % getConstantCode(
+                constant = constant,
+                context  = context
+            )
+        else:
+            value_code = "_PyDict_NewPresized( %d )" % len(constant)
+
+        result_name = _getConstantCopyValueName(
+            value_code    = value_code,
+            pending_names = pending_names,
+            emit          = emit,
+            value_names   = value_names
+        )
+
+        if not mutable_values:
+            return result_name
+
+        pending_names.append(result_name)
+
+        for key, value in iterItems(constant):
+            # key cannot be mutable.
+            assert not isMutable(key)
+
+            key_code = getConstantCode(
+                constant = key,
+                context  = context
+            )
+
+            if isMutable(value):
+                value_name = _getConstantCopyBuildCode(
+                    constant      = value,
+                    emit          = emit,
+                    context       = context,
+                    value_names   = value_names,
+                    pending_names = pending_names
+                )
+
+                emit(
+                    "int %s_res = PyDict_SetItem( %s, %s, %s );" % (
+                        value_name,
+                        result_name,
+                        key_code,
+                        value_name
+                    )
+                )
+                emit(
+                    "Py_DECREF( %s );" % value_name
+                )
+
+                _getConstantCopyCheckCode(
+                    condition     = "%s_res != 0" % value_name,
+                    pending_names = pending_names,
+                    emit          = emit
+                )
+            else:
+                _getConstantCopyCheckCode(
+                    condition     = "PyDict_SetItem( %s, %s, %s ) != 0" % (
+                        result_name,
+                        key_code,
+                        getConstantCode(
+                            constant = value,
+                            context  = context
+                        )
+                    ),
+                    pending_names = pending_names,
+                    emit          = emit
+                )
+
+        pending_names.pop()
+
+        return result_name
+    elif constant_type is list or \
+         (constant_type is tuple and mutable_values):
+        if not constant:
+            value_code = "PyList_New( 0 )"
+        elif not mutable_values:
+            value_code = "LIST_COPY( %s )" % getConstantCode(
+                constant = constant,
+                context  = context
+            )
+        elif constant_type is list:
+            value_code = "PyList_New( %d )" % len(constant)
+        else:
+            value_code = "PyTuple_New( %d )" % len(constant)
+
+        result_name = _getConstantCopyValueName(
+            value_code    = value_code,
+            pending_names = pending_names,
+            emit          = emit,
+            value_names   = value_names
+        )
+
+        if not mutable_values:
+            return result_name
+
+        # Items not yet set are NULL, which releasing the container allows.
+        pending_names.append(result_name)
+
+        for count, value in enumerate(constant):
+            emit(
+                "%s_SET_ITEM( %s, %d, %s );" % (
+                    "PyList" if constant_type is list else "PyTuple",
+                    result_name,
+                    count,
+                    _getConstantCopyBuildCode(
+                        constant      = value,
+                        emit          = emit,
+                        context       = context,
+                        value_names   = value_names,
+                        pending_names = pending_names
+                    )
+                )
+            )
+
+        pending_names.pop()
+
+        return result_name
+    elif constant_type is set:
+        if constant:
+            value_code = "PySet_New( %s )" % getConstantCode(
+                constant = constant,
+                context  = context
+            )
+        else:
+            value_code = "PySet_New( NULL )"
+
+        return _getConstantCopyValueName(
+            value_code    = value_code,
+            pending_names = pending_names,
+            emit          = emit,
+            value_names   = value_names
+        )
+    else:
+        # Everything else, including built-in types and tuples without
+        # mutable values, is shared.
+        return "INCREASE_REFCOUNT( %s )" % getConstantCode(
+            constant = constant,
+            context  = context
+        )
+
+
+def _getConstantCopyCode(constant, context):
+    """ Code to create a copy of a mutable constant with mutable values.
+
+        For not too large ones, a function specialized to the constant is
+        generated, so no run time type checks or recursion are needed. It is
+        created once per module.
+    """
+
+    constant_identifier = getConstantCode(
+        constant = constant,
+        context  = context
+    )
+
+    if _getConstantSize(constant) > _max_copy_builder_size:
+        return "DEEP_COPY( %s )" % constant_identifier
+
+    builder_identifier = "COPY_" + constant_identifier
+
+    if not context.hasHelperCode(builder_identifier):
+        builder_codes = SourceCodeCollector()
+
+        result_name = _getConstantCopyBuildCode(
+            constant      = constant,
+            emit          = builder_codes,
+            context       = context,
+            value_names   = [],
+            pending_names = []
+        )
+
+        builder_codes("return %s;" % result_name)
+
+        context.addHelperCode(
+            builder_identifier,
+            "static PyObject *%s( void )\n{\n%s\n}" % (
+                builder_identifier,
+                indented(builder_codes.codes)
+            )
+        )
+
+        context.addDeclaration(
+            builder_identifier,
+            "static PyObject *%s( void );" % builder_identifier
+        )
+
+    return "%s()" % builder_identifier
+
+
 def getConstantAccess(to_name, constant, emit, context):
     # Many cases, because for each type, we may copy or optimize by creating
-    # empty.  pylint: disable=R0912,R0915
+    # empty.  pylint: disable=R0912
+
+    # The copies of containers with mutable values can fail.
+    needs_check = False
 
     if type(constant) is dict:
         if constant:
@@ -843,10 +1153,12 @@ def getConstantAccess(to_name, constant, emit, context):
                 needs_deep = False
 
             if needs_deep:
-                code = "DEEP_COPY( %s )" % getConstantCode(
+                code = _getConstantCopyCode(
                     constant = constant,
                     context  = context
                 )
+
+                needs_check = True
             else:
                 code = "PyDict_Copy( %s )" % getConstantCode(
                     constant = constant,
@@ -876,10 +1188,12 @@ def getConstantAccess(to_name, constant, emit, context):
                 needs_deep = False
 
             if needs_deep:
-                code = "DEEP_COPY( %s )" % getConstantCode(
+                code = _getConstantCopyCode(
                     constant = constant,
                     context  = context
                 )
+
+                needs_check = True
             else:
                 code = "LIST_COPY( %s )" % getConstantCode(
                     constant = constant,
@@ -898,11 +1212,13 @@ def getConstantAccess(to_name, constant, emit, context):
             needs_deep = False
 
         if needs_deep:
-            code = "DEEP_COPY( %s )" % getConstantCode(
-                 constant = constant,
-                 context  = context
+            code = _getConstantCopyCode(
+                constant = constant,
+                context  = context
             )
 
+            needs_check = True
+
             ref_count = 1
         else:
             code = getConstantCode(
@@ -925,6 +1241,13 @@ def getConstantAccess(to_name, constant, emit, context):
         )
     )
 
+    if needs_check:
+        getErrorExitCode(
+            check_name = to_name,
+            emit       = emit,
+            context    = context
+        )
+
     if ref_count:
         context.addCleanupTempName(to_name)
 
@@ -951,7 +1274,7 @@ def getConstantInitCodes(module_context):
 
     sorted_constants = sorted(
         module_context.getConstants(),
-        key = lambda k: (len(k[0]), k[0])
+        key = lambda k: (len(k), k)
     )
 
     global_context = module_context.global_context
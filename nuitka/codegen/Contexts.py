@@ -299,6 +299,9 @@ class PythonChildContextBase(PythonContextBase):
     def addDeclaration(self, key, code):
         self.parent.addDeclaration(key, code)
 
+    def hasDeclaration(self, key):
+        return self.parent.hasDeclaration(key)
+
 
 
 def _getConstantDefaultPopulation():
@@ -365,6 +368,17 @@ def _getConstantDefaultPopulation():
             "__loader__"
         )
 
+    if python_version >= 340:
+        # Import fast path checks for modules still being imported.
+        result += (
+            "__spec__",
+            "_initializing"
+        )
+    elif python_version >= 330:
+        result.append(
+            "__initializing__"
+        )
+
     if python_version >= 340:
         result.append(
             # YIELD_FROM uses this starting 3.4, with 3.3 other code is used.
@@ -447,6 +461,45 @@ def _getConstantDefaultPopulation():
     return result
 
 
+def _getConstantKey(constant):
+    if constant is None:
+        key = "Py_None"
+    elif constant is True:
+        key = "Py_True"
+    elif constant is False:
+        key = "Py_False"
+    elif constant is Ellipsis:
+        key = "Py_Ellipsis"
+    elif constant in constant_builtin_types:
+        type_name = constant.__name__
+
+        if constant is int and python_version >= 300:
+            type_name = "long"
+
+        if constant is str and python_version < 300:
+            type_name = "string"
+
+        if constant is str and python_version > 300:
+            type_name = "unicode"
+
+        if type_name != "NoneType":
+            key = "(PyObject *)&Py%s_Type" % type_name.title()
+        else:
+            key = "(PyObject *)Py_TYPE( Py_None )"
+    else:
+        key = "const_" + namifyConstant(constant)
+
+    return key
+
+# Constants that have no "const_" name, but refer to C level objects directly,
+# not all of these can be transferred between processes.
+_special_constants = dict(
+    (_getConstantKey(constant), constant)
+    for constant in
+    (None, True, False, Ellipsis) + constant_builtin_types
+)
+
+
 class PythonGlobalContext:
     def __init__(self):
         self.constants = {}
@@ -463,33 +516,7 @@ class PythonGlobalContext:
 
     def getConstantCode(self, constant):
         # Use in user code, or for constants building code itself
-
-        if constant is None:
-            key = "Py_None"
-        elif constant is True:
-            key = "Py_True"
-        elif constant is False:
-            key = "Py_False"
-        elif constant is Ellipsis:
-            key = "Py_Ellipsis"
-        elif constant in constant_builtin_types:
-            type_name = constant.__name__
-
-            if constant is int and python_version >= 300:
-                type_name = "long"
-
-            if constant is str and python_version < 300:
-                type_name = "string"
-
-            if constant is str and python_version > 300:
-                type_name = "unicode"
-
-            if type_name != "NoneType":
-                key = "(PyObject *)&Py%s_Type" % type_name.title()
-            else:
-                key = "(PyObject *)Py_TYPE( Py_None )"
-        else:
-            key = "const_" + namifyConstant(constant)
+        key = _getConstantKey(constant)
 
         if key not in self.constants:
             self.constants[key] = constant
@@ -505,9 +532,31 @@ class PythonGlobalContext:
     def getConstantUseCount(self, constant):
         return self.constant_use_count[constant]
 
+    def getConstantUseCounts(self):
+        return self.constant_use_count
+
     def getConstants(self):
         return self.constants
 
+    def mergeConstantUses(self, constants, use_counts):
+        """ Merge constant uses made with another global context.
+
+            This is used when code generation happened in another process,
+            the "constants" are the values of named constants, that were
+            not previously known, and "use_counts" are the additional uses.
+        """
+
+        for key, constant in iterItems(constants):
+            if key not in self.constants:
+                self.constants[key] = constant
+
+        for key, count in iterItems(use_counts):
+            if key not in self.constants:
+                self.constants[key] = _special_constants[key]
+
+            self.constant_use_count[key] = \
+              self.constant_use_count.get(key, 0) + count
+
 
 class FrameDeclarationsMixin:
     def __init__(self):
@@ -613,6 +662,9 @@ class PythonModuleContext(PythonContextBase, TempMixin, CodeObjectsMixin,
 
         self.declaration_codes[ key ] = code
 
+    def hasDeclaration(self, key):
+        return key in self.declaration_codes
+
     def getDeclarations(self):
         return self.declaration_codes
 
@@ -643,6 +695,10 @@ class PythonModuleContext(PythonContextBase, TempMixin, CodeObjectsMixin,
     def mayRecurse(self):
         return False
 
+    @staticmethod
+    def isStacklessGenerator():
+        return False
+
     def getConstantCode(self, constant):
         result = self.global_context.getConstantCode(constant)
 
@@ -655,6 +711,17 @@ class PythonModuleContext(PythonContextBase, TempMixin, CodeObjectsMixin,
     def getConstants(self):
         return self.constants
 
+    def getMergeState(self):
+        """ State still needed after the module code was prepared.
+
+            For code prepared in another process, this is what needs to be
+            transferred to finish the module code.
+        """
+        return self.constants, self.needs_module_filename_object
+
+    def setMergeState(self, state):
+        self.constants, self.needs_module_filename_object = state
+
     def markAsNeedsModuleFilenameObject(self):
         self.needs_module_filename_object = True
 
@@ -743,6 +810,10 @@ class PythonFunctionContext(PythonChildContextBase, TempMixin,
     def getCodeObjectHandle(self, **kw):
         return self.parent.getCodeObjectHandle(**kw)
 
+    @staticmethod
+    def isStacklessGenerator():
+        return False
+
 
 class PythonFunctionDirectContext(PythonFunctionContext):
     def isForDirectCall(self):
@@ -755,6 +826,57 @@ class PythonFunctionDirectContext(PythonFunctionContext):
         return False
 
 class PythonGeneratorObjectContext(PythonFunctionContext):
+    def __init__(self, parent, function, stackless = False):
+        PythonFunctionContext.__init__(
+            self,
+            parent   = parent,
+            function = function
+        )
+
+        self.stackless = stackless
+
+        # For stackless generators, the labels to resume at, and the C
+        # temporaries that may have to survive a yield.
+        self.yield_return_labels = []
+        self.yield_spanning_temp_names = set()
+
+        # Code outside of statements, is treated as if it were yielding.
+        self.current_statement_yields = True
+
+    def isStacklessGenerator(self):
+        return self.stackless
+
+    def allocateYieldReturnLabel(self):
+        yield_return_label = self.allocateLabel("yield_return")
+        self.yield_return_labels.append(yield_return_label)
+
+        return yield_return_label
+
+    def getYieldReturnLabels(self):
+        return self.yield_return_labels
+
+    def setCurrentStatementYielding(self, value):
+        result = self.current_statement_yields
+        self.current_statement_yields = value
+        return result
+
+    def allocateTempName(self, base_name, type_name = "PyObject *",
+                         unique = False):
+        tmp_name = PythonFunctionContext.allocateTempName(
+            self,
+            base_name = base_name,
+            type_name = type_name,
+            unique    = unique
+        )
+
+        if self.current_statement_yields:
+            self.yield_spanning_temp_names.add(tmp_name)
+
+        return tmp_name
+
+    def getYieldSpanningTempNames(self):
+        return self.yield_spanning_temp_names
+
     def isForDirectCall(self):
         return False
 
@@ -933,6 +1055,15 @@ class PythonStatementCContext(PythonChildContextBase):
     def mayRecurse(self):
         return self.parent.mayRecurse()
 
+    def isStacklessGenerator(self):
+        return self.parent.isStacklessGenerator()
+
+    def allocateYieldReturnLabel(self):
+        return self.parent.allocateYieldReturnLabel()
+
+    def setCurrentStatementYielding(self, value):
+        return self.parent.setCurrentStatementYielding(value)
+
     def getCodeObjectHandle(self, **kw):
         return self.parent.getCodeObjectHandle(**kw)
 
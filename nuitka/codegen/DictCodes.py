@@ -24,6 +24,7 @@ from nuitka.PythonVersions import python_version
 
 from .ErrorCodes import getErrorExitBoolCode, getErrorExitCode, getReleaseCodes
 from .Helpers import generateChildExpressionsCode, generateExpressionCode
+from .ListCodes import getReservedLengthCode
 
 
 def generateBuiltinDictCode(to_name, expression, emit, context):
@@ -98,6 +99,27 @@ def generateDictionaryCreationCode(to_name, expression, emit, context):
     )
 
 
+def generateDictionaryReservedCreationCode(to_name, expression, emit, context):
+    emit(
+        "%s = _PyDict_NewPresized( %s );" % (
+            to_name,
+            getReservedLengthCode(
+                expression = expression,
+                emit       = emit,
+                context    = context
+            )
+        )
+    )
+
+    getErrorExitCode(
+        check_name = to_name,
+        emit       = emit,
+        context    = context
+    )
+
+    context.addCleanupTempName(to_name)
+
+
 def getDictionaryCreationCode(to_name, pairs, emit, context):
 
     emit(
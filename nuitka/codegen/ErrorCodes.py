@@ -182,6 +182,18 @@ def getErrorVariableDeclarations():
         "NUITKA_MAY_BE_UNUSED int exception_lineno = -1;"
     )
 
+
+def getErrorVariableDeclarationInfos():
+    """ The error variables as C type, name, and initial value. """
+
+    return (
+        ("PyObject *", "exception_type", "NULL"),
+        ("PyObject *", "exception_value", "NULL"),
+        ("PyTracebackObject *", "exception_tb", "NULL"),
+        ("int", "exception_lineno", "-1")
+    )
+
+
 def getExceptionKeeperVariableNames(keeper_index):
     # For finally handlers of Python3, which have conditions on assign and
     # use.
@@ -212,6 +224,23 @@ def getExceptionKeeperVariableNames(keeper_index):
     )
 
 
+def getExceptionKeeperVariableInfos(keeper_index):
+    """ The exception keeper variables as C type, name, and initial value. """
+
+    debug = Options.isDebug() and python_version >= 300
+
+    return (
+        ("PyObject *", "exception_keeper_type_%d" % keeper_index,
+         "NULL" if debug else None),
+        ("PyObject *", "exception_keeper_value_%d" % keeper_index,
+         "NULL" if debug else None),
+        ("PyTracebackObject *", "exception_keeper_tb_%d" % keeper_index,
+         "NULL" if debug else None),
+        ("int", "exception_keeper_lineno_%d" % keeper_index,
+         "-1" if debug else None)
+    )
+
+
 def getExceptionPreserverVariableNames(preserver_id):
     # For finally handlers of Python3, which have conditions on assign and
     # use.
@@ -238,6 +267,21 @@ def getExceptionPreserverVariableNames(preserver_id):
     )
 
 
+def getExceptionPreserverVariableInfos(preserver_id):
+    """ The exception preserver variables as C type, name, and initial value. """
+
+    debug = Options.isDebug() and python_version >= 300
+
+    return (
+        ("PyObject *", "exception_preserved_type_%d" % preserver_id,
+         "NULL" if debug else None),
+        ("PyObject *", "exception_preserved_value_%d" % preserver_id,
+         "NULL" if debug else None),
+        ("PyTracebackObject *", "exception_preserved_tb_%d" % preserver_id,
+         "NULL" if debug else None)
+    )
+
+
 def getErrorFormatExitCode(check_name, exception, args, emit, context):
     getErrorFormatExitBoolCode(
         condition = "%s == NULL" % check_name,
@@ -277,7 +321,10 @@ def getMustNotGetHereCode(reason, context, emit):
     )
 
     if provider.isExpressionGeneratorObjectBody():
-        emit("return;")
+        if context.isStacklessGenerator():
+            emit("return NULL;")
+        else:
+            emit("return;")
     elif provider.isExpressionCoroutineObjectBody():
         emit("return;")
     elif provider.isCompiledPythonModule():
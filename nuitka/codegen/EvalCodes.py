@@ -99,21 +99,25 @@ def generateBuiltinCompileCode(to_name, expression, emit, context):
         flags_name        = flags_name,
         dont_inherit_name = dont_inherit_name,
         optimize_name     = optimize_name,
+        cached            = False,
         emit              = emit,
         context           = context
     )
 
 
 def getBuiltinCompileCode(to_name, source_name, filename_name, mode_name,
-                          flags_name, dont_inherit_name, optimize_name, emit,
-                          context):
+                          flags_name, dont_inherit_name, optimize_name, cached,
+                          emit, context):
+    # The code objects of "exec" and "eval" are not visible, so they can be
+    # shared for the same source code, for "compile" it would be noticed.
     if python_version < 300:
         args = (
             source_name,
             filename_name,
             mode_name,
             flags_name,
-            dont_inherit_name
+            dont_inherit_name,
+            "true" if cached else "false"
         )
     else:
         args = (
@@ -122,7 +126,8 @@ def getBuiltinCompileCode(to_name, source_name, filename_name, mode_name,
             mode_name,
             flags_name,
             dont_inherit_name,
-            optimize_name
+            optimize_name,
+            "true" if cached else "false"
         )
 
     emit(
@@ -160,6 +165,7 @@ def getBuiltinEvalCode(to_name, source_name, filename_name, globals_name,
         flags_name        = "NULL",
         dont_inherit_name = "NULL",
         optimize_name     = "NULL",
+        cached            = True,
         emit              = emit,
         context           = context
     )
@@ -251,6 +257,7 @@ def generateExecCode(statement, emit, context):
         flags_name        = "NULL",
         dont_inherit_name = "NULL",
         optimize_name     = "NULL",
+        cached            = True,
         emit              = emit,
         context           = context
     )
@@ -25,7 +25,10 @@ from nuitka.PythonVersions import python_version
 
 from . import Contexts, Emission
 from .ExceptionCodes import getTracebackMakingIdentifier
-from .GlobalsLocalsCodes import getLoadLocalsCode
+from .GlobalsLocalsCodes import (
+    getDetachedFrameLocalsCode,
+    getInlinedFrameLocalsCode
+)
 from .Indentation import indented
 from .ModuleCodes import getModuleAccessCode
 from .templates.CodeTemplatesFrames import (
@@ -38,6 +41,7 @@ from .templates.CodeTemplatesFrames import (
     template_frame_guard_generator,
     template_frame_guard_generator_exception_handler,
     template_frame_guard_generator_return_handler,
+    template_frame_guard_inline_exception_exit,
     template_frame_guard_once
 )
 
@@ -57,7 +61,15 @@ def generateStatementsFrameCode(statement_sequence, emit, context):
     # Allow stacking of frame handles.
     old_frame_handle = context.getFrameHandle()
 
-    if guard_mode != "pass_through":
+    if guard_mode == "inline":
+        # In-lined functions have their own frame in the caller, so give it
+        # its own name.
+        context.setFrameHandle(context.allocateLabel("frame_inline"))
+
+        context.setExceptionEscape(
+            context.allocateLabel("frame_exception_exit")
+        )
+    elif guard_mode != "pass_through":
         if provider.isExpressionGeneratorObjectBody():
             context.setFrameHandle("generator->m_frame")
         elif provider.isExpressionCoroutineObjectBody():
@@ -116,6 +128,7 @@ def generateStatementsFrameCode(statement_sequence, emit, context):
             code_identifier       = statement_sequence.getCodeObjectHandle(
                 context = context
             ),
+            var_names             = statement_sequence.getVarNames(),
             codes                 = local_emit.codes,
             parent_exception_exit = parent_exception_exit,
             frame_exception_exit  = frame_exception_exit,
@@ -138,6 +151,7 @@ def generateStatementsFrameCode(statement_sequence, emit, context):
             code_identifier       = statement_sequence.getCodeObjectHandle(
                 context
             ),
+            var_names             = statement_sequence.getVarNames(),
             parent_exception_exit = parent_exception_exit,
             parent_return_exit    = parent_return_exit,
             frame_exception_exit  = frame_exception_exit,
@@ -145,6 +159,26 @@ def generateStatementsFrameCode(statement_sequence, emit, context):
             codes                 = local_emit.codes,
             needs_preserve        = needs_preserve,
             provider              = provider,
+            inlined_variables     = (),
+            emit                  = emit,
+            context               = context
+        )
+    elif guard_mode == "inline":
+        getFrameGuardInlineCode(
+            frame_identifier      = context.getFrameHandle(),
+            code_identifier       = statement_sequence.getCodeObjectHandle(
+                context
+            ),
+            parent_exception_exit = parent_exception_exit,
+            parent_return_exit    = parent_return_exit,
+            frame_exception_exit  = frame_exception_exit,
+            frame_return_exit     = frame_return_exit,
+            var_names             = statement_sequence.getVarNames(),
+            inlined_variables     = statement_sequence.getInlinedVariables(),
+            codes                 = local_emit.codes,
+            needs_preserve        = needs_preserve,
+            call_line_number      = statement_sequence.getParentReturnConsumer().\
+                                      getSourceReference().getLineNumber(),
             emit                  = emit,
             context               = context
         )
@@ -179,10 +213,11 @@ def generateStatementsFrameCode(statement_sequence, emit, context):
       context.getCleanupTempnames()
 
 
-def getFrameGuardHeavyCode(frame_identifier, code_identifier, codes,
+def getFrameGuardHeavyCode(frame_identifier, code_identifier, var_names, codes,
                            needs_preserve, parent_exception_exit,
                            parent_return_exit, frame_exception_exit,
-                           frame_return_exit, provider, emit, context):
+                           frame_return_exit, provider, inlined_variables,
+                           emit, context):
     # We really need this many parameters here. pylint: disable=R0913
 
     no_exception_exit = context.allocateLabel("frame_no_exception")
@@ -220,15 +255,22 @@ def getFrameGuardHeavyCode(frame_identifier, code_identifier, codes,
         )
 
     if frame_exception_exit is not None:
-        frame_locals_name, locals_code = getFrameLocalsUpdateCode(
-            provider = provider,
-            context  = context
-        )
+        if provider is not None:
+            locals_code = getFrameLocalsStoreCode(
+                provider  = provider,
+                var_names = var_names,
+                context   = context
+            )
+        else:
+            locals_code = getInlinedFrameLocalsStoreCode(
+                var_names         = var_names,
+                inlined_variables = inlined_variables,
+                context           = context
+            )
 
         emit(
             template_frame_guard_full_exception_handler % {
                 "frame_identifier"      : frame_identifier,
-                "frame_locals_name"     : frame_locals_name,
                 "store_frame_locals"    : indented(
                     locals_code,
                     2,
@@ -247,6 +289,52 @@ def getFrameGuardHeavyCode(frame_identifier, code_identifier, codes,
     emit("%s:;\n" % no_exception_exit)
 
 
+def getFrameGuardInlineCode(frame_identifier, code_identifier, var_names,
+                            inlined_variables, codes, needs_preserve,
+                            parent_exception_exit, parent_return_exit,
+                            frame_exception_exit, frame_return_exit,
+                            call_line_number, emit, context):
+    # We really need this many parameters here. pylint: disable=R0913
+
+    if frame_exception_exit is not None:
+        context.markAsNeedsExceptionVariables()
+
+        inline_exception_exit = context.allocateLabel("inline_exception_exit")
+    else:
+        inline_exception_exit = parent_exception_exit
+
+    # The locals of the in-lined function are temporary variables of the
+    # caller, these are given to the frame by their original names.
+    getFrameGuardHeavyCode(
+        frame_identifier      = frame_identifier,
+        code_identifier       = code_identifier,
+        var_names             = var_names,
+        parent_exception_exit = inline_exception_exit,
+        parent_return_exit    = parent_return_exit,
+        frame_exception_exit  = frame_exception_exit,
+        frame_return_exit     = frame_return_exit,
+        codes                 = codes,
+        needs_preserve        = needs_preserve,
+        provider              = None,
+        inlined_variables     = inlined_variables,
+        emit                  = emit,
+        context               = context
+    )
+
+    # The traceback entry of the caller is for the line of the call.
+    if frame_exception_exit is not None:
+        emit(
+            template_frame_guard_inline_exception_exit % {
+                "inline_exception_exit" : inline_exception_exit,
+                "call_line_number"      : call_line_number,
+                "parent_exception_exit" : parent_exception_exit,
+                "no_exception_exit"     : context.allocateLabel(
+                    "frame_inline_no_exception"
+                )
+            }
+        )
+
+
 def getFrameGuardOnceCode(frame_identifier, code_identifier,
                           codes, parent_exception_exit, parent_return_exit,
                           frame_exception_exit, frame_return_exit,
@@ -256,14 +344,8 @@ def getFrameGuardOnceCode(frame_identifier, code_identifier,
     # Used for modules only currently, but that ought to change.
     assert parent_return_exit is None and frame_return_exit is None
 
-    if not provider.isCompiledPythonModule():
-        _frame_locals_name, locals_code = getFrameLocalsUpdateCode(
-            provider = provider,
-            context  = context
-        )
-
-        # TODO: Not using locals, which is only OK for modules
-        assert False, locals_code
+    # TODO: Not using locals, which is only OK for modules
+    assert provider.isCompiledPythonModule(), provider
 
     context.addFrameDeclaration(
         template_frame_guard_frame_decl % {
@@ -291,9 +373,12 @@ def getFrameGuardOnceCode(frame_identifier, code_identifier,
     )
 
 
-def getFrameGuardLightCode(code_identifier, codes, parent_exception_exit,
-                           parent_return_exit, frame_exception_exit,
-                           frame_return_exit, provider, emit, context):
+def getFrameGuardLightCode(code_identifier, var_names, codes,
+                           parent_exception_exit, parent_return_exit,
+                           frame_exception_exit, frame_return_exit, provider,
+                           emit, context):
+    # We really need this many parameters here. pylint: disable=R0913
+
     context.markAsNeedsExceptionVariables()
 
     assert frame_exception_exit is not None
@@ -332,9 +417,10 @@ def getFrameGuardLightCode(code_identifier, codes, parent_exception_exit,
             }
         )
 
-    frame_locals_name, locals_code = getFrameLocalsUpdateCode(
-        provider = provider,
-        context  = context
+    locals_code = getFrameLocalsStoreCode(
+        provider  = provider,
+        var_names = var_names,
+        context   = context
     )
 
     if kind == "generator":
@@ -347,7 +433,6 @@ def getFrameGuardLightCode(code_identifier, codes, parent_exception_exit,
     emit(
         template % {
             "frame_identifier"      : "%s->m_frame" % kind,
-            "frame_locals_name"     : frame_locals_name,
             "store_frame_locals"    : indented(
                 locals_code,
                 2,
@@ -364,30 +449,36 @@ def getFrameGuardLightCode(code_identifier, codes, parent_exception_exit,
     )
 
 
-def getFrameLocalsUpdateCode(provider, context):
+def getFrameLocalsStoreCode(provider, var_names, context):
     locals_codes = Emission.SourceCodeCollector()
 
     context.setCurrentSourceCodeReference(
         provider.getSourceReference()
     )
 
-    frame_locals_name = context.allocateTempName(
-        "frame_locals",
-        unique = True
+    getDetachedFrameLocalsCode(
+        traceback_name = "exception_tb",
+        provider       = provider,
+        var_names      = var_names,
+        emit           = locals_codes.emit,
+        context        = context
     )
 
-    getLoadLocalsCode(
-        to_name  = frame_locals_name,
-        provider = provider,
-        mode     = "updated",
-        emit     = locals_codes.emit,
-        context  = context
-    )
+    return locals_codes.codes
+
 
-    if context.needsCleanup(frame_locals_name):
-        context.removeCleanupTempName(frame_locals_name)
+def getInlinedFrameLocalsStoreCode(var_names, inlined_variables, context):
+    locals_codes = Emission.SourceCodeCollector()
+
+    getInlinedFrameLocalsCode(
+        traceback_name    = "exception_tb",
+        var_names         = var_names,
+        inlined_variables = inlined_variables,
+        emit              = locals_codes.emit,
+        context           = context
+    )
 
-    return frame_locals_name, locals_codes.codes
+    return locals_codes.codes
 
 
 def generateFramePreserveExceptionCode(statement, emit, context):
@@ -32,11 +32,15 @@ from .ErrorCodes import (
     getMustNotGetHereCode,
     getReleaseCode
 )
-from .GeneratorCodes import getGeneratorObjectDeclCode
+from .GeneratorCodes import (
+    getGeneratorObjectDeclCode,
+    isStacklessGenerator
+)
 from .Helpers import generateExpressionCode
 from .Indentation import indented
 from .LabelCodes import getLabelCode
 from .ModuleCodes import getModuleAccessCode
+from .ProfileCodes import getProfileScopeCode
 from .PythonAPICodes import getReferenceExportCode
 from .templates.CodeTemplatesFunction import (
     function_dict_setup,
@@ -499,6 +503,21 @@ def getFunctionDirectDecl(function_identifier, closure_variables, file_scope):
     return result
 
 
+def getFunctionCreatedDecl(function_identifier, file_scope):
+    parameter_objects_decl = [
+        "Nuitka_FunctionObject const *self",
+        "PyObject **python_pars"
+    ]
+
+    result = template_function_direct_declaration % {
+        "file_scope"           : file_scope,
+        "function_identifier"  : function_identifier,
+        "direct_call_arg_spec" : ", ".join(parameter_objects_decl),
+    }
+
+    return result
+
+
 def getFunctionCode(context, function_identifier, parameters, closure_variables,
                     user_variables, temp_variables, function_codes, function_doc,
                     file_scope, needs_exception_exit):
@@ -557,6 +576,8 @@ def getFunctionCode(context, function_identifier, parameters, closure_variables,
 
     function_locals += context.getFrameDeclarations()
 
+    function_locals += getProfileScopeCode(context)
+
     # TODO: Could avoid this unless try/except or try/finally with returns
     # occur.
     if context.hasTempName("return_value"):
@@ -619,6 +640,7 @@ def getFunctionCode(context, function_identifier, parameters, closure_variables,
         }
     else:
         result += template_function_body % {
+            "file_scope"             : file_scope,
             "function_identifier"    : function_identifier,
             "parameter_objects_decl" : ", ".join(parameter_objects_decl),
             "function_locals"        : indented(function_locals),
@@ -641,6 +663,7 @@ def generateFunctionDeclCode(function_body):
     if function_body.isExpressionGeneratorObjectBody():
         return getGeneratorObjectDeclCode(
             function_identifier = function_body.getCodeName(),
+            stackless           = isStacklessGenerator(function_body)
         )
     elif function_body.isExpressionCoroutineObjectBody():
         return getCoroutineObjectDeclCode(
@@ -654,6 +677,13 @@ def generateFunctionDeclCode(function_body):
                 cross_module = False
             )
         )
+    elif function_body.needsCreation() and function_body.isModuleCallTarget():
+        return getFunctionCreatedDecl(
+            function_identifier = function_body.getCodeName(),
+            file_scope          = getExportScopeCode(
+                cross_module = function_body.isCrossModuleUsed()
+            )
+        )
     elif function_body.needsDirectCall():
         return getFunctionDirectDecl(
             function_identifier = function_body.getCodeName(),
@@ -19,16 +19,21 @@
 
 """
 
+from nuitka import Options
 from nuitka.PythonVersions import python_version
 
 from .ConstantCodes import getConstantCode
 from .ErrorCodes import (
+    getErrorVariableDeclarationInfos,
     getErrorVariableDeclarations,
+    getExceptionKeeperVariableInfos,
     getExceptionKeeperVariableNames,
+    getExceptionPreserverVariableInfos,
     getExceptionPreserverVariableNames
 )
 from .Indentation import indented
 from .LineNumberCodes import getErrorLineNumberUpdateCode
+from .ProfileCodes import generateGeneratorProfileEntryCode
 from .templates.CodeTemplatesFrames import template_generator_initial_throw
 from .templates.CodeTemplatesFunction import (
     function_dict_setup,
@@ -40,20 +45,65 @@ from .templates.CodeTemplatesGeneratorFunction import (
     template_generator_making_without_context,
     template_generator_noexception_exit,
     template_generator_return_exit,
+    template_generator_stackless_exception_exit,
+    template_generator_stackless_noexception_exit,
+    template_generator_stackless_return_exit,
+    template_genfunc_stackless_body_template,
+    template_genfunc_stackless_decl_template,
     template_genfunc_yielder_body_template,
     template_genfunc_yielder_decl_template
 )
-from .VariableCodes import getLocalVariableInitCode, getVariableCode
+from .VariableCodes import (
+    getLocalVariableDeclaration,
+    getLocalVariableInitCode,
+    getVariableCode
+)
+
+
+def isStacklessGenerator(generator_body):
+    """ Shall the generator be compiled to a resumable function.
+
+        These cannot delegate to other generators, the "yield from" needs
+        to suspend inside the helper, which only fibers can do.
+    """
+
+    return Options.shallMakeStacklessGenerators() and \
+           not generator_body.isUsingYieldFrom()
 
 
-def getGeneratorObjectDeclCode(function_identifier):
-    return template_genfunc_yielder_decl_template % {
+def getGeneratorObjectDeclCode(function_identifier, stackless):
+    if stackless:
+        template = template_genfunc_stackless_decl_template
+    else:
+        template = template_genfunc_yielder_decl_template
+
+    return template % {
         "function_identifier" : function_identifier,
     }
 
+
+def _getDeclarationCode(type_name, name):
+    return "%s%s%s" % (
+        type_name,
+        "" if type_name[-1] in "*&" else ' ',
+        name
+    )
+
+
 def getGeneratorObjectCode(context, function_identifier, user_variables,
                            temp_variables, function_codes, needs_exception_exit,
                            needs_generator_return):
+    if context.isStacklessGenerator():
+        return _getStacklessGeneratorObjectCode(
+            context                = context,
+            function_identifier    = function_identifier,
+            user_variables         = user_variables,
+            temp_variables         = temp_variables,
+            function_codes         = function_codes,
+            needs_exception_exit   = needs_exception_exit,
+            needs_generator_return = needs_generator_return
+        )
+
     function_locals = []
 
     for user_variable in user_variables + temp_variables:
@@ -97,7 +147,6 @@ def getGeneratorObjectCode(context, function_identifier, user_variables,
         if tmp_name.startswith("tmp_outline_return_value_"):
             function_locals.append("%s = NULL;" % tmp_name)
 
-
     if needs_exception_exit:
         generator_exit = template_generator_exception_exit % {}
     else:
@@ -114,6 +163,146 @@ def getGeneratorObjectCode(context, function_identifier, user_variables,
     }
 
 
+def _getStacklessLocals(context, user_variables, temp_variables):
+    """ Split the locals of a stackless generator into declarations.
+
+        Everything that may have to survive a yield goes into the heap
+        storage, and is accessed by reference. Only C temporaries of
+        statements that cannot suspend stay local variables.
+    """
+
+    # Type, name, and initial value of everything on the heap.
+    heap_locals = [
+        getLocalVariableDeclaration(
+            variable = variable
+        )
+        for variable in
+        user_variables + temp_variables
+    ]
+
+    if context.hasLocalsDict():
+        heap_locals.append(
+            ("PyObject *", "locals_dict", "PyDict_New()")
+        )
+
+    if context.needsExceptionVariables():
+        heap_locals.extend(getErrorVariableDeclarationInfos())
+
+    for keeper_index in range(1, context.getKeeperVariableCount()+1):
+        heap_locals.extend(getExceptionKeeperVariableInfos(keeper_index))
+
+    for preserver_id in context.getExceptionPreserverCounts():
+        heap_locals.extend(getExceptionPreserverVariableInfos(preserver_id))
+
+    yield_spanning_temp_names = context.getYieldSpanningTempNames()
+
+    function_var_decls = []
+
+    for tmp_name, tmp_type in context.getTempNameInfos():
+        # TODO: Could avoid these unless try/except or try/finally with
+        # returns occur.
+        if tmp_name == "tmp_generator_return":
+            init_value = "false"
+        elif tmp_name == "tmp_return_value" or \
+             tmp_name.startswith("tmp_outline_return_value_"):
+            init_value = "NULL"
+        else:
+            init_value = None
+
+        if init_value is not None or tmp_name in yield_spanning_temp_names:
+            heap_locals.append((tmp_type, tmp_name, init_value))
+        else:
+            function_var_decls.append(
+                "%s;" % _getDeclarationCode(tmp_type, tmp_name)
+            )
+
+    # Frame caches are static, and frames of inlined functions cannot be
+    # active during a yield.
+    function_var_decls += context.getFrameDeclarations()
+
+    heap_declarations = []
+    function_var_inits = []
+
+    for type_name, name, init_value in heap_locals:
+        type_name = type_name.rstrip()
+
+        heap_declarations.append(
+            "%s;" % _getDeclarationCode(type_name, name)
+        )
+        function_var_decls.append(
+            "NUITKA_MAY_BE_UNUSED %s = generator_heap->%s;" % (
+                _getDeclarationCode(
+                    _getDeclarationCode(type_name, '&'),
+                    name
+                ),
+                name
+            )
+        )
+
+        if init_value is not None:
+            function_var_inits.append(
+                "%s = %s;" % (name, init_value)
+            )
+
+    # Empty structs are not valid C.
+    if not heap_declarations:
+        heap_declarations.append("char dummy;")
+
+    return heap_declarations, function_var_decls, function_var_inits
+
+
+def _getStacklessGeneratorObjectCode(context, function_identifier,
+                                     user_variables, temp_variables,
+                                     function_codes, needs_exception_exit,
+                                     needs_generator_return):
+    heap_declarations, function_var_decls, function_var_inits = \
+      _getStacklessLocals(
+        context        = context,
+        user_variables = user_variables,
+        temp_variables = temp_variables
+    )
+
+    yield_return_labels = context.getYieldReturnLabels()
+
+    if yield_return_labels:
+        yield_return_dispatch = [
+            "switch( generator->m_yield_return_index )",
+            "{"
+        ]
+
+        for yield_return_label in yield_return_labels:
+            yield_return_dispatch.append(
+                "    case %s: goto %s;" % (
+                    yield_return_label.rsplit('_', 1)[1],
+                    yield_return_label
+                )
+            )
+
+        yield_return_dispatch.append('}')
+    else:
+        yield_return_dispatch = []
+
+    if needs_exception_exit:
+        generator_exit = template_generator_stackless_exception_exit % {}
+    else:
+        generator_exit = template_generator_stackless_noexception_exit % {
+            "function_identifier" : function_identifier
+        }
+
+    if needs_generator_return:
+        generator_exit += template_generator_stackless_return_exit % {}
+
+    return template_genfunc_stackless_body_template % {
+        "function_identifier"   : function_identifier,
+        "heap_declarations"     : indented(heap_declarations),
+        "function_var_decls"    : indented(function_var_decls),
+        "yield_return_dispatch" : indented(yield_return_dispatch),
+        "function_body"         : indented(function_codes),
+        "function_var_inits"    : indented(function_var_inits),
+        "generator_exit"        : generator_exit
+    }
+
+
 def generateMakeGeneratorObjectCode(to_name, expression, emit, context):
     generator_object_body = expression.getGeneratorRef().getFunctionBody()
 
@@ -147,6 +336,11 @@ def generateMakeGeneratorObjectCode(to_name, expression, emit, context):
         future_flags = generator_object_body.getSourceReference().getFutureSpec().asFlags()
     )
 
+    if isStacklessGenerator(generator_object_body):
+        generator_new = "Nuitka_Generator_NewStackless"
+    else:
+        generator_new = "Nuitka_Generator_New"
+
     if closure_variables:
         closure_copy = []
 
@@ -184,6 +378,7 @@ def generateMakeGeneratorObjectCode(to_name, expression, emit, context):
         emit(
             template_generator_making_with_context % {
                 "closure_making"         : closure_making,
+                "generator_new"          : generator_new,
                 "to_name"                : to_name,
                 "generator_identifier"   : generator_object_body.getCodeName(),
                 "generator_name_obj"     : generator_name_obj,
@@ -195,6 +390,7 @@ def generateMakeGeneratorObjectCode(to_name, expression, emit, context):
     else:
         emit(
             template_generator_making_without_context % {
+                "generator_new"          : generator_new,
                 "to_name"                : to_name,
                 "generator_identifier"   : generator_object_body.getCodeName(),
                 "generator_name_obj"     : generator_name_obj,
@@ -203,6 +399,13 @@ def generateMakeGeneratorObjectCode(to_name, expression, emit, context):
             }
         )
 
+    generateGeneratorProfileEntryCode(
+        to_name        = to_name,
+        generator_body = generator_object_body,
+        emit           = emit,
+        context        = context
+    )
+
     context.addCleanupTempName(to_name)
 
 
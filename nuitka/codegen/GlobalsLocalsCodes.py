@@ -152,10 +152,12 @@ def getLoadLocalsCode(to_name, provider, mode, emit, context):
             provider = provider,
         )
 
-        # TODO: Use DictCodes ?
+        # Sized for all variables, as e.g. for class bodies, most will be
+        # assigned.
         emit(
-            "%s = PyDict_New();" % (
+            "%s = _PyDict_NewPresized( %d );" % (
                 to_name,
+                len(local_list)
             )
         )
 
@@ -208,6 +210,131 @@ Py_INCREF( locals_dict );""" % (
             assert False
 
 
+def getDetachedFrameLocalsCode(traceback_name, provider, var_names, emit,
+                               context):
+    """ Give the local variables to the frame detached for a traceback.
+
+    Variables known to the code object of the frame only get referenced by
+    it, and become a dictionary only if "f_locals" is used, which normally
+    it is not, e.g. when the exception is caught and handled. Others, e.g.
+    closure variables, are put into a dictionary immediately.
+    """
+
+    if context.hasLocalsDict():
+        fast_variables = ()
+
+        frame_locals_name = context.allocateTempName(
+            "frame_locals",
+            unique = True
+        )
+
+        getLoadLocalsCode(
+            to_name  = frame_locals_name,
+            provider = provider,
+            mode     = "updated",
+            emit     = emit,
+            context  = context
+        )
+
+        # The detached frame takes the reference.
+        if context.needsCleanup(frame_locals_name):
+            context.removeCleanupTempName(frame_locals_name)
+    else:
+        local_list = _getLocalVariableList(
+            provider = provider
+        )
+
+        fast_variables = [
+            local_var
+            for local_var in
+            local_list
+            if local_var.getName() in var_names
+        ]
+
+        dict_variables = [
+            local_var
+            for local_var in
+            local_list
+            if local_var.getName() not in var_names
+        ]
+
+        if dict_variables:
+            frame_locals_name = context.allocateTempName(
+                "frame_locals",
+                unique = True
+            )
+
+            emit(
+                "%s = PyDict_New();" % (
+                    frame_locals_name,
+                )
+            )
+
+            for local_var in dict_variables:
+                _getVariableDictUpdateCode(
+                    target_name = frame_locals_name,
+                    variable    = local_var,
+                    is_dict     = True,
+                    initial     = True,
+                    emit        = emit,
+                    context     = context
+                )
+        else:
+            frame_locals_name = "NULL"
+
+    emit(
+        "detachFrame( %s, %s );" % (
+            traceback_name,
+            frame_locals_name
+        )
+    )
+
+    for local_var in fast_variables:
+        emit(
+            "storeDetachedFrameLocal( %s, %d, %s );" % (
+                traceback_name,
+                var_names.index(local_var.getName()),
+                getLocalVariableObjectAccessCode(
+                    variable = local_var,
+                    context  = context
+                )
+            )
+        )
+
+
+def getInlinedFrameLocalsCode(traceback_name, var_names, inlined_variables,
+                              emit, context):
+    """ Give the local variables of an in-lined function to its frame.
+
+    These are variables of the caller now, but the frame of the in-lined
+    function knows them by their names in its code object.
+    """
+
+    emit(
+        "detachFrame( %s, NULL );" % traceback_name
+    )
+
+    for variable_name, variable in inlined_variables:
+        if variable_name not in var_names:
+            continue
+
+        # Unused local variables got removed, e.g. after propagating a constant
+        # assigned in the function body, as for functions not in-lined.
+        if variable not in variable.getOwner().getTempVariables():
+            continue
+
+        emit(
+            "storeDetachedFrameLocal( %s, %d, %s );" % (
+                traceback_name,
+                var_names.index(variable_name),
+                getLocalVariableObjectAccessCode(
+                    variable = variable,
+                    context  = context
+                )
+            )
+        )
+
+
 def generateSetLocalsCode(statement, emit, context):
     new_locals_name = context.allocateTempName("set_locals", unique = True)
 
@@ -170,6 +170,13 @@ def setStatementDispatchDict(dispatch_dict):
 
 
 def generateStatementCode(statement, emit, context):
+    # Stackless generators keep temporaries of statements that may suspend
+    # in their heap storage, all others can be plain C locals.
+    if context.isStacklessGenerator():
+        old_yielding = context.setCurrentStatementYielding(
+            context.getOwner().isYieldingStatement(statement)
+        )
+
     try:
         statement_dispatch_dict[statement.kind](
             statement = statement,
@@ -188,3 +195,6 @@ def generateStatementCode(statement, emit, context):
             )
         )
         raise
+    finally:
+        if context.isStacklessGenerator():
+            context.setCurrentStatementYielding(old_yielding)
@@ -20,6 +20,7 @@
 That is import as expression, and star import.
 """
 
+from nuitka.PythonVersions import python_version
 
 from .ConstantCodes import getConstantCode
 from .ErrorCodes import (
@@ -30,6 +31,7 @@ from .ErrorCodes import (
 )
 from .GlobalsLocalsCodes import getLoadGlobalsCode, getLoadLocalsCode
 from .Helpers import generateExpressionCode, generateExpressionsCode
+from .LabelCodes import getLabelCode
 from .LineNumberCodes import emitLineNumberUpdateCode
 from .ModuleCodes import getModuleAccessCode
 
@@ -93,9 +95,8 @@ def generateBuiltinImportCode(to_name, expression, emit, context):
     )
 
 
-def getBuiltinImportCode(to_name, module_name, globals_name, locals_name,
-                         import_list_name, level_name, emit, context):
-
+def _getImportModuleCallCode(to_name, module_name, globals_name, locals_name,
+                             import_list_name, level_name, emit, context):
     emitLineNumberUpdateCode(emit, context)
 
     emit(
@@ -121,6 +122,20 @@ def getBuiltinImportCode(to_name, module_name, globals_name, locals_name,
         context       = context
     )
 
+
+def getBuiltinImportCode(to_name, module_name, globals_name, locals_name,
+                         import_list_name, level_name, emit, context):
+    _getImportModuleCallCode(
+        to_name          = to_name,
+        module_name      = module_name,
+        globals_name     = globals_name,
+        locals_name      = locals_name,
+        import_list_name = import_list_name,
+        level_name       = level_name,
+        emit             = emit,
+        context          = context
+    )
+
     getErrorExitCode(
         check_name = to_name,
         emit       = emit,
@@ -169,9 +184,83 @@ def getImportModuleHardCode(to_name, module_name, import_name, needs_check,
         )
 
 
+def _isAbsoluteImport(expression):
+    level = expression.getLevel()
+
+    if level == 0:
+        return True
+
+    # Python2 relative imports are attempted first in packages only.
+    if level == -1:
+        parent_module = expression.getParentModule()
+
+        return not parent_module.isCompiledPythonPackage() and \
+               parent_module.getPackage() is None
+
+    return False
+
+
+def _getEmbeddedModuleName(expression):
+    # Only Python2 allows to load our modules bypassing "__import__", and only
+    # top level ones, because those do not need a parent package loaded.
+    if python_version >= 300:
+        return None
+
+    module_name = expression.getModuleName()
+
+    if '.' in module_name or expression.getImportedModuleName() != module_name:
+        return None
+
+    return module_name
+
+
 def generateImportModuleCode(to_name, expression, emit, context):
     provider = expression.getParentVariableProvider()
 
+    module_name = expression.getModuleName()
+    import_list = expression.getImportList()
+
+    old_source_ref = context.setCurrentSourceCodeReference(expression.getSourceReference())
+
+    # Absolute imports of modules already loaded need no "__import__" call and
+    # no globals and locals for it, so do these only when really necessary.
+    if _isAbsoluteImport(expression):
+        embedded_name = _getEmbeddedModuleName(expression)
+
+        emitLineNumberUpdateCode(emit, context)
+
+        emit(
+            "%s = IMPORT_MODULE_FAST( %s, %s, %s, %s );" % (
+                to_name,
+                getConstantCode(
+                    constant = module_name,
+                    context  = context
+                ),
+                getConstantCode(
+                    constant = module_name.split('.')[0],
+                    context  = context
+                ),
+                getConstantCode(
+                    constant = import_list,
+                    context  = context
+                ),
+                '"%s"' % embedded_name if embedded_name is not None else "NULL"
+            )
+        )
+
+        import_done_label = context.allocateLabel("import_done")
+
+        emit(
+            "if ( %s != NULL || ERROR_OCCURRED() ) goto %s;" % (
+                to_name,
+                import_done_label
+            )
+        )
+    else:
+        import_done_label = None
+
+    context.setCurrentSourceCodeReference(old_source_ref)
+
     globals_name = context.allocateTempName("import_globals")
 
     getLoadGlobalsCode(
@@ -195,16 +284,16 @@ def generateImportModuleCode(to_name, expression, emit, context):
 
     old_source_ref = context.setCurrentSourceCodeReference(expression.getSourceReference())
 
-    getBuiltinImportCode(
+    _getImportModuleCallCode(
         to_name          = to_name,
         module_name      = getConstantCode(
-            constant = expression.getModuleName(),
+            constant = module_name,
             context  = context
         ),
         globals_name     = globals_name,
         locals_name      = locals_name,
         import_list_name = getConstantCode(
-            constant = expression.getImportList(),
+            constant = import_list,
             context  = context
         ),
         level_name       = getConstantCode(
@@ -215,6 +304,17 @@ def generateImportModuleCode(to_name, expression, emit, context):
         context          = context
     )
 
+    if import_done_label is not None:
+        getLabelCode(import_done_label, emit)
+
+    getErrorExitCode(
+        check_name = to_name,
+        emit       = emit,
+        context    = context
+    )
+
+    context.addCleanupTempName(to_name)
+
     context.setCurrentSourceCodeReference(old_source_ref)
 
 
@@ -66,6 +66,53 @@ def generateListCreationCode(to_name, expression, emit, context):
         )
 
 
+def getReservedLengthCode(expression, emit, context):
+    """ Code for the length to reserve, decided at compile time if possible.
+
+        Otherwise the length hint of the iterator is asked at run time.
+    """
+
+    reserved_length = expression.getReservedLength()
+
+    if reserved_length is not None:
+        return str(reserved_length)
+
+    iterator_name = context.allocateTempName("reserve_iterator")
+
+    generateExpressionCode(
+        to_name    = iterator_name,
+        expression = expression.getIterator(),
+        emit       = emit,
+        context    = context
+    )
+
+    # Only variable references are used, no reference to release.
+    assert not context.needsCleanup(iterator_name)
+
+    return "ITERATOR_LENGTH_HINT( %s )" % iterator_name
+
+
+def generateListReservedCreationCode(to_name, expression, emit, context):
+    emit(
+        "%s = MAKE_LIST_RESERVED( %s );" % (
+            to_name,
+            getReservedLengthCode(
+                expression = expression,
+                emit       = emit,
+                context    = context
+            )
+        )
+    )
+
+    getErrorExitCode(
+        check_name = to_name,
+        emit       = emit,
+        context    = context
+    )
+
+    context.addCleanupTempName(to_name)
+
+
 def generateListOperationAppendCode(statement, emit, context):
     list_arg_name = context.allocateTempName("append_list")
     generateExpressionCode(
@@ -85,11 +132,10 @@ def generateListOperationAppendCode(statement, emit, context):
 
     context.setCurrentSourceCodeReference(statement.getSourceReference())
 
-    res_name = context.getIntResName()
+    res_name = context.getBoolResName()
 
-    emit("assert( PyList_Check( %s ) );" % list_arg_name)
     emit(
-        "%s = PyList_Append( %s, %s );" % (
+        "%s = LIST_APPEND( %s, %s );" % (
             res_name,
             list_arg_name,
             value_arg_name
@@ -103,7 +149,7 @@ def generateListOperationAppendCode(statement, emit, context):
     )
 
     getErrorExitBoolCode(
-        condition = "%s == -1" % res_name,
+        condition = "%s == false" % res_name,
         emit      = emit,
         context   = context
     )
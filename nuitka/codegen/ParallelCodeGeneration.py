@@ -0,0 +1,161 @@
+#     Copyright 2016, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Parallel preparation of module code.
+
+Preparing the code of a module is the expensive part of code generation, and
+it is independent for each module, except for global things, namely the use
+of constants, the stream data, and the call helpers needed. Forked worker
+processes each do it with their own global context, and the results are then
+merged in the order of the modules. Stream data is only recorded by the workers
+and placed during the merge, so the outcome is the same as when preparing the
+modules one by one.
+"""
+
+import multiprocessing
+import os
+
+from nuitka.__past__ import iterItems
+
+from . import CallCodes, CodeGeneration, ConstantCodes
+from .BlobCodes import resolveStreamDataCode
+
+# The modules to work on, inherited by the forked worker processes.
+_worker_modules = ()
+
+
+def canPrepareModulesInParallel(job_limit, modules):
+    # Workers rely on inheriting the node tree, so there must be "fork".
+    return job_limit > 1 and len(modules) > 1 and hasattr(os, "fork")
+
+
+def _prepareModuleCodeInWorker(module_index):
+    module = _worker_modules[module_index]
+
+    # Start from clean global state for every module, and only report what
+    # this module added to it.
+    global_context = CodeGeneration.makeGlobalContext()
+    initial_use_counts = dict(global_context.getConstantUseCounts())
+
+    ConstantCodes.stream_data.clear()
+    ConstantCodes.stream_data.startRecording()
+    CallCodes.quick_calls_used.clear()
+    CallCodes.quick_instance_calls_used.clear()
+
+    template_values, module_context = CodeGeneration.prepareModuleCode(
+        global_context = global_context,
+        module         = module,
+        module_name    = module.getFullName()
+    )
+
+    use_counts = {}
+
+    for key, count in iterItems(global_context.getConstantUseCounts()):
+        count -= initial_use_counts.get(key, 0)
+
+        if count:
+            use_counts[key] = count
+
+    constants = dict(
+        (key, global_context.getConstants()[key])
+        for key in use_counts
+        if key.startswith("const_")
+    )
+
+    return (
+        template_values,
+        module_context.getMergeState(),
+        constants,
+        use_counts,
+        ConstantCodes.stream_data.getRecordedRequests(),
+        CallCodes.quick_calls_used,
+        CallCodes.quick_instance_calls_used
+    )
+
+
+def prepareModulesCode(global_context, modules, job_limit):
+    """ Prepare the code of modules with a pool of worker processes.
+
+        Returns a list of template values and module context pairs in the
+        order of the modules given.
+    """
+
+    # Using a global, to give the modules to the forked processes,
+    # pylint: disable=W0603
+    global _worker_modules
+
+    # Code names of functions are allocated on first use, and can be used
+    # across modules, so they must be decided before forking.
+    for module in modules:
+        for function_body in module.getUsedFunctions():
+            function_body.getCodeName()
+
+    _worker_modules = tuple(modules)
+
+    pool = multiprocessing.Pool(
+        processes = min(job_limit, len(modules))
+    )
+
+    result = []
+
+    try:
+        worker_results = pool.imap(
+            _prepareModuleCodeInWorker,
+            range(len(modules))
+        )
+
+        for module, worker_result in zip(modules, worker_results):
+            template_values, merge_state, constants, use_counts, \
+              stream_requests, quick_calls_used, quick_instance_calls_used = \
+              worker_result
+
+            global_context.mergeConstantUses(
+                constants  = constants,
+                use_counts = use_counts
+            )
+
+            stream_offsets = ConstantCodes.stream_data.replayRequests(
+                stream_requests
+            )
+
+            for key, value in iterItems(template_values):
+                if type(value) is str:
+                    template_values[key] = resolveStreamDataCode(
+                        code    = value,
+                        offsets = stream_offsets
+                    )
+
+            CallCodes.quick_calls_used.update(quick_calls_used)
+            CallCodes.quick_instance_calls_used.update(
+                quick_instance_calls_used
+            )
+
+            module_context = CodeGeneration.makeModuleContext(
+                global_context = global_context,
+                module         = module,
+                module_name    = module.getFullName()
+            )
+            module_context.setMergeState(merge_state)
+
+            result.append((template_values, module_context))
+    finally:
+        pool.close()
+        pool.join()
+
+        _worker_modules = ()
+
+    return result
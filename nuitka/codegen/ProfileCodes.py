@@ -0,0 +1,80 @@
+#     Copyright 2016, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Native profiling codes.
+
+With native profiling, every compiled function and generator has a static
+profile entry, that the runtime records calls and times in.
+"""
+
+from nuitka import Options
+
+
+def _getCStringCode(value):
+    return '"%s"' % value.replace('\\', "\\\\").replace('"', "\\\"")
+
+
+def _getProfileEntryIdentifier(function_body, context):
+    profile_entry_identifier = "profile_entry_" + function_body.getCodeName()
+
+    module_name = function_body.getParentModule().getFullName()
+    source_ref = function_body.getSourceReference()
+
+    context.addDeclaration(
+        profile_entry_identifier,
+        "static struct Nuitka_ProfileEntry %s = { %s, %s, %d };" % (
+            profile_entry_identifier,
+            _getCStringCode(
+                "%s.%s" % (module_name, function_body.getFunctionQualname())
+            ),
+            _getCStringCode(source_ref.getFilename()),
+            source_ref.getLineNumber()
+        )
+    )
+
+    return profile_entry_identifier
+
+
+def getProfileScopeCode(context):
+    """ Declaration that profiles the function until it returns. """
+
+    if not Options.isNativeProfile():
+        return []
+
+    return [
+        "Nuitka_ProfileScope profile_scope( &%s );" % (
+            _getProfileEntryIdentifier(
+                function_body = context.getFunction(),
+                context       = context
+            )
+        )
+    ]
+
+
+def generateGeneratorProfileEntryCode(to_name, generator_body, emit, context):
+    """ Make the generator object profile its resumptions. """
+
+    if Options.isNativeProfile():
+        emit(
+            "((Nuitka_GeneratorObject *)%s)->m_profile_entry = &%s;" % (
+                to_name,
+                _getProfileEntryIdentifier(
+                    function_body = generator_body,
+                    context       = context
+                )
+            )
+        )
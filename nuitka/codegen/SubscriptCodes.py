@@ -18,7 +18,8 @@
 """ Subscript related code generation.
 
 There is special handling for integer indexes, which can be dealt with
-much faster than general subscript lookups.
+much faster than general subscript lookups, and for constant string keys,
+which are typical for dictionaries, and have their hash value cached.
 """
 
 from nuitka import Options
@@ -32,6 +33,11 @@ from .Helpers import (
 )
 
 
+def _isStringSubscript(subscript):
+    return subscript.isExpressionConstantRef() and \
+           type(subscript.getConstant()) is str
+
+
 def generateAssignmentSubscriptCode(statement, emit, context):
     subscribed      = statement.getSubscribed()
     subscript       = statement.getSubscript()
@@ -94,6 +100,7 @@ def generateAssignmentSubscriptCode(statement, emit, context):
             target_name    = subscribed_name,
             subscript_name = subscript_name,
             value_name     = value_name,
+            string_key     = _isStringSubscript(subscript),
             emit           = emit,
             context        = context
         )
@@ -120,6 +127,7 @@ def generateDelSubscriptCode(statement, emit, context):
     getSubscriptDelCode(
         target_name    = target_name,
         subscript_name = subscript_name,
+        string_key     = _isStringSubscript(subscript),
         emit           = emit,
         context        = context
     )
@@ -138,6 +146,7 @@ def generateSubscriptLookupCode(to_name, expression, emit, context):
         to_name         = to_name,
         subscribed_name = subscribed_name,
         subscript_name  = subscript_name,
+        string_key      = _isStringSubscript(expression.getSubscript()),
         emit            = emit,
         context         = context
     )
@@ -169,11 +178,12 @@ def getIntegerSubscriptLookupCode(to_name, target_name, subscript_name,
     context.addCleanupTempName(to_name)
 
 
-def getSubscriptLookupCode(to_name, subscript_name, subscribed_name, emit,
-                           context):
+def getSubscriptLookupCode(to_name, subscript_name, subscribed_name,
+                           string_key, emit, context):
     emit(
-        "%s = LOOKUP_SUBSCRIPT( %s, %s );" % (
+        "%s = %s( %s, %s );" % (
             to_name,
+            "LOOKUP_SUBSCRIPT_STRING" if string_key else "LOOKUP_SUBSCRIPT",
             subscribed_name,
             subscript_name,
         )
@@ -225,12 +235,13 @@ def getIntegerSubscriptAssignmentCode(subscribed_name, subscript_name,
 
 
 def getSubscriptAssignmentCode(target_name, subscript_name, value_name,
-                               emit, context):
+                               string_key, emit, context):
     res_name = context.getBoolResName()
 
     emit(
-        "%s = SET_SUBSCRIPT( %s, %s, %s );" % (
+        "%s = %s( %s, %s, %s );" % (
             res_name,
+            "SET_SUBSCRIPT_STRING" if string_key else "SET_SUBSCRIPT",
             target_name,
             subscript_name,
             value_name,
@@ -250,12 +261,14 @@ def getSubscriptAssignmentCode(target_name, subscript_name, value_name,
     )
 
 
-def getSubscriptDelCode(target_name, subscript_name, emit, context):
+def getSubscriptDelCode(target_name, subscript_name, string_key, emit,
+                        context):
     res_name = context.getBoolResName()
 
     emit(
-        "%s = DEL_SUBSCRIPT( %s, %s );" % (
+        "%s = %s( %s, %s );" % (
             res_name,
+            "DEL_SUBSCRIPT_STRING" if string_key else "DEL_SUBSCRIPT",
             target_name,
             subscript_name,
         )
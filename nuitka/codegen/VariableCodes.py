@@ -197,7 +197,7 @@ def getVariableCode(context, variable):
 
 
 def getLocalVariableObjectAccessCode(context, variable):
-    assert variable.isLocalVariable()
+    assert variable.isLocalVariable() or variable.isTempVariable()
 
     code, is_cell = _getLocalVariableCode(context, variable)
 
@@ -207,7 +207,9 @@ def getLocalVariableObjectAccessCode(context, variable):
         return code
 
 
-def getLocalVariableInitCode(variable, init_from = None):
+def getLocalVariableDeclaration(variable, init_from = None):
+    """ The C type, name, and initial value of a local variable. """
+
     assert not variable.isModuleVariable()
 
     if variable.isSharedTechnically():
@@ -233,10 +235,13 @@ def getLocalVariableInitCode(variable, init_from = None):
 
         init_value = "%s" % init_from
 
-    return "%s%s = %s;" % (
-        type_name,
-        code_name,
-        init_value
+    return type_name, code_name, init_value
+
+
+def getLocalVariableInitCode(variable, init_from = None):
+    return "%s%s = %s;" % getLocalVariableDeclaration(
+        variable  = variable,
+        init_from = init_from
     )
 
 
@@ -348,19 +353,39 @@ def getVariableAssignmentCode(context, emit, variable, tmp_name, needs_release,
         assert False, variable
 
 
+def _getModuleVariableCacheName(var_name, context):
+    """ Name of the lookup cache for a module variable, shared by all reads. """
+
+    cache_name = "mvar_cache_" + var_name
+
+    if not context.hasDeclaration(cache_name):
+        context.addDeclaration(
+            cache_name,
+            "static Nuitka_DictLookupCache %s;" % cache_name
+        )
+
+    return cache_name
+
+
 def getVariableAccessCode(to_name, variable, needs_check, emit, context):
     # Many different cases, as this must be, pylint: disable=R0912
 
     assert isinstance(variable, Variables.Variable), variable
 
     if variable.isModuleVariable():
+        var_name = getConstantCode(
+            context  = context,
+            constant = variable.getName()
+        )
+
         emit(
             template_read_mvar_unclear % {
                 "module_identifier" : context.getModuleCodeName(),
                 "tmp_name"          : to_name,
-                "var_name"          : getConstantCode(
-                    context  = context,
-                    constant = variable.getName()
+                "var_name"          : var_name,
+                "cache_name"        : _getModuleVariableCacheName(
+                    var_name = var_name,
+                    context  = context
                 )
             }
         )
@@ -34,15 +34,42 @@ def generateYieldCode(to_name, expression, emit, context):
     # In handlers, we must preserve/restore the exception.
     preserve_exception = expression.isExceptionPreserving()
 
-    emit(
-        "%s = %s( generator, %s );" % (
-            to_name,
-            "YIELD" if not preserve_exception else "YIELD_IN_HANDLER",
-            value_name
-              if context.needsCleanup(value_name) else
-            "INCREASE_REFCOUNT( %s )" % value_name
+    yield_helper = "YIELD" if not preserve_exception else "YIELD_IN_HANDLER"
+
+    value_code = value_name \
+                   if context.needsCleanup(value_name) else \
+                 "INCREASE_REFCOUNT( %s )" % value_name
+
+    if context.isStacklessGenerator():
+        # Return the value, and continue at the label when resumed.
+        yield_return_label = context.allocateYieldReturnLabel()
+
+        emit(
+            "generator->m_yield_return_index = %s;" % (
+                yield_return_label.rsplit('_', 1)[1]
+            )
+        )
+        emit(
+            "return %s_STACKLESS( generator, %s );" % (
+                yield_helper,
+                value_code
+            )
+        )
+        emit("%s:;" % yield_return_label)
+        emit(
+            "%s = %s_STACKLESS_RESUME( generator, yield_return_value );" % (
+                to_name,
+                yield_helper
+            )
+        )
+    else:
+        emit(
+            "%s = %s( generator, %s );" % (
+                to_name,
+                yield_helper,
+                value_code
+            )
         )
-    )
 
     if context.needsCleanup(value_name):
         context.removeCleanupTempName(value_name)
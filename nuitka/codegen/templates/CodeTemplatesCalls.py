@@ -19,6 +19,32 @@
 
 """
 
+template_call_module_function_no_args = """\
+if ( Nuitka_Function_Check( %(called_name)s ) && ((Nuitka_FunctionObject *)%(called_name)s)->m_c_code == %(function_impl_identifier)s )
+{
+    %(to_name)s = Nuitka_CallFunctionDirect( %(called_name)s, %(function_impl_identifier)s, NULL, 0 );
+}
+else
+{
+    %(to_name)s = CALL_FUNCTION_NO_ARGS( %(called_name)s );
+}
+"""
+
+template_call_module_function_with_args = """\
+{
+    PyObject *call_args[] = { %(call_arg_names)s };
+
+    if ( Nuitka_Function_Check( %(called_name)s ) && ((Nuitka_FunctionObject *)%(called_name)s)->m_c_code == %(function_impl_identifier)s )
+    {
+        %(to_name)s = Nuitka_CallFunctionDirect( %(called_name)s, %(function_impl_identifier)s, call_args, %(args_count)d );
+    }
+    else
+    {
+        %(to_name)s = CALL_FUNCTION_WITH_ARGS%(args_count)d( %(called_name)s, call_args );
+    }
+}
+"""
+
 template_call_function_with_args_decl = """\
 extern PyObject *CALL_FUNCTION_WITH_ARGS%(args_count)d( PyObject *called, PyObject **args );"""
 
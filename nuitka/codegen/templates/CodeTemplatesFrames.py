@@ -97,8 +97,6 @@ RESTORE_FRAME_EXCEPTION( %(frame_identifier)s );
     if (needs_detach)
     {
 %(store_frame_locals)s
-
-        detachFrame( exception_tb, %(frame_locals_name)s );
     }
 }
 
@@ -113,6 +111,17 @@ Py_DECREF( %(frame_identifier)s );
 goto %(parent_exception_exit)s;
 """
 
+template_frame_guard_inline_exception_exit = """\
+goto %(no_exception_exit)s;
+
+%(inline_exception_exit)s:;
+// Exception from in-lined function, the caller frame is at the call.
+exception_lineno = %(call_line_number)d;
+goto %(parent_exception_exit)s;
+
+%(no_exception_exit)s:;
+"""
+
 # Frame for a module. TODO: Use it for functions called only once.
 # TODO: The once guard need not take a reference count in its frame class.
 template_frame_guard_once = """\
@@ -223,16 +232,17 @@ generator->m_frame->f_executing += 1;
 #if PYTHON_VERSION >= 300
 // Accept currently existing exception as the one to publish again when we
 // yield or yield from.
-
-PyThreadState *thread_state = PyThreadState_GET();
-
-generator->m_frame->f_exc_type = thread_state->exc_type;
-if ( generator->m_frame->f_exc_type == Py_None ) generator->m_frame->f_exc_type = NULL;
-Py_XINCREF( generator->m_frame->f_exc_type );
-generator->m_frame->f_exc_value = thread_state->exc_value;
-Py_XINCREF( generator->m_frame->f_exc_value );
-generator->m_frame->f_exc_traceback = thread_state->exc_traceback;
-Py_XINCREF( generator->m_frame->f_exc_traceback );
+{
+    PyThreadState *thread_state = PyThreadState_GET();
+
+    generator->m_frame->f_exc_type = thread_state->exc_type;
+    if ( generator->m_frame->f_exc_type == Py_None ) generator->m_frame->f_exc_type = NULL;
+    Py_XINCREF( generator->m_frame->f_exc_type );
+    generator->m_frame->f_exc_value = thread_state->exc_value;
+    Py_XINCREF( generator->m_frame->f_exc_value );
+    generator->m_frame->f_exc_traceback = thread_state->exc_traceback;
+    Py_XINCREF( generator->m_frame->f_exc_traceback );
+}
 #endif
 
 // Framed code:
@@ -337,8 +347,6 @@ if ( !EXCEPTION_MATCH_GENERATOR( exception_type ) )
     if (needs_detach)
     {
 %(store_frame_locals)s
-
-        detachFrame( exception_tb, %(frame_locals_name)s );
     }
 }
 
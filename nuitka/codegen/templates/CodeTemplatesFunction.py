@@ -84,7 +84,7 @@ static PyObject *MAKE_FUNCTION_%(function_identifier)s( %(function_creation_args
 """
 
 template_function_body = """\
-static PyObject *impl_%(function_identifier)s( %(parameter_objects_decl)s )
+%(file_scope)s PyObject *impl_%(function_identifier)s( %(parameter_objects_decl)s )
 {
     // Preserve error status for checks
 #ifndef __NUITKA_NO_ASSERT__
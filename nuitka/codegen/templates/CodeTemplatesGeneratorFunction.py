@@ -39,10 +39,52 @@ static void %(function_identifier)s_context( Nuitka_GeneratorObject *generator )
 }
 """
 
-template_generator_exception_exit = """\
-    RESTORE_ERROR_OCCURRED( PyExc_StopIteration, NULL, NULL );
-    Py_INCREF( PyExc_StopIteration );
+template_genfunc_stackless_decl_template = """\
+static PyObject *%(function_identifier)s_context( Nuitka_GeneratorObject *generator, PyObject *yield_return_value );
+"""
+
+template_genfunc_stackless_body_template = """
+struct %(function_identifier)s_locals {
+%(heap_declarations)s
+};
+
+static PyObject *%(function_identifier)s_context( Nuitka_GeneratorObject *generator, PyObject *yield_return_value )
+{
+    CHECK_OBJECT( (PyObject *)generator );
+    assert( Nuitka_Generator_Check( (PyObject *)generator ) );
+
+    // Values that must survive a yield live on the heap.
+    if ( generator->m_heap_storage == NULL )
+    {
+        generator->m_heap_storage = PyObject_Malloc( sizeof( struct %(function_identifier)s_locals ) );
+
+        if (unlikely( generator->m_heap_storage == NULL ))
+        {
+            PyErr_NoMemory();
+            return NULL;
+        }
+    }
+
+    struct %(function_identifier)s_locals *generator_heap = (struct %(function_identifier)s_locals *)generator->m_heap_storage;
+
+    // Local variable declarations.
+%(function_var_decls)s
+
+    // Resume at the yield we returned from.
+%(yield_return_dispatch)s
+
+    // Local variable initialization
+%(function_var_inits)s
+
+    // Actual function code.
+%(function_body)s
+
+%(generator_exit)s
+}
+"""
 
+template_generator_exception_exit = """\
+    // Finished, no "StopIteration" needed, see "_Nuitka_Generator_send".
     generator->m_yielded = NULL;
     return;
 
@@ -68,18 +110,65 @@ template_generator_return_exit = """\
     return;
 
     function_return_exit:
-#if PYTHON_VERSION < 330
-    RESTORE_ERROR_OCCURRED( PyExc_StopIteration, NULL, NULL );
-#else
-    RESTORE_ERROR_OCCURRED( PyExc_StopIteration, tmp_return_value, NULL );
+#if PYTHON_VERSION >= 330
+    // Only return values other than "None" need a "StopIteration" to carry
+    // them.
+    if ( tmp_return_value != Py_None )
+    {
+        RESTORE_ERROR_OCCURRED( PyExc_StopIteration, tmp_return_value, NULL );
+        Py_INCREF( PyExc_StopIteration );
+    }
+    else
+    {
+        Py_DECREF( tmp_return_value );
+    }
 #endif
-    Py_INCREF( PyExc_StopIteration );
     generator->m_yielded = NULL;
     return;
 """
 
+template_generator_stackless_exception_exit = """\
+    // Finished, no "StopIteration" needed, see "_Nuitka_Generator_send".
+    return NULL;
+
+    function_exception_exit:
+    assert( exception_type );
+    RESTORE_ERROR_OCCURRED( exception_type, exception_value, exception_tb );
+    return NULL;
+"""
+
+template_generator_stackless_noexception_exit = """\
+    // Return statement must be present.
+    NUITKA_CANNOT_GET_HERE( %(function_identifier)s );
+
+    return NULL;
+"""
+
+template_generator_stackless_return_exit = """\
+    // The above won't return, but we need to make it clear to the compiler
+    // as well, or else it will complain and/or generate inferior code.
+    assert(false);
+    return NULL;
+
+    function_return_exit:
+#if PYTHON_VERSION >= 330
+    // Only return values other than "None" need a "StopIteration" to carry
+    // them.
+    if ( tmp_return_value != Py_None )
+    {
+        RESTORE_ERROR_OCCURRED( PyExc_StopIteration, tmp_return_value, NULL );
+        Py_INCREF( PyExc_StopIteration );
+    }
+    else
+    {
+        Py_DECREF( tmp_return_value );
+    }
+#endif
+    return NULL;
+"""
+
 template_generator_making_without_context = """\
-%(to_name)s = Nuitka_Generator_New(
+%(to_name)s = %(generator_new)s(
     %(generator_identifier)s_context,
     %(generator_name_obj)s,
 #if PYTHON_VERSION >= 350
@@ -94,7 +183,7 @@ template_generator_making_without_context = """\
 template_generator_making_with_context = """\
 {
 %(closure_making)s
-    %(to_name)s = Nuitka_Generator_New(
+    %(to_name)s = %(generator_new)s(
         %(generator_identifier)s_context,
         %(generator_name_obj)s,
 #if PYTHON_VERSION >= 350
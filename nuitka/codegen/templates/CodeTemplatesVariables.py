@@ -180,10 +180,12 @@ template_read_shared_known = """\
 """
 
 # For module variable values, need to lookup in module dictionary or in
-# built-in dictionary.
+# built-in dictionary. The entry found in the module dictionary is remembered
+# in a lookup cache per variable, so repeated reads can skip the lookup, but
+# still read the current value.
 
 template_read_mvar_unclear = """\
-%(tmp_name)s = GET_STRING_DICT_VALUE( moduledict_%(module_identifier)s, (Nuitka_StringObject *)%(var_name)s );
+%(tmp_name)s = GET_STRING_DICT_VALUE_CACHED( moduledict_%(module_identifier)s, (Nuitka_StringObject *)%(var_name)s, &%(cache_name)s );
 
 if (unlikely( %(tmp_name)s == NULL ))
 {
@@ -29,11 +29,14 @@ Set a flag on return statements and functions that require the use of
 Set a flag on re-raises of exceptions if they can be simple throws or if they
 are in another context.
 
+Set a flag on calls that are expected to call a module level function, so
+they can call it directly.
+
 """
 
 from logging import warning
 
-from nuitka import Options, Tracing
+from nuitka import ModuleRegistry, Options, Tracing
 from nuitka.importing import StandardLibrary
 from nuitka.plugins.Plugins import Plugins
 from nuitka.PythonVersions import python_version
@@ -46,6 +49,126 @@ def isWhiteListedImport(node):
 
     return StandardLibrary.isStandardLibraryPath(module.getFilename())
 
+
+def _getModuleVariableAssignSource(variable):
+    """ The value a module variable is assigned once, if no other writes. """
+
+    if not variable.isModuleVariable():
+        return None
+
+    global_trace = variable.getGlobalVariableTrace()
+
+    if global_trace is None or \
+       global_trace.hasWritesOutsideOf(variable.getModule()):
+        return None
+
+    assign_trace = global_trace.getSingleAssignTrace()
+
+    if assign_trace is None:
+        return None
+
+    return assign_trace.getAssignNode().getAssignSource()
+
+
+def _getImportedModuleVariable(import_node, variable_name):
+    module_name = import_node.getImportedModuleName()
+
+    if module_name is None:
+        return None
+
+    module = ModuleRegistry.getDoneModuleFromName(module_name)
+
+    if module is None or \
+       not module.isCompiledPythonModule() or \
+       not module.hasVariableName(variable_name):
+        return None
+
+    return module.getVariableForReference(variable_name)
+
+
+def _getModuleFunctionBody(called):
+    """ Function body of a module level function a called value refers to.
+
+        This is "helper" or "module.helper", where the variables are assigned
+        only once, from a function definition or an import of a compiled
+        module. The value may still be changed at run time by other means,
+        e.g. through setting an attribute of the module, so the generated code
+        has to verify it.
+    """
+
+    if called.isExpressionVariableRef():
+        assign_source = _getModuleVariableAssignSource(called.getVariable())
+
+        if assign_source is not None and \
+           assign_source.isExpressionImportName() and \
+           assign_source.getModule().isExpressionImportModule():
+            variable = _getImportedModuleVariable(
+                import_node   = assign_source.getModule(),
+                variable_name = assign_source.getImportName()
+            )
+
+            if variable is None:
+                return None
+
+            assign_source = _getModuleVariableAssignSource(variable)
+    elif called.isExpressionAttributeLookup() and \
+         called.getLookupSource().isExpressionVariableRef():
+        assign_source = _getModuleVariableAssignSource(
+            called.getLookupSource().getVariable()
+        )
+
+        # Only "import module" gives the module itself, with packages the top
+        # level package is given.
+        if assign_source is None or \
+           not assign_source.isExpressionImportModule() or \
+           assign_source.getImportList() or \
+           '.' in assign_source.getModuleName():
+            return None
+
+        variable = _getImportedModuleVariable(
+            import_node   = assign_source,
+            variable_name = called.getAttributeName()
+        )
+
+        if variable is None:
+            return None
+
+        assign_source = _getModuleVariableAssignSource(variable)
+    else:
+        return None
+
+    if assign_source is None or \
+       not assign_source.isExpressionFunctionCreation():
+        return None
+
+    function_body = assign_source.getFunctionRef().getFunctionBody()
+
+    if not function_body.isExpressionFunctionBody() or \
+       function_body.getClosureVariables():
+        return None
+
+    return function_body
+
+
+def _getPositionalCallArgCount(call_node):
+    call_kw = call_node.getCallKw()
+
+    if call_kw is not None and \
+       not (call_kw.isExpressionConstantRef() and call_kw.getConstant() == {}):
+        return None
+
+    call_args = call_node.getCallArgs()
+
+    if call_args is None:
+        return 0
+    elif call_args.isExpressionConstantRef():
+        return len(call_args.getConstant())
+    elif call_args.isExpressionMakeTuple():
+        return len(call_args.getElements())
+    else:
+        return None
+
+
 class FinalizeMarkups(FinalizationVisitorBase):
     def onEnterNode(self, node):
         try:
@@ -144,6 +267,26 @@ of '--recurse-directory'.""" % (
 
                 node_module.addCrossUsedFunction(function_body)
 
+        if node.isExpressionCall():
+            function_body = _getModuleFunctionBody(node.getCalled())
+
+            if function_body is not None:
+                parameters = function_body.getParameters()
+
+                if parameters.getStarListArgumentName() is None and \
+                   parameters.getStarDictArgumentName() is None and \
+                   parameters.getKwOnlyParameterCount() == 0 and \
+                   parameters.getArgumentCount() == \
+                     _getPositionalCallArgCount(node):
+                    node.markAsModuleFunctionCall(function_body)
+                    function_body.markAsModuleCallTarget()
+
+                    node_module = node.getParentModule()
+                    if node_module is not function_body.getParentModule():
+                        function_body.markAsCrossModuleUsed()
+
+                        node_module.addCrossUsedFunction(function_body)
+
         if node.isStatementAssignmentVariable():
             target_var = node.getTargetVariableRef().getVariable()
             assign_source = node.getAssignSource()
@@ -173,3 +316,24 @@ of '--recurse-directory'.""" % (
                        last_search == search.getBlockExceptHandler():
                         node.markAsExceptionPreserving()
                         break
+
+        # Stackless generators cannot delegate to other generators.
+        if node.isExpressionYieldFrom():
+            provider = node.getParentVariableProvider()
+
+            if provider.isExpressionGeneratorObjectBody():
+                provider.markAsUsingYieldFrom()
+
+        # Stackless generators need to know which statements may suspend
+        # while their code is running, the enclosing ones do too.
+        if node.isExpressionYield():
+            provider = node.getParentVariableProvider()
+
+            if provider.isExpressionGeneratorObjectBody():
+                search = node.getParent()
+
+                while search is not provider:
+                    if search.isStatement():
+                        provider.markAsYieldingStatement(search)
+
+                    search = search.getParent()
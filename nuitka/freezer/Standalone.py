@@ -27,9 +27,11 @@ import shutil
 import subprocess
 import sys
 from logging import debug, info, warning
+from multiprocessing.pool import ThreadPool
 
 import marshal
-from nuitka import Options, SourceCodeReferences, Tracing
+
+from nuitka import Options, Reports, SourceCodeReferences, Tracing
 from nuitka.__past__ import iterItems
 from nuitka.importing import ImportCache
 from nuitka.importing.StandardLibrary import (
@@ -44,6 +46,8 @@ from nuitka.plugins.Plugins import Plugins
 from nuitka.PythonVersions import python_version
 from nuitka.tree.SourceReading import readSourceCodeFromFilename
 from nuitka.utils import Utils
+from nuitka.utils.ElfFiles import getElfDynamicInfo, removeElfRunPaths
+from nuitka.utils.SharedLibraries import getElfDLLDependencies
 
 from .DependsExe import getDependsExePath
 
@@ -189,6 +193,94 @@ def _detectedShlibFile(filename, module_name):
     module_names.add(module_name)
 
 
+def _runImportDetection(command):
+    import tempfile
+    tmp_file, tmp_filename = tempfile.mkstemp()
+
+    try:
+        if python_version >= 300:
+            command = command.encode("ascii")
+        os.write(tmp_file, command)
+        os.close(tmp_file)
+
+        process = subprocess.Popen(
+            args   = [sys.executable, "-s", "-S", "-v", tmp_filename],
+            stdout = subprocess.PIPE,
+            stderr = subprocess.PIPE,
+        )
+        _stdout, stderr = process.communicate()
+    finally:
+        os.unlink(tmp_filename)
+
+    # Don't let errors here go unnoticed.
+    if process.returncode != 0:
+        warning("There is a problem with detecting imports, CPython said:")
+        for line in stderr.split(b"\n"):
+            Tracing.printLine(line)
+        sys.exit("Error, please report the issue with above output.")
+
+    return stderr
+
+
+def _getImportDetectionCacheFilename(command):
+    # The outcome depends only on the Python installation used, and the
+    # command run, which contains the import path and the modules.
+    import hashlib
+
+    key = hashlib.md5()
+
+    for part in (sys.executable, repr(Utils.getFileModificationTime(
+                 sys.executable)), sys.version, command):
+        if python_version >= 300:
+            part = part.encode("utf-8")
+
+        key.update(part)
+
+    return Utils.joinpath(
+        Utils.getCacheDir(),
+        "early-imports",
+        key.hexdigest() + ".txt"
+    )
+
+
+def _getCachedImportDetection(command):
+    cache_filename = _getImportDetectionCacheFilename(command)
+
+    if not Utils.isFile(cache_filename):
+        return None
+
+    debug("Using cached import detection from '%s'.", cache_filename)
+
+    with open(cache_filename, "rb") as cache_file:
+        return cache_file.read()
+
+
+def _storeCachedImportDetection(command, stderr):
+    cache_filename = _getImportDetectionCacheFilename(command)
+
+    # Only the import lines are of interest to us.
+    lines = [
+        line
+        for line in
+        stderr.replace(b"\r", b"").split(b"\n")
+        if line.startswith(b"import ")
+    ]
+
+    try:
+        Utils.makePath(Utils.dirname(cache_filename))
+
+        # Write under another name first, so other processes never see it
+        # incomplete.
+        tmp_filename = "%s.%d.tmp" % (cache_filename, os.getpid())
+
+        with open(tmp_filename, "wb") as cache_file:
+            cache_file.write(b"\n".join(lines))
+
+        Utils.renameFile(tmp_filename, cache_filename)
+    except (OSError, IOError) as e:
+        warning("Cannot cache import detection in '%s': %s", cache_filename, e)
+
+
 def _detectImports(command, user_provided, technical):
     # This is pretty complicated stuff, with variants to deal with.
     # pylint: disable=R0912,R0914,R0915
@@ -217,30 +309,12 @@ def _detectImports(command, user_provided, technical):
     # is used.
     command = ("import sys; sys.path = %s;" % repr(reduced_path)) + command
 
-    import tempfile
-    tmp_file, tmp_filename = tempfile.mkstemp()
-
-    try:
-        if python_version >= 300:
-            command = command.encode("ascii")
-        os.write(tmp_file, command)
-        os.close(tmp_file)
+    stderr = _getCachedImportDetection(command)
 
-        process = subprocess.Popen(
-            args   = [sys.executable, "-s", "-S", "-v", tmp_filename],
-            stdout = subprocess.PIPE,
-            stderr = subprocess.PIPE,
-        )
-        _stdout, stderr = process.communicate()
-    finally:
-        os.unlink(tmp_filename)
+    if stderr is None:
+        stderr = _runImportDetection(command)
 
-    # Don't let errors here go unnoticed.
-    if process.returncode != 0:
-        warning("There is a problem with detecting imports, CPython said:")
-        for line in stderr.split(b"\n"):
-            Tracing.printLine(line)
-        sys.exit("Error, please report the issue with above output.")
+        _storeCachedImportDetection(command, stderr)
 
     result = []
 
@@ -481,7 +555,7 @@ def detectEarlyImports():
     return result
 
 
-def _detectBinaryPathDLLsLinuxBSD(binary_filename):
+def _detectBinaryPathDLLsLdd(binary_filename):
     # Ask "ldd" about the libraries being used by the created binary, these
     # are the ones that interest us.
     result = set()
@@ -521,21 +595,32 @@ def _detectBinaryPathDLLsLinuxBSD(binary_filename):
         if filename == "not found":
             continue
 
-        # Do not include kernel specific libraries.
-        if Utils.basename(filename).startswith(
-                (
-                    "libc.so.",
-                    "libpthread.so.",
-                    "libm.so.",
-                    "libdl.so."
-                )
-            ):
-            continue
-
         result.add(filename)
 
     return result
 
+
+def _detectBinaryPathDLLsLinuxBSD(binary_filename):
+    if Utils.getOS() == "Linux":
+        used_dlls = getElfDLLDependencies(binary_filename)
+    else:
+        used_dlls = _detectBinaryPathDLLsLdd(binary_filename)
+
+    # Do not include kernel specific libraries.
+    return set(
+        dll_filename
+        for dll_filename in
+        used_dlls
+        if not Utils.basename(dll_filename).startswith(
+            (
+                "libc.so.",
+                "libpthread.so.",
+                "libm.so.",
+                "libdl.so."
+            )
+        )
+    )
+
 def _detectBinaryPathDLLsMacOS(binary_filename):
     result = set()
 
@@ -760,12 +845,29 @@ def detectBinaryDLLs(binary_filename, package_name):
 def detectUsedDLLs(standalone_entry_points):
     result = {}
 
-    for binary_filename, package_name in standalone_entry_points:
-        used_dlls = detectBinaryDLLs(
+    def detectEntryPointDLLs(standalone_entry_point):
+        binary_filename, package_name = standalone_entry_point
+
+        return detectBinaryDLLs(
             binary_filename = binary_filename,
             package_name    = package_name
         )
 
+    # The detection is independent per binary, so do it in parallel. The
+    # order of results is that of the entry points.
+    pool = ThreadPool(Options.getJobLimit())
+
+    try:
+        entry_points_dlls = pool.map(
+            detectEntryPointDLLs,
+            standalone_entry_points
+        )
+    finally:
+        pool.close()
+        pool.join()
+
+    for (binary_filename, _package_name), used_dlls in \
+          zip(standalone_entry_points, entry_points_dlls):
         for dll_filename in used_dlls:
             # We want these to be absolute paths.
             assert Utils.isAbsolutePath(dll_filename), dll_filename
@@ -811,42 +913,15 @@ def fixupBinaryDLLPaths(binary_filename, is_exe, dll_map):
 
 
 def removeSharedLibraryRPATH(filename):
-    process = subprocess.Popen(
-        ["readelf", "-d", filename],
-        stdout = subprocess.PIPE,
-        stderr = subprocess.PIPE,
-        shell  = False
-    )
-
-    stdout, _stderr = process.communicate()
-    retcode = process.poll()
-
-    assert retcode == 0, filename
+    dynamic_info = getElfDynamicInfo(filename)
 
-    for line in stdout.split(b"\n"):
-        if b"RPATH" in line:
-            if Options.isShowInclusion():
-                info("Removing 'RPATH' setting from '%s'.", filename)
-
-            if not Utils.isExecutableCommand("chrpath"):
-                sys.exit(
-                    """\
-Error, needs 'chrpath' on your system, due to 'RPATH' settings in used shared
-libraries that need to be removed."""
-                )
-
-            os.chmod(filename, int("644", 8))
-            process = subprocess.Popen(
-                ["chrpath", "-d", filename],
-                stdout = subprocess.PIPE,
-                stderr = subprocess.PIPE,
-                shell  = False
-            )
-            process.communicate()
-            retcode = process.poll()
-            os.chmod(filename, int("444", 8))
+    if dynamic_info.rpath is not None or dynamic_info.runpath is not None:
+        if Options.isShowInclusion():
+            info("Removing 'RPATH' setting from '%s'.", filename)
 
-            assert retcode == 0, filename
+        os.chmod(filename, int("644", 8))
+        removeElfRunPaths(filename)
+        os.chmod(filename, int("444", 8))
 
 
 def copyUsedDLLs(dist_dir, standalone_entry_points):
@@ -857,25 +932,23 @@ def copyUsedDLLs(dist_dir, standalone_entry_points):
 
     dll_map = []
 
-    used_dlls = detectUsedDLLs(standalone_entry_points)
+    with Reports.withPhase("dll_detection"):
+        used_dlls = detectUsedDLLs(standalone_entry_points)
 
-    for dll_filename1, sources1 in tuple(iterItems(used_dlls)):
-        for dll_filename2, sources2 in tuple(iterItems(used_dlls)):
-            if dll_filename1 == dll_filename2:
-                continue
-
-            # Colliding basenames are an issue to us.
-            if Utils.basename(dll_filename1) != Utils.basename(dll_filename2):
-                continue
+    # Colliding basenames are an issue to us, group the DLLs by it.
+    dll_names = {}
 
-            # May already have been removed earlier
-            if dll_filename1 not in used_dlls:
-                continue
+    for dll_filename in sorted(used_dlls):
+        dll_names.setdefault(Utils.basename(dll_filename), []).append(
+            dll_filename
+        )
 
-            if dll_filename2 not in used_dlls:
-                continue
+    for dll_name, dll_filenames in sorted(iterItems(dll_names)):
+        dll_filename1 = dll_filenames[0]
+        sources1 = used_dlls[dll_filename1]
 
-            dll_name = Utils.basename(dll_filename1)
+        for dll_filename2 in dll_filenames[1:]:
+            sources2 = used_dlls[dll_filename2]
 
             if Options.isShowInclusion():
                 info(
@@ -889,8 +962,8 @@ def copyUsedDLLs(dist_dir, standalone_entry_points):
 
             # Check that if a DLL has the same name, if it's identical,
             # happens at least for OSC and Fedora 20.
-            import filecmp
-            if filecmp.cmp(dll_filename1, dll_filename2):
+            if Utils.getFileContentsHash(dll_filename1) == \
+               Utils.getFileContentsHash(dll_filename2):
                 del used_dlls[dll_filename2]
                 continue
 
@@ -66,6 +66,101 @@ def setMainScriptDirectory(main_dir):
     main_path = main_dir
 
 
+# Some platforms are case insensitive.
+case_sensitive = not sys.platform.startswith(("win", "cygwin", "darwin"))
+
+# Directory listings, read only once per directory during a compilation. The
+# values are the names in the directory, and these in normalized case for
+# lookups that need to be done like the file system would, so most checks for
+# module files become set lookups instead of system calls.
+_directory_listing_cache = {}
+
+# File kinds of paths present in a directory listing, so "stat" is done only
+# once for the names that exist.
+_path_kind_cache = {}
+
+_path_separators = tuple(
+    separator
+    for separator in
+    (os.sep, os.altsep)
+    if separator
+)
+
+
+def _getDirectoryListing(dirname):
+    key = Utils.normcase(dirname)
+
+    try:
+        return _directory_listing_cache[key]
+    except KeyError:
+        try:
+            names = os.listdir(dirname)
+        except OSError:
+            names = ()
+
+        result = (
+            frozenset(names),
+            frozenset(Utils.normcase(name) for name in names)
+        )
+
+        _directory_listing_cache[key] = result
+
+        return result
+
+
+def _getPathKind(path):
+    """ Kind of a path as "dir", "file" or None, using the listing cache. """
+
+    # Only directories can be named with a trailing separator, which would
+    # leave no name to look up in the listing.
+    if path.endswith(_path_separators) and \
+       path.rstrip("".join(_path_separators)):
+        result = _getPathKind(path.rstrip("".join(_path_separators)))
+
+        return result if result == "dir" else None
+
+    path = Utils.normpath(path)
+
+    dirname, filename = os.path.split(path)
+
+    # The root directory is in no listing.
+    if not filename:
+        return "dir" if Utils.isDir(path) else None
+
+    names, normcase_names = _getDirectoryListing(dirname or os.curdir)
+
+    if case_sensitive:
+        if filename not in names:
+            return None
+    else:
+        if Utils.normcase(filename) not in normcase_names:
+            return None
+
+    key = Utils.normcase(path)
+
+    try:
+        return _path_kind_cache[key]
+    except KeyError:
+        if Utils.isDir(path):
+            result = "dir"
+        elif Utils.isFile(path):
+            result = "file"
+        else:
+            result = None
+
+        _path_kind_cache[key] = result
+
+        return result
+
+
+def _isDirCached(path):
+    return _getPathKind(path) == "dir"
+
+
+def _isFileCached(path):
+    return _getPathKind(path) == "file"
+
+
 def isPackageDir(dirname):
     """ Decide if a directory is a package.
 
@@ -74,10 +169,10 @@ def isPackageDir(dirname):
         extra packages provided via "*.pth" file tricks by "site.py" loading.
     """
 
-    return Utils.isDir(dirname) and \
+    return _isDirCached(dirname) and \
            (
                python_version >= 330 or
-               Utils.isFile(Utils.joinpath(dirname, "__init__.py")) or
+               _isFileCached(Utils.joinpath(dirname, "__init__.py")) or
                isPreloadedPackagePath(dirname)
            )
 
@@ -283,9 +378,6 @@ def findModule(importing, module_name, parent_package, level, warn):
     return None, None, "not-found"
 
 
-# Some platforms are case insensitive.
-case_sensitive = not sys.platform.startswith(("win", "cygwin", "darwin"))
-
 def _findModuleInPath2(module_name, search_path):
     """ This is out own module finding low level implementation.
 
@@ -313,13 +405,13 @@ def _findModuleInPath2(module_name, search_path):
 
         # First, check for a package with an init file, that would be the
         # first choice.
-        if Utils.isDir(package_directory):
+        if _isDirCached(package_directory):
             for suffix in (".py", ".pyc"):
                 package_file_name = "__init__" + suffix
 
                 file_path = os.path.join(package_directory, package_file_name)
 
-                if Utils.isFile(file_path):
+                if _isFileCached(file_path):
                     candidates.add(
                         (entry, 1, package_directory)
                     )
@@ -333,7 +425,7 @@ def _findModuleInPath2(module_name, search_path):
         # Then, check out suffixes of all kinds.
         for suffix, _mode, _type in imp.get_suffixes():
             file_path = Utils.joinpath(entry, module_name + suffix)
-            if Utils.isFile(file_path):
+            if _isFileCached(file_path):
                 candidates.add(
                     (entry, 1, file_path)
                 )
@@ -358,7 +450,8 @@ def _findModuleInPath2(module_name, search_path):
             return candidates[0][2]
         else:
             for candidate in candidates:
-                dir_listing = os.listdir(candidate[0])
+                dir_listing, _normcase_dir_listing = \
+                  _getDirectoryListing(candidate[0])
 
                 for filename in dir_listing:
                     if Utils.joinpath(candidate[0], filename) == candidate[2]:
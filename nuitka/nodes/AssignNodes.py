@@ -30,8 +30,6 @@ the traces.
 
 """
 
-from nuitka import Options
-
 from .NodeBases import NodeBase, StatementChildrenHavingBase
 from .NodeMakingHelpers import (
     makeStatementExpressionOnlyReplacementNode,
@@ -56,13 +54,13 @@ class StatementAssignmentVariable(StatementChildrenHavingBase):
 
     kind = "STATEMENT_ASSIGNMENT_VARIABLE"
 
+    __slots__ = ("inplace_suspect", "variable_trace")
+
     named_children = (
         "source",
         "variable_ref"
     )
 
-    inplace_suspect = None
-
     def __init__(self, variable_ref, source, source_ref):
         assert variable_ref is not None, source_ref
         assert source is not None, source_ref
@@ -80,6 +78,8 @@ class StatementAssignmentVariable(StatementChildrenHavingBase):
 
         self.variable_trace = None
 
+        self.inplace_suspect = None
+
     def getDetail(self):
         variable_ref = self.getTargetVariableRef()
         variable = variable_ref.getVariable()
@@ -253,8 +253,7 @@ Side effects of assignments promoted to statements.""",
                                 # Something might be possible still.
 
                                 pass
-                        elif Options.isExperimental() and \
-                            source.isExpressionFunctionCreation() and \
+                        elif source.isExpressionFunctionCreation() and \
                             source.getFunctionRef().getFunctionBody().isExpressionFunctionBody() and \
                             not source.getDefaults() and  \
                             not source.getKwDefaults() and \
@@ -263,13 +262,15 @@ Side effects of assignments promoted to statements.""",
 
                             provider = self.getParentVariableProvider()
 
-                            if variable.isTempVariable() or \
-                               (not provider.isUnoptimized() and \
-                                not provider.isExpressionClassBody()):
+                            # Only calls, where the function is called
+                            # directly or in-lined instead.
+                            if last_trace.getDefiniteUsages() == \
+                                 last_trace.getDefiniteCallUsages() and \
+                               not last_trace.hasPotentialUsages() and \
+                               not last_trace.hasNameUsages():
 
-                                if last_trace.getDefiniteUsages() <= 1 and \
-                                   not last_trace.hasPotentialUsages() and \
-                                   not last_trace.hasNameUsages():
+                                if variable.isTempVariable() and \
+                                   last_trace.getDefiniteUsages() <= 1:
 
                                     if last_trace.getDefiniteUsages() == 1:
                                         self.variable_trace.setReplacementNode(
@@ -297,6 +298,27 @@ Side effects of assignments promoted to statements.""",
                                            self.getTargetVariableRef().getVariableName()
                                         )
                                     )
+                                elif variable.isLocalVariable() and \
+                                     last_trace.hasDefiniteUsages() and \
+                                     not provider.isExpressionClassBody() and \
+                                     not provider.isUnoptimized():
+                                    # Local variables are visible in the frame
+                                    # locals, e.g. of tracebacks, so the
+                                    # assignment is kept, and only the calls
+                                    # that get in-lined use the function. The
+                                    # function is still created then, and so
+                                    # cannot be called directly.
+                                    def replaceCall(usage):
+                                        result = source.makeClone()
+
+                                        if result.reserveInlineBudget(usage.getParentModule()):
+                                            return result
+                                        else:
+                                            return None
+
+                                    self.variable_trace.setReplacementNode(
+                                        replaceCall
+                                    )
                         else:
                             # More cases thinkable.
                             pass
@@ -331,6 +353,8 @@ class StatementDelVariable(StatementChildrenHavingBase):
     """
     kind = "STATEMENT_DEL_VARIABLE"
 
+    __slots__ = ("previous_trace", "tolerant", "variable_trace")
+
     named_children = (
         "variable_ref",
     )
@@ -452,6 +476,8 @@ class StatementReleaseVariable(NodeBase):
     """
     kind = "STATEMENT_RELEASE_VARIABLE"
 
+    __slots__ = ("variable", "variable_trace")
+
     def __init__(self, variable, source_ref):
         assert variable is not None, source_ref
 
@@ -527,6 +553,8 @@ class StatementReleaseVariable(NodeBase):
 class ExpressionTargetVariableRef(ExpressionVariableRef):
     kind = "EXPRESSION_TARGET_VARIABLE_REF"
 
+    __slots__ = ("variable_version",)
+
     # TODO: Remove default and correct argument order later.
     def __init__(self, variable_name, source_ref, variable = None, version = None):
         ExpressionVariableRef.__init__(self, variable_name, source_ref)
@@ -568,6 +596,8 @@ class ExpressionTargetVariableRef(ExpressionVariableRef):
 class ExpressionTargetTempVariableRef(ExpressionTempVariableRef):
     kind = "EXPRESSION_TARGET_TEMP_VARIABLE_REF"
 
+    __slots__ = ("variable_version",)
+
     def __init__(self, variable, source_ref):
         ExpressionTempVariableRef.__init__(self, variable, source_ref)
 
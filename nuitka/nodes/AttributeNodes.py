@@ -56,6 +56,8 @@ class StatementAssignmentAttribute(StatementChildrenHavingBase):
 
     kind = "STATEMENT_ASSIGNMENT_ATTRIBUTE"
 
+    __slots__ = ("attribute_name",)
+
     named_children = (
         "source",
         "expression"
@@ -120,6 +122,8 @@ class StatementDelAttribute(StatementChildrenHavingBase):
     """
     kind = "STATEMENT_DEL_ATTRIBUTE"
 
+    __slots__ = ("attribute_name",)
+
     named_children = (
         "expression",
     )
@@ -177,6 +181,8 @@ class ExpressionAttributeLookup(ExpressionChildrenHavingBase):
 
     kind = "EXPRESSION_ATTRIBUTE_LOOKUP"
 
+    __slots__ = ("attribute_name",)
+
     named_children = (
         "source",
     )
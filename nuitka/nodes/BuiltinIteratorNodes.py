@@ -166,6 +166,8 @@ class ExpressionBuiltinNext1(ExpressionBuiltinSingleArgBase):
 class ExpressionSpecialUnpack(ExpressionBuiltinNext1):
     kind = "EXPRESSION_SPECIAL_UNPACK"
 
+    __slots__ = ("count", "expected")
+
     def __init__(self, value, count, expected, source_ref):
         ExpressionBuiltinNext1.__init__(
             self,
@@ -193,6 +195,8 @@ class ExpressionSpecialUnpack(ExpressionBuiltinNext1):
 class StatementSpecialUnpackCheck(StatementChildrenHavingBase):
     kind = "STATEMENT_SPECIAL_UNPACK_CHECK"
 
+    __slots__ = ("count",)
+
     named_children = (
         "iterator",
     )
@@ -28,9 +28,26 @@ nodes.
 from .NodeBases import ExpressionChildrenHavingBase
 
 
-class ExpressionCall(ExpressionChildrenHavingBase):
+class ModuleFunctionCallMixin(object):
+    __slots__ = ()
+
+    def __init__(self):
+        # Set during finalization only, if the called value is expected to be
+        # a module level function, that can then be called directly.
+        self.module_function_body = None
+
+    def markAsModuleFunctionCall(self, function_body):
+        self.module_function_body = function_body
+
+    def getModuleFunctionBody(self):
+        return self.module_function_body
+
+
+class ExpressionCall(ModuleFunctionCallMixin, ExpressionChildrenHavingBase):
     kind = "EXPRESSION_CALL"
 
+    __slots__ = ("module_function_body",)
+
     named_children = (
         "called", "args", "kw"
     )
@@ -50,6 +67,8 @@ class ExpressionCall(ExpressionChildrenHavingBase):
             source_ref = source_ref
         )
 
+        ModuleFunctionCallMixin.__init__(self)
+
     getCalled = ExpressionChildrenHavingBase.childGetter("called")
     getCallArgs = ExpressionChildrenHavingBase.childGetter("args")
     getCallKw = ExpressionChildrenHavingBase.childGetter("kw")
@@ -74,9 +93,12 @@ class ExpressionCall(ExpressionChildrenHavingBase):
         return args.extractSideEffects() + kw.extractSideEffects()
 
 
-class ExpressionCallNoKeywords(ExpressionChildrenHavingBase):
+class ExpressionCallNoKeywords(ModuleFunctionCallMixin,
+                               ExpressionChildrenHavingBase):
     kind = "EXPRESSION_CALL_NO_KEYWORDS"
 
+    __slots__ = ("module_function_body",)
+
     named_children = (
         "called",
         "args"
@@ -95,6 +117,8 @@ class ExpressionCallNoKeywords(ExpressionChildrenHavingBase):
             source_ref = source_ref
         )
 
+        ModuleFunctionCallMixin.__init__(self)
+
     getCalled = ExpressionChildrenHavingBase.childGetter("called")
     getCallArgs = ExpressionChildrenHavingBase.childGetter("args")
 
@@ -119,9 +143,12 @@ class ExpressionCallNoKeywords(ExpressionChildrenHavingBase):
         return args.extractSideEffects()
 
 
-class ExpressionCallKeywordsOnly(ExpressionChildrenHavingBase):
+class ExpressionCallKeywordsOnly(ModuleFunctionCallMixin,
+                                 ExpressionChildrenHavingBase):
     kind = "EXPRESSION_CALL_KEYWORDS_ONLY"
 
+    __slots__ = ("module_function_body",)
+
     named_children = (
         "called",
         "kw"
@@ -140,6 +167,8 @@ class ExpressionCallKeywordsOnly(ExpressionChildrenHavingBase):
             source_ref = source_ref
         )
 
+        ModuleFunctionCallMixin.__init__(self)
+
     getCalled = ExpressionChildrenHavingBase.childGetter("called")
     getCallKw = ExpressionChildrenHavingBase.childGetter("kw")
 
@@ -166,9 +195,12 @@ class ExpressionCallKeywordsOnly(ExpressionChildrenHavingBase):
         return kw.extractSideEffects()
 
 
-class ExpressionCallEmpty(ExpressionChildrenHavingBase):
+class ExpressionCallEmpty(ModuleFunctionCallMixin,
+                          ExpressionChildrenHavingBase):
     kind = "EXPRESSION_CALL_EMPTY"
 
+    __slots__ = ("module_function_body",)
+
     named_children = (
         "called",
     )
@@ -184,6 +216,8 @@ class ExpressionCallEmpty(ExpressionChildrenHavingBase):
             source_ref = source_ref
         )
 
+        ModuleFunctionCallMixin.__init__(self)
+
     getCalled = ExpressionChildrenHavingBase.childGetter("called")
 
     def computeExpression(self, constraint_collection):
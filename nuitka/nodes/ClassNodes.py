@@ -23,6 +23,7 @@ The classes are are at the core of the language and have their complexities.
 
 from nuitka.PythonVersions import python_version
 
+from .BuiltinRefNodes import ExpressionBuiltinRef
 from .Checkers import checkStatementsSequenceOrNone
 from .FunctionNodes import ExpressionFunctionBodyBase
 from .IndicatorMixins import MarkLocalsDictIndicator
@@ -32,6 +33,8 @@ from .NodeBases import ChildrenHavingMixin, ExpressionChildrenHavingBase
 class ExpressionClassBody(ExpressionFunctionBodyBase, MarkLocalsDictIndicator):
     kind = "EXPRESSION_CLASS_BODY"
 
+    __slots__ = ("doc", "needs_locals_dict")
+
     named_children = (
         "body",
     )
@@ -117,6 +120,79 @@ class ExpressionClassBody(ExpressionFunctionBodyBase, MarkLocalsDictIndicator):
         return self.getBody().mayRaiseException(exception_type)
 
 
+def _getKnownValue(node):
+    """ Follow variable references to the value they were assigned.
+
+        Temporary variables and local variables of optimized functions are
+        followed by their current trace. Module variables are not, as other
+        modules may rebind them, e.g. as attributes of the module object, and
+        neither are variables of class bodies or functions with "exec".
+    """
+
+    while node.isExpressionVariableRef() or \
+          node.isExpressionTempVariableRef():
+        variable = node.getVariable()
+
+        if variable.isModuleVariable():
+            return None
+
+        if not variable.isTempVariable():
+            owner = variable.getOwner()
+
+            if not owner.isExpressionFunctionBody() or owner.isUnoptimized():
+                return None
+
+        assign_trace = node.variable_trace
+
+        if assign_trace is None or not assign_trace.isAssignTrace():
+            return None
+
+        node = assign_trace.getAssignNode().getAssignSource()
+
+    return node
+
+
+def _getKnownBases(bases):
+    """ The nodes of the bases tuple, if it is known, or None. """
+
+    bases = _getKnownValue(bases)
+
+    if bases is None:
+        return None
+    elif bases.isExpressionMakeTuple():
+        return bases.getElements()
+    elif bases.isExpressionConstantRef() and bases.getConstant() == ():
+        return ()
+    else:
+        return None
+
+
+def _isTypeInstance(node):
+    """ Is the value known to be a class with "type" as its metaclass.
+
+        These are the new style built-in types, and classes created by the
+        "type" built-in, which includes class statements with such bases only.
+    """
+
+    node = _getKnownValue(node)
+
+    if node is None:
+        return False
+    elif node.kind in ("EXPRESSION_BUILTIN_REF",
+                       "EXPRESSION_BUILTIN_EXCEPTION_REF"):
+        return type(node.getCompileTimeConstant()) is type
+    elif node.isExpressionBuiltinType3():
+        bases = _getKnownBases(node.getBases())
+
+        return bases is not None and all(
+            _isTypeInstance(base)
+            for base in
+            bases
+        )
+    else:
+        return False
+
+
 class ExpressionSelectMetaclass(ExpressionChildrenHavingBase):
     kind = "EXPRESSION_SELECT_METACLASS"
 
@@ -136,8 +212,34 @@ class ExpressionSelectMetaclass(ExpressionChildrenHavingBase):
         )
 
     def computeExpression(self, constraint_collection):
-        # TODO: Meta class selection is very computable, and should be done.
-        return self, None, None
+        bases = _getKnownBases(self.getBases())
+
+        if bases is None:
+            return self, None, None
+
+        if python_version < 300:
+            # The first base decides, without bases the "__metaclass__"
+            # module variable or old style classes are used.
+            if not bases or not _isTypeInstance(bases[0]):
+                return self, None, None
+        else:
+            metaclass = self.getMetaclass()
+
+            if metaclass.kind != "EXPRESSION_BUILTIN_REF" or \
+               metaclass.getBuiltinName() != "type":
+                return self, None, None
+
+            for base in bases:
+                if not _isTypeInstance(base):
+                    return self, None, None
+
+        new_node = ExpressionBuiltinRef(
+            builtin_name = "type",
+            source_ref   = self.getSourceReference()
+        )
+
+        return new_node, "new_builtin_ref", """\
+Metaclass selection resolved to 'type' from bases."""
 
     getMetaclass = ExpressionChildrenHavingBase.childGetter("metaclass")
     getBases = ExpressionChildrenHavingBase.childGetter("bases")
@@ -166,4 +268,8 @@ class ExpressionBuiltinType3(ExpressionChildrenHavingBase):
     def computeExpression(self, constraint_collection):
         # TODO: Should be compile time computable if bases and dict are.
 
+        # The class creation may raise, e.g. for bad bases, and runs the code
+        # of metaclasses of the bases.
+        constraint_collection.onExceptionRaiseExit(BaseException)
+
         return self, None, None
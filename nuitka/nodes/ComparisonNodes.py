@@ -32,6 +32,8 @@ from .NodeMakingHelpers import (
 class ExpressionComparison(ExpressionChildrenHavingBase):
     kind = "EXPRESSION_COMPARISON"
 
+    __slots__ = ("comparator",)
+
     named_children = (
         "left",
         "right"
@@ -125,6 +127,8 @@ Replaced negated comparison with inverse comparison."""
 
 
 class ExpressionComparisonIsIsNotBase(ExpressionComparison):
+    __slots__ = ("match_value",)
+
     def __init__(self, left, right, comparator, source_ref):
         ExpressionComparison.__init__(
             self,
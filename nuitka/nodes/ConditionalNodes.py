@@ -372,6 +372,8 @@ branches.""" % self.conditional_kind
 class ExpressionConditionalOR(ExpressionConditionalBoolBase):
     kind = "EXPRESSION_CONDITIONAL_OR"
 
+    __slots__ = ("conditional_kind",)
+
     def __init__(self, left, right, source_ref):
         ExpressionConditionalBoolBase.__init__(
             self,
@@ -386,6 +388,8 @@ class ExpressionConditionalOR(ExpressionConditionalBoolBase):
 class ExpressionConditionalAND(ExpressionConditionalBoolBase):
     kind = "EXPRESSION_CONDITIONAL_AND"
 
+    __slots__ = ("conditional_kind",)
+
     def __init__(self, left, right, source_ref):
         ExpressionConditionalBoolBase.__init__(
             self,
@@ -41,7 +41,7 @@ from .NodeMakingHelpers import (
 
 
 class ExpressionConstantRefBase(CompileTimeConstantExpressionMixin, NodeBase):
-    user_provided = False
+    __slots__ = ("computed_attribute", "constant", "user_provided")
 
     def __init__(self, constant, source_ref, user_provided = False):
         NodeBase.__init__(self, source_ref = source_ref)
@@ -51,9 +51,7 @@ class ExpressionConstantRefBase(CompileTimeConstantExpressionMixin, NodeBase):
 
         self.constant = constant
 
-        # Memory saving method, have the attribute only where necessary.
-        if user_provided:
-            self.user_provided = user_provided
+        self.user_provided = user_provided
 
         if not user_provided and isDebug():
             try:
@@ -106,8 +104,31 @@ class ExpressionConstantRefBase(CompileTimeConstantExpressionMixin, NodeBase):
 
     def computeExpression(self, constraint_collection):
         # Cannot compute any further, this is already the best.
+
+        if self.mayRaiseException(BaseException):
+            constraint_collection.onExceptionRaiseExit(MemoryError)
+
         return self, None, None
 
+    def mayRaiseException(self, exception_type):
+        # Containers with mutable values are copied by code creating all of
+        # them, which can run out of memory.
+        constant = self.constant
+        constant_type = type(constant)
+
+        if constant_type is dict:
+            values = constant.values()
+        elif constant_type in (list, tuple):
+            values = constant
+        else:
+            return False
+
+        return any(
+            isMutable(value)
+            for value in
+            values
+        )
+
     def computeExpressionCall(self, call_node, call_args, call_kw,
                               constraint_collection):
 
@@ -314,6 +335,9 @@ Iteration over constant %s changed to tuple.""" % type(self.constant).__name__
     def hasShapeDictionaryExact(self):
         return type(self.constant) is dict
 
+    def hasShapeTupleExact(self):
+        return type(self.constant) is tuple
+
 
 class ExpressionConstantNoneRef(ExpressionConstantRefBase):
     kind = "EXPRESSION_CONSTANT_NONE_REF"
@@ -32,6 +32,8 @@ from .NodeMakingHelpers import (
 
 class ExpressionMakeSequenceBase(SideEffectsFromChildrenMixin,
                                  ExpressionChildrenHavingBase):
+    __slots__ = ("sequence_kind",)
+
     named_children = (
         "elements",
     )
@@ -152,6 +154,9 @@ class ExpressionMakeTuple(ExpressionMakeSequenceBase):
     def getIterationLength(self):
         return len(self.getElements())
 
+    def hasShapeTupleExact(self):
+        return True
+
 
 class ExpressionMakeList(ExpressionMakeSequenceBase):
     kind = "EXPRESSION_MAKE_LIST"
@@ -236,3 +241,56 @@ class ExpressionMakeSet(ExpressionMakeSequenceBase):
 
         return iter_node, "new_expression", """\
 Iteration over set reduced to tuple."""
+
+
+class ExpressionMakeReservedBase(ExpressionChildrenHavingBase):
+    """ Empty container, with room for what an iterator is going to give.
+
+        Used as the start value of contractions, where all values of the
+        iterator will be added to it. The iterator is not used up, only its
+        length is asked for, at compile time if possible, otherwise at run
+        time from builtin iterators.
+    """
+
+    named_children = (
+        "iterator",
+    )
+
+    def __init__(self, iterator, source_ref):
+        ExpressionChildrenHavingBase.__init__(
+            self,
+            values     = {
+                "iterator" : iterator
+            },
+            source_ref = source_ref
+        )
+
+    getIterator = ExpressionChildrenHavingBase.childGetter("iterator")
+
+    def computeExpression(self, constraint_collection):
+        return self, None, None
+
+    def getReservedLength(self):
+        """ Length to reserve for, "None" if only known at run time. """
+
+        return self.getIterator().getIterationLength()
+
+    def mayHaveSideEffects(self):
+        return False
+
+    def mayRaiseException(self, exception_type):
+        return False
+
+    def mayBeNone(self):
+        return False
+
+
+class ExpressionMakeListReserved(ExpressionMakeReservedBase):
+    kind = "EXPRESSION_MAKE_LIST_RESERVED"
+
+
+class ExpressionMakeDictReserved(ExpressionMakeReservedBase):
+    kind = "EXPRESSION_MAKE_DICT_RESERVED"
+
+    def hasShapeDictionaryExact(self):
+        return True
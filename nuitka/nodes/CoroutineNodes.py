@@ -22,8 +22,6 @@ whose implementation lives here. The creation itself also lives here.
 
 """
 
-from nuitka.PythonVersions import python_version
-
 from .Checkers import checkStatementsSequenceOrNone
 from .FunctionNodes import ExpressionFunctionBodyBase
 from .IndicatorMixins import (
@@ -36,6 +34,8 @@ from .NodeBases import ChildrenHavingMixin, ExpressionChildrenHavingBase
 class ExpressionMakeCoroutineObject(ExpressionChildrenHavingBase):
     kind = "EXPRESSION_MAKE_COROUTINE_OBJECT"
 
+    __slots__ = ("code_object",)
+
     named_children = (
         "coroutine_ref",
     )
@@ -82,6 +82,14 @@ class ExpressionMakeCoroutineObject(ExpressionChildrenHavingBase):
 class ExpressionCoroutineObjectBody(ExpressionFunctionBodyBase,
                                     MarkLocalsDictIndicator,
                                     MarkUnoptimizedFunctionIndicator):
+    __slots__ = (
+        "exec_source_ref",
+        "needs_generator_return_exit",
+        "needs_locals_dict",
+        "unoptimized_locals",
+        "unqualified_exec"
+    )
+
     # We really want these many ancestors, as per design, we add properties via
     # base class mix-ins a lot, pylint: disable=R0901
     kind = "EXPRESSION_COROUTINE_OBJECT_BODY"
@@ -95,9 +103,6 @@ class ExpressionCoroutineObjectBody(ExpressionFunctionBodyBase,
         "body" : checkStatementsSequenceOrNone
     }
 
-    if python_version >= 340:
-        qualname_setup = None
-
     def __init__(self, provider, name, flags, source_ref):
         while provider.isExpressionOutlineBody():
             provider = provider.getParentVariableProvider()
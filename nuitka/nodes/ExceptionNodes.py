@@ -31,6 +31,8 @@ from .NodeMakingHelpers import makeStatementOnlyNodesFromExpressions
 class StatementRaiseException(StatementChildrenHavingBase):
     kind = "STATEMENT_RAISE_EXCEPTION"
 
+    __slots__ = ("reraise_finally",)
+
     named_children = (
         "exception_type",
         "exception_value",
@@ -232,6 +234,8 @@ Propagated implicit raise expression to raise statement."""
 class ExpressionBuiltinMakeException(ExpressionChildrenHavingBase):
     kind = "EXPRESSION_BUILTIN_MAKE_EXCEPTION"
 
+    __slots__ = ("exception_name",)
+
     named_children = (
         "args",
     )
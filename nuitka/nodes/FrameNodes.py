@@ -53,11 +53,19 @@ def checkFrameStatements(value):
 class StatementsFrame(StatementsSequence):
     kind = "STATEMENTS_FRAME"
 
+    __slots__ = (
+        "code_object",
+        "guard_mode",
+        "inlined_variables",
+        "needs_frame_exception_preserve"
+    )
+
     checkers = {
         "statements" : checkFrameStatements
     }
 
-    def __init__(self, statements, guard_mode, code_object, source_ref):
+    def __init__(self, statements, guard_mode, code_object, source_ref,
+                 inlined_variables = ()):
         StatementsSequence.__init__(
             self,
             statements = statements,
@@ -69,6 +77,10 @@ class StatementsFrame(StatementsSequence):
 
         self.code_object = code_object
 
+        # For in-lined functions, the variable names of the function and the
+        # variables of the caller now holding them.
+        self.inlined_variables = inlined_variables
+
         self.needs_frame_exception_preserve = False
 
     def getDetails(self):
@@ -77,6 +89,9 @@ class StatementsFrame(StatementsSequence):
             "code_object" : self.code_object
         }
 
+        if self.inlined_variables:
+            result["inlined_variables"] = self.inlined_variables
+
         result.update(StatementsSequence.getDetails(self))
 
         return result
@@ -114,11 +129,38 @@ class StatementsFrame(StatementsSequence):
     def getGuardMode(self):
         return self.guard_mode
 
+    def markAsInlined(self, inlined_variables):
+        """ The frame of a function body that was in-lined into a caller.
+
+            It is still a frame of its own, but with the code object of the
+            in-lined function, giving the given variables as its locals for
+            tracebacks.
+        """
+        assert self.guard_mode == "full"
+
+        self.guard_mode = "inline"
+
+        self.inlined_variables = tuple(
+            (variable.getName(), variable)
+            for variable in
+            inlined_variables
+        )
+
+    def getInlinedVariables(self):
+        return self.inlined_variables
+
+    def updateInlinedVariable(self, old_variable, new_variable):
+        self.inlined_variables = tuple(
+            (name, new_variable if variable is old_variable else variable)
+            for name, variable in
+            self.inlined_variables
+        )
+
     def needsExceptionFramePreservation(self):
         if python_version < 300:
-            preserving = ("full", "once")
+            preserving = ("full", "once", "inline")
         else:
-            preserving = ("full", "once", "generator")
+            preserving = ("full", "once", "generator", "inline")
 
         return self.guard_mode in preserving
 
@@ -131,7 +173,8 @@ class StatementsFrame(StatementsSequence):
         """
         provider = self.getParentVariableProvider()
 
-        if provider.isExpressionFunctionBody():
+        if provider.isExpressionFunctionBody() and \
+           self.guard_mode != "inline":
             self.code_object.updateLocalNames(
                 [
                     variable.getName() for
@@ -152,6 +195,19 @@ class StatementsFrame(StatementsSequence):
     def getCodeObjectHandle(self, context):
         provider = self.getParentVariableProvider()
 
+        # In-lined functions are not using the caller as their code object,
+        # and only optimized functions without closure get in-lined.
+        if self.guard_mode == "inline":
+            return context.getCodeObjectHandle(
+                code_object  = self.code_object,
+                filename     = self.getParentModule().getRunTimeFilename(),
+                line_number  = self.source_ref.getLineNumber(),
+                is_optimized = True,
+                new_locals   = True,
+                has_closure  = False,
+                future_flags = self.source_ref.getFutureSpec().asFlags()
+            )
+
         is_optimized = not provider.isCompiledPythonModule() and \
                        not provider.isExpressionClassBody() and \
                        not provider.hasLocalsDict()
@@ -180,6 +236,15 @@ class StatementsFrame(StatementsSequence):
     def computeStatementsSequence(self, constraint_collection):
         # The extraction of parts of the frame that can be moved before or after
         # the frame scope, takes it toll to complexity, pylint: disable=R0912
+
+        # The frame of an in-lined function gives the values of its parameters
+        # to tracebacks, so their assignments must be kept, even if the values
+        # got propagated.
+        for _variable_name, variable in self.inlined_variables:
+            constraint_collection.getVariableCurrentTrace(
+                variable = variable
+            ).addPotentialUsage()
+
         new_statements = []
 
         statements = self.getStatements()
@@ -29,11 +29,24 @@ Coroutines and generators live in their dedicated module and share base
 classes.
 """
 
-from nuitka import Options, VariableRegistry, Variables
-from nuitka.optimizations.FunctionInlining import convertFunctionCallToOutline
+from nuitka import VariableRegistry, Variables
+from nuitka.optimizations.FunctionInlining import (
+    consumeInlineBudget,
+    convertFunctionCallToOutline,
+    getFunctionInlineCost
+)
 from nuitka.PythonVersions import python_version
 from nuitka.tree.Extractions import updateVariableUsage
+from nuitka.tree.Helpers import (
+    makeDictCreationOrConstant,
+    makeSequenceCreationOrConstant
+)
 
+from .CallNodes import (
+    ExpressionCall,
+    ExpressionCallKeywordsOnly,
+    ExpressionCallNoKeywords
+)
 from .Checkers import checkStatementsSequenceOrNone
 from .IndicatorMixins import (
     MarkLocalsDictIndicator,
@@ -59,6 +72,16 @@ from .ParameterSpecs import ParameterSpec, TooManyArguments, matchCall
 
 class ExpressionFunctionBodyBase(ClosureTakerMixin, ChildrenHavingMixin,
                                  ClosureGiverNodeBase, ExpressionMixin):
+    __slots__ = (
+        "constraint_collection",
+        "early_closure",
+        "flags",
+        "non_local_declarations",
+        "provider",
+        "qualname_provider",
+        "qualname_setup",
+        "taken"
+    )
 
     def __init__(self, provider, name, code_prefix, is_class, flags, source_ref,
                  body = None):
@@ -95,6 +118,9 @@ class ExpressionFunctionBodyBase(ClosureTakerMixin, ChildrenHavingMixin,
         if python_version >= 340:
             self.qualname_provider = provider
 
+            # Set during tree building, resolved with the variable closure.
+            self.qualname_setup = None
+
         # Non-local declarations.
         self.non_local_declarations = []
 
@@ -301,6 +327,20 @@ class ExpressionFunctionBodyBase(ClosureTakerMixin, ChildrenHavingMixin,
 class ExpressionFunctionBody(ExpressionFunctionBodyBase,
                              MarkLocalsDictIndicator,
                              MarkUnoptimizedFunctionIndicator):
+    __slots__ = (
+        "cross_module_use",
+        "doc",
+        "exec_source_ref",
+        "module_call_target",
+        "needs_creation",
+        "needs_direct",
+        "needs_locals_dict",
+        "parameters",
+        "return_exception",
+        "unoptimized_locals",
+        "unqualified_exec"
+    )
+
     # We really want these many ancestors, as per design, we add properties via
     # base class mix-ins a lot, leading to many methods, pylint: disable=R0901
 
@@ -315,9 +355,6 @@ class ExpressionFunctionBody(ExpressionFunctionBodyBase,
         "body" : checkStatementsSequenceOrNone
     }
 
-    if python_version >= 340:
-        qualname_setup = None
-
     def __init__(self, provider, name, doc, parameters, flags, source_ref,
                  body = None):
         while provider.isExpressionOutlineBody():
@@ -355,6 +392,10 @@ class ExpressionFunctionBody(ExpressionFunctionBodyBase,
         # Indicator if the function is used outside of where it's defined.
         self.cross_module_use = False
 
+        # Indicator if the function is called directly by module function
+        # calls, these need its implementation declared.
+        self.module_call_target = False
+
         self.parameters = parameters
         self.parameters.setOwner(self)
 
@@ -435,6 +476,12 @@ class ExpressionFunctionBody(ExpressionFunctionBodyBase,
     def markAsCrossModuleUsed(self):
         self.cross_module_use = True
 
+    def isModuleCallTarget(self):
+        return self.module_call_target
+
+    def markAsModuleCallTarget(self):
+        self.module_call_target = True
+
     def computeExpressionCall(self, call_node, call_args, call_kw,
                               constraint_collection):
         # TODO: Until we have something to re-order the arguments, we need to
@@ -478,6 +525,8 @@ class ExpressionFunctionCreation(SideEffectsFromChildrenMixin,
 
     kind = "EXPRESSION_FUNCTION_CREATION"
 
+    __slots__ = ("code_object", "inline_reserved")
+
     # Note: The order of evaluation for these is a bit unexpected, but
     # true. Keyword defaults go first, then normal defaults, and annotations of
     # all kinds go last.
@@ -517,6 +566,8 @@ class ExpressionFunctionCreation(SideEffectsFromChildrenMixin,
 
         self.code_object = code_object
 
+        self.inline_reserved = False
+
     def getName(self):
         return self.getFunctionRef().getName()
 
@@ -639,11 +690,29 @@ class ExpressionFunctionCreation(SideEffectsFromChildrenMixin,
                 pairs         = ()
             )
 
-            values = [
-                args_dict[name]
-                for name in
-                call_spec.getParameterNames()
-            ]
+            values = []
+
+            for name in call_spec.getParameterNames():
+                value = args_dict[name]
+
+                # Star arguments are given as the elements, make them values.
+                if name == call_spec.getStarListArgumentName():
+                    value = makeSequenceCreationOrConstant(
+                        sequence_kind = "tuple",
+                        elements      = value,
+                        source_ref    = call_node.getSourceReference()
+                    )
+                elif name == call_spec.getStarDictArgumentName():
+                    # No keyword arguments are passed.
+                    assert not value
+
+                    value = makeDictCreationOrConstant(
+                        keys       = (),
+                        values     = (),
+                        source_ref = call_node.getSourceReference()
+                    )
+
+                values.append(value)
 
             result = ExpressionFunctionCall(
                 function   = self,
@@ -680,32 +749,33 @@ error""" % self.getName()
         # TODO: Ought to use values. If they are all constant, how about we
         # assume no cost, pylint: disable=W0613
 
-        if not Options.isExperimental():
-            return None
+        return getFunctionInlineCost(
+            function_body = self.getFunctionRef().getFunctionBody()
+        )
 
-        function_body = self.getFunctionRef().getFunctionBody()
+    def reserveInlineBudget(self, module):
+        """ Consume the in-line budget for a call of this function ahead.
 
-        if function_body.isExpressionGeneratorObjectBody():
-            # TODO: That's not even allowed, is it?
-            assert False
+            Returns True, if the call is going to be in-lined, which is needed
+            when the function is also created, and cannot be called directly.
+        """
 
-            return None
+        cost = self.getCallCost(None)
 
-        if function_body.isExpressionClassBody():
-            return None
+        if cost is not None and consumeInlineBudget(module, cost):
+            self.inline_reserved = True
 
-        # TODO: Lying for the demo, this is too limiting, but needs frames to
-        # be allowed twice in a context.
-        if function_body.mayRaiseException(BaseException):
-            return 60
+        return self.inline_reserved
 
-        return 20
+    def hasReservedInlineBudget(self):
+        return self.inline_reserved
 
-    def createOutlineFromCall(self, provider, values):
+    def createOutlineFromCall(self, provider, values, source_ref):
         return convertFunctionCallToOutline(
             provider     = provider,
             function_ref = self.getFunctionRef(),
-            values       = values
+            values       = values,
+            source_ref   = source_ref
         )
 
 
@@ -713,6 +783,8 @@ error""" % self.getName()
 class ExpressionFunctionRef(NodeBase, ExpressionMixin):
     kind = "EXPRESSION_FUNCTION_REF"
 
+    __slots__ = ("code_name", "function_body")
+
     def __init__(self, source_ref, function_body = None, code_name = None):
         assert function_body is not None or code_name is not None
         assert code_name != "None"
@@ -828,21 +900,85 @@ class ExpressionFunctionCall(ExpressionChildrenHavingBase):
             source_ref = source_ref
         )
 
+    def _makeStarArgCall(self, function_body, values):
+        """ Direct call for star argument helpers, if types are exact.
+
+            These helpers only convert star arguments that are not a tuple
+            or a dictionary, and then make the call, so if that is known not
+            to be needed, the values are passed on as they are.
+        """
+
+        args = None
+        kw = None
+
+        parameter_names = function_body.getParameters().getArgumentNames()
+
+        for parameter_name, value in zip(parameter_names[1:], values[1:]):
+            if parameter_name == "star_arg_list":
+                if not value.hasShapeTupleExact():
+                    return None
+
+                args = value
+            else:
+                assert parameter_name == "star_arg_dict", parameter_name
+
+                if not value.hasShapeDictionaryExact():
+                    return None
+
+                kw = value
+
+        if kw is None:
+            return ExpressionCallNoKeywords(
+                called     = values[0],
+                args       = args,
+                source_ref = self.getSourceReference()
+            )
+        elif args is None:
+            return ExpressionCallKeywordsOnly(
+                called     = values[0],
+                kw         = kw,
+                source_ref = self.getSourceReference()
+            )
+        else:
+            return ExpressionCall(
+                called     = values[0],
+                args       = args,
+                kw         = kw,
+                source_ref = self.getSourceReference()
+            )
+
     def computeExpression(self, constraint_collection):
         function = self.getFunction()
 
         values = self.getArgumentValues()
 
+        function_body = function.getFunctionRef().getFunctionBody()
+
+        if function_body.hasFlag("star_arg_call"):
+            result = self._makeStarArgCall(function_body, values)
+
+            if result is not None:
+                # The call is only computed in the next pass, until then it
+                # may do anything.
+                constraint_collection.onControlFlowEscape(self)
+                constraint_collection.onExceptionRaiseExit(BaseException)
+
+                return result, "new_expression", \
+                  "Call with star arguments of exact types made directly."
+
         # TODO: This needs some design.
         cost = function.getCallCost(values)
 
         if function.getFunctionRef().getFunctionBody().mayRaiseException(BaseException):
             constraint_collection.onExceptionRaiseExit(BaseException)
 
-        if cost is not None and cost < 50:
+        if cost is not None and \
+           (function.hasReservedInlineBudget() or \
+            consumeInlineBudget(self.getParentModule(), cost)):
             result = function.createOutlineFromCall(
-                provider = self.getParentVariableProvider(),
-                values   = values
+                provider   = self.getParentVariableProvider(),
+                values     = values,
+                source_ref = self.getSourceReference()
             )
 
             return result, "new_statements", "Function call in-lined."
@@ -871,6 +1007,9 @@ class ExpressionFunctionCall(ExpressionChildrenHavingBase):
 class ExpressionFunctionQualnameRef(CompileTimeConstantExpressionMixin,
                                     NodeBase):
     kind = "EXPRESSION_FUNCTION_QUALNAME_REF"
+
+    __slots__ = ("computed_attribute", "function_body")
+
     def __init__(self, function_body, source_ref):
         NodeBase.__init__(self, source_ref = source_ref)
         CompileTimeConstantExpressionMixin.__init__(self)
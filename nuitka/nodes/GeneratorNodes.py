@@ -22,8 +22,6 @@ whose implementation lives here. The creation itself also lives here.
 
 """
 
-from nuitka.PythonVersions import python_version
-
 from .Checkers import checkStatementsSequenceOrNone
 from .FunctionNodes import ExpressionFunctionBodyBase
 from .IndicatorMixins import (
@@ -37,6 +35,8 @@ from .ReturnNodes import StatementReturn
 class ExpressionMakeGeneratorObject(ExpressionChildrenHavingBase):
     kind = "EXPRESSION_MAKE_GENERATOR_OBJECT"
 
+    __slots__ = ("code_object",)
+
     named_children = (
         "generator_ref",
     )
@@ -78,6 +78,16 @@ class ExpressionMakeGeneratorObject(ExpressionChildrenHavingBase):
 class ExpressionGeneratorObjectBody(ExpressionFunctionBodyBase,
                                     MarkLocalsDictIndicator,
                                     MarkUnoptimizedFunctionIndicator):
+    __slots__ = (
+        "exec_source_ref",
+        "needs_generator_return_exit",
+        "needs_locals_dict",
+        "unoptimized_locals",
+        "unqualified_exec",
+        "uses_yield_from",
+        "yielding_statements"
+    )
+
     # We really want these many ancestors, as per design, we add properties via
     # base class mix-ins a lot, pylint: disable=R0901
     kind = "EXPRESSION_GENERATOR_OBJECT_BODY"
@@ -91,9 +101,6 @@ class ExpressionGeneratorObjectBody(ExpressionFunctionBodyBase,
         "body" : checkStatementsSequenceOrNone
     }
 
-    if python_version >= 340:
-        qualname_setup = None
-
     def __init__(self, provider, name, flags, source_ref):
         ExpressionFunctionBodyBase.__init__(
             self,
@@ -111,6 +118,12 @@ class ExpressionGeneratorObjectBody(ExpressionFunctionBodyBase,
 
         self.needs_generator_return_exit = False
 
+        self.uses_yield_from = False
+
+        # Statements that contain a yield, stackless generators must keep
+        # values used in their code on the heap.
+        self.yielding_statements = set()
+
     def getFunctionName(self):
         return self.name
 
@@ -129,6 +142,18 @@ class ExpressionGeneratorObjectBody(ExpressionFunctionBodyBase,
     def needsGeneratorReturnExit(self):
         return bool(self.needs_generator_return_exit)
 
+    def markAsUsingYieldFrom(self):
+        self.uses_yield_from = True
+
+    def isUsingYieldFrom(self):
+        return self.uses_yield_from
+
+    def markAsYieldingStatement(self, statement):
+        self.yielding_statements.add(statement)
+
+    def isYieldingStatement(self, statement):
+        return statement in self.yielding_statements
+
     @staticmethod
     def needsCreation():
         return False
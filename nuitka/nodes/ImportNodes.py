@@ -50,6 +50,14 @@ from .NodeBases import (
 class ExpressionImportModule(NodeBase, ExpressionMixin):
     kind = "EXPRESSION_IMPORT_MODULE"
 
+    __slots__ = (
+        "found",
+        "found_modules",
+        "import_list",
+        "level",
+        "module_name"
+    )
+
     # Set of modules, that we failed to import, and gave warning to the user
     # about it.
     _warned_about = set()
@@ -87,6 +95,10 @@ class ExpressionImportModule(NodeBase, ExpressionMixin):
     def getImportList(self):
         return self.import_list
 
+    def getImportedModuleName(self):
+        # Only set if recursed to, i.e. it is included in the compilation.
+        return self.found or None
+
     def getLevel(self):
         if self.level == 0:
             if self.source_ref.getFutureSpec().isAbsoluteImport():
@@ -238,6 +250,9 @@ class ExpressionImportModuleHard(NodeBase, ExpressionMixin):
 
     """
     kind = "EXPRESSION_IMPORT_MODULE_HARD"
+
+    __slots__ = ("import_name", "module_name")
+
     def __init__(self, module_name, import_name, source_ref):
         NodeBase.__init__(
             self,
@@ -397,6 +412,8 @@ class StatementImportStar(StatementChildrenHavingBase):
 class ExpressionImportName(ExpressionChildrenHavingBase):
     kind = "EXPRESSION_IMPORT_NAME"
 
+    __slots__ = ("import_name",)
+
     named_children = (
         "module",
     )
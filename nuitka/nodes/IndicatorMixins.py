@@ -24,7 +24,9 @@ used like this.
 """
 
 
-class MarkLocalsDictIndicator:
+class MarkLocalsDictIndicator(object):
+    __slots__ = ()
+
     def __init__(self):
         self.needs_locals_dict = False
 
@@ -35,13 +37,15 @@ class MarkLocalsDictIndicator:
         self.needs_locals_dict = True
 
 
-class MarkUnoptimizedFunctionIndicator:
+class MarkUnoptimizedFunctionIndicator(object):
     """ Mixin for indication that a function contains an exec or star import.
 
         These do not access global variables directly, but check a locals dictionary
         first, because they do.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         self.unoptimized_locals = False
         self.unqualified_exec = False
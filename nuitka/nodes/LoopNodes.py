@@ -32,6 +32,8 @@ from .NodeBases import NodeBase, StatementChildrenHavingBase
 class StatementLoop(StatementChildrenHavingBase):
     kind = "STATEMENT_LOOP"
 
+    __slots__ = ("loop_variables",)
+
     named_children = (
         "body",
     )
@@ -214,6 +216,19 @@ Removed useless loop with immediate 'break' statement."""
         # global variables. It may also raise.
         outer_constraint_collection.onExceptionRaiseExit(BaseException)
 
+        # Avoid cyclic imports, the helpers make try/finally statements, which
+        # use loop nodes.
+        from nuitka.optimizations.LoopInvariants import hoistLoopInvariants
+
+        result = hoistLoopInvariants(self)
+
+        if result is not None:
+            # The loop body changed, look ahead again.
+            self.loop_variables = None
+
+            return result, "new_statements", """\
+Loop invariant loads are done only once per loop."""
+
         return self, None, None
 
 
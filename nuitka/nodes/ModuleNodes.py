@@ -46,7 +46,9 @@ from .NodeBases import (
 )
 
 
-class PythonModuleMixin:
+class PythonModuleMixin(object):
+    __slots__ = ()
+
     def __init__(self, name, package_name):
         assert type(name) is str, type(name)
         assert '.' not in name, name
@@ -177,6 +179,17 @@ class CompiledPythonModule(PythonModuleMixin, ChildrenHavingMixin,
 
     kind = "COMPILED_PYTHON_MODULE"
 
+    __slots__ = (
+        "active_functions",
+        "constraint_collection",
+        "cross_used_functions",
+        "inline_growth",
+        "mode",
+        "package",
+        "package_name",
+        "variables"
+    )
+
     named_children = (
         "body",
         "functions"
@@ -215,6 +228,9 @@ class CompiledPythonModule(PythonModuleMixin, ChildrenHavingMixin,
         self.active_functions = OrderedSet()
         self.cross_used_functions = OrderedSet()
 
+        # Nodes added to the module by in-lining of function calls.
+        self.inline_growth = 0
+
         # SSA trace based information about the module.
         self.constraint_collection = None
 
@@ -365,6 +381,12 @@ class CompiledPythonModule(PythonModuleMixin, ChildrenHavingMixin,
     def getCrossUsedFunctions(self):
         return self.cross_used_functions
 
+    def getInlineGrowth(self):
+        return self.inline_growth
+
+    def addInlineGrowth(self, cost):
+        self.inline_growth += cost
+
     def getFunctionFromCodeName(self, code_name):
         for function in self.getFunctions():
             if function.getCodeName() == code_name:
@@ -476,6 +498,17 @@ class UncompiledPythonModule(PythonModuleMixin, NodeBase):
 
     kind = "UNCOMPILED_PYTHON_MODULE"
 
+    __slots__ = (
+        "bytecode",
+        "filename",
+        "name",
+        "package",
+        "package_name",
+        "technical",
+        "used_modules",
+        "user_provided"
+    )
+
     def __init__(self, name, package_name, bytecode, filename, user_provided,
                  technical, source_ref):
         NodeBase.__init__(
@@ -531,6 +564,8 @@ class UncompiledPythonPackage(UncompiledPythonModule):
 class PythonMainModule(CompiledPythonModule):
     kind = "PYTHON_MAIN_MODULE"
 
+    __slots__ = ("main_added",)
+
     def __init__(self, main_added, mode, source_ref):
         CompiledPythonModule.__init__(
             self,
@@ -588,6 +623,8 @@ class PythonInternalModule(CompiledPythonModule):
 class PythonShlibModule(PythonModuleMixin, NodeBase):
     kind = "PYTHON_SHLIB_MODULE"
 
+    __slots__ = ("name", "package", "package_name")
+
     avoid_duplicates = set()
 
     def __init__(self, name, package_name, source_ref):
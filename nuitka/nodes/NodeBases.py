@@ -45,6 +45,19 @@ class NodeCheckMetaClass(type):
         # This is in conflict with either PyDev or Pylint, pylint: disable=C0204
         assert len(bases) == len(set(bases))
 
+        # Nodes have no instance dictionary, all attributes are declared in
+        # slots. Children are stored in fixed slots too, create the ones not
+        # already provided by a base class.
+        slots = tuple(dictionary.get("__slots__", ()))
+
+        for child_name in dictionary.get("named_children", ()):
+            slot_name = "subnode_" + child_name
+
+            if not any(hasattr(base, slot_name) for base in bases):
+                slots += (slot_name,)
+
+        dictionary["__slots__"] = slots
+
         return type.__new__(cls, name, bases, dictionary)
 
     def __init__(cls, name, bases, dictionary):
@@ -86,13 +99,26 @@ class NodeCheckMetaClass(type):
 
 # For Python2/3 compatible source, we create a base class that has the metaclass
 # used and doesn't require making a choice.
-NodeMetaClassBase = NodeCheckMetaClass("NodeMetaClassBase", (object,), {})
+NodeMetaClassBase = NodeCheckMetaClass(
+    "NodeMetaClassBase",
+    (object,),
+    {"__slots__" : ()}
+)
 
 
 class NodeBase(NodeMetaClassBase):
     # String to identify the node class, to be consistent with its name.
     kind = None
 
+    # Present in every node, "code_generated" is only used to check that
+    # code is not generated twice for the same node.
+    __slots__ = (
+        "parent",
+        "source_ref",
+        "effective_source_ref",
+        "code_generated"
+    )
+
     @counted_init
     def __init__(self, source_ref):
         # The base class has no __init__ worth calling.
@@ -106,7 +132,9 @@ class NodeBase(NodeMetaClassBase):
 
         self.source_ref = source_ref
 
-    __del__ = counted_del()
+    # Only when counting, a "__del__" makes reference cycles uncollectable.
+    if Options.isShowMemory():
+        __del__ = counted_del()
 
     def __repr__(self):
         # This is to avoid crashes, because of bugs in detail.
@@ -195,7 +223,7 @@ class NodeBase(NodeMetaClassBase):
         """
         parent = self.getParent()
 
-        for key, value in parent.child_values.items():
+        for key, value in parent.getVisitableNodesNamed():
             if self is value:
                 return key
 
@@ -576,6 +604,8 @@ class NodeBase(NodeMetaClassBase):
 
 
 class CodeNodeBase(NodeBase):
+    __slots__ = ("code_name", "code_prefix", "name", "uids")
+
     def __init__(self, name, code_prefix, source_ref):
         assert name is not None
 
@@ -647,7 +677,9 @@ class CodeNodeBase(NodeBase):
         return self.uids[node.kind]
 
 
-class ChildrenHavingMixin:
+class ChildrenHavingMixin(object):
+    __slots__ = ()
+
     named_children = ()
 
     checkers = {}
@@ -659,11 +691,9 @@ class ChildrenHavingMixin:
         # but of course, might be put to None.
         assert set(values.keys()) == set(self.named_children)
 
-        self.child_values = dict(values)
-
-        for key, value in self.child_values.items():
+        for key, value in values.items():
             if key in self.checkers:
-                value = self.child_values[key] = self.checkers[key](value)
+                value = self.checkers[key](value)
 
             assert type(value) is not list, key
 
@@ -679,13 +709,15 @@ class ChildrenHavingMixin:
             else:
                 assert False, type(value)
 
+            setattr(self, "subnode_" + key, value)
+
     def setChild(self, name, value):
         """ Set a child value.
 
             Do not overload, provider self.checkers instead.
         """
         # Only accept legal child names
-        assert name in self.child_values, name
+        assert name in self.named_children, name
 
         # Lists as inputs are OK, but turn them into tuples.
         if type(value) is list:
@@ -702,25 +734,27 @@ class ChildrenHavingMixin:
             value.parent = self
 
         # Determine old value, and inform it about loosing its parent.
-        old_value = self.child_values[name]
+        old_value = getattr(self, "subnode_" + name)
 
         assert old_value is not value, value
 
-        self.child_values[name] = value
+        setattr(self, "subnode_" + name, value)
 
     def getChild(self, name):
         # Only accept legal child names
-        assert name in self.child_values, name
+        assert name in self.named_children, name
 
-        return self.child_values[name]
+        return getattr(self, "subnode_" + name)
 
     def hasChild(self, name):
-        return name in self.child_values
+        return name in self.named_children
 
     @staticmethod
     def childGetter(name):
+        attribute_name = "subnode_" + name
+
         def getter(self):
-            return self.getChild(name)
+            return getattr(self, attribute_name)
 
         return getter
 
@@ -735,7 +769,7 @@ class ChildrenHavingMixin:
         result = []
 
         for name in self.named_children:
-            value = self.child_values[ name ]
+            value = getattr(self, "subnode_" + name)
 
             if value is None:
                 pass
@@ -755,7 +789,7 @@ class ChildrenHavingMixin:
         result = []
 
         for name in self.named_children:
-            value = self.child_values[ name ]
+            value = getattr(self, "subnode_" + name)
 
             result.append((name, value))
 
@@ -770,7 +804,9 @@ class ChildrenHavingMixin:
         # Find the replaced node, as an added difficulty, what might be
         # happening, is that the old node is an element of a tuple, in which we
         # may also remove that element, by setting it to None.
-        for key, value in self.child_values.items():
+        for key in self.named_children:
+            value = getattr(self, "subnode_" + key)
+
             if value is None:
                 pass
             elif type(value) is tuple:
@@ -814,7 +850,9 @@ class ChildrenHavingMixin:
     def makeClone(self):
         values = {}
 
-        for key, value in self.child_values.items():
+        for key in self.named_children:
+            value = getattr(self, "subnode_" + key)
+
             assert type(value) is not list, key
 
             if value is None:
@@ -854,6 +892,14 @@ class ChildrenHavingMixin:
 
 class ClosureGiverNodeBase(CodeNodeBase):
     """ Mix-in for nodes that provide variables for closure takers. """
+
+    __slots__ = (
+        "preserver_id",
+        "providing",
+        "temp_scopes",
+        "temp_variables"
+    )
+
     def __init__(self, name, code_prefix, source_ref):
         CodeNodeBase.__init__(
             self,
@@ -964,9 +1010,11 @@ class ClosureGiverNodeBase(CodeNodeBase):
         return self.preserver_id
 
 
-class ClosureTakerMixin:
+class ClosureTakerMixin(object):
     """ Mixin for nodes that accept variables from closure givers. """
 
+    __slots__ = ()
+
     def __init__(self, provider, early_closure):
         assert provider.isParentVariableProvider(), provider
 
@@ -1041,7 +1089,9 @@ class ClosureTakerMixin:
         return self.early_closure
 
 
-class ExpressionMixin:
+class ExpressionMixin(object):
+    __slots__ = ()
+
     def isCompileTimeConstant(self):
         """ Has a value that we can use at compile time.
 
@@ -1091,6 +1141,10 @@ class ExpressionMixin:
         # Virtual method, pylint: disable=R0201,W0613
         return False
 
+    def canPredictIterationValues(self):
+        # Virtual method, pylint: disable=R0201
+        return False
+
     def getIterationLength(self):
         """ Value that "len" or "PyObject_Size" would give, if known.
 
@@ -1423,14 +1477,22 @@ class ExpressionMixin:
         # Virtual method, pylint: disable=R0201
         return False
 
+    def hasShapeTupleExact(self):
+        # Virtual method, pylint: disable=R0201
+        return False
+
+    def isMappingWithConstantStringKeys(self):
+        # Virtual method, pylint: disable=R0201
+        return False
+
 
 class CompileTimeConstantExpressionMixin(ExpressionMixin):
-    # TODO: Do this for all computations, do this in the base class of all
-    # nodes.
-    computed_attribute = None
+    __slots__ = ()
 
     def __init__(self):
-        pass
+        # TODO: Do this for all computations, do this in the base class of all
+        # nodes.
+        self.computed_attribute = None
 
     def isCompileTimeConstant(self):
         """ Has a value that we can use at compile time.
@@ -1598,6 +1660,8 @@ Predicted '%s' on compiled time constant values.""" % in_node.comparator
 
 
 class ExpressionSpecBasedComputationMixin(ExpressionMixin):
+    __slots__ = ()
+
     builtin_spec = None
 
     def computeBuiltinSpec(self, constraint_collection, given_values):
@@ -1685,6 +1749,8 @@ class StatementChildrenHavingBase(ChildrenHavingMixin, NodeBase):
 
 
 class ExpressionBuiltinNoArgBase(NodeBase, ExpressionMixin):
+    __slots__ = ("builtin_function",)
+
     def __init__(self, builtin_function, source_ref):
         NodeBase.__init__(
             self,
@@ -1737,7 +1803,9 @@ class ExpressionBuiltinSingleArgBase(ExpressionChildrenHavingBase,
             )
 
 
-class SideEffectsFromChildrenMixin:
+class SideEffectsFromChildrenMixin(object):
+    __slots__ = ()
+
     def mayHaveSideEffects(self):
         for child in self.getVisitableNodes():
             if child.mayHaveSideEffects():
@@ -29,8 +29,7 @@ from .NodeBases import ExpressionChildrenHavingBase
 
 
 class ExpressionOperationBase(ExpressionChildrenHavingBase):
-
-    inplace_suspect = False
+    __slots__ = ("inplace_suspect", "operator", "simulator")
 
     def __init__(self, operator, simulator, values, source_ref):
         ExpressionChildrenHavingBase.__init__(
@@ -41,6 +40,8 @@ class ExpressionOperationBase(ExpressionChildrenHavingBase):
 
         self.operator = operator
 
+        self.inplace_suspect = False
+
         self.simulator = simulator
 
     def markAsInplaceSuspect(self):
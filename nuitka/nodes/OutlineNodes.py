@@ -39,6 +39,8 @@ class ExpressionOutlineBody(ExpressionChildrenHavingBase):
 
     kind = "EXPRESSION_OUTLINE_BODY"
 
+    __slots__ = ("name", "provider", "temp_scope")
+
     named_children = (
         "body",
     )
@@ -128,7 +130,10 @@ class ExpressionOutlineBody(ExpressionChildrenHavingBase):
 
             return_collections = constraint_collection.getFunctionReturnCollections()
 
-        constraint_collection.mergeMultipleBranches(return_collections)
+        # An outline that never returns, e.g. because it always raises, has
+        # nothing to merge.
+        if return_collections:
+            constraint_collection.mergeMultipleBranches(return_collections)
 
         if body.getStatements()[0].isStatementReturn():
             return (
@@ -140,3 +145,6 @@ class ExpressionOutlineBody(ExpressionChildrenHavingBase):
         # TODO: Function outline may become too trivial to outline and return
         # collections may tell us something.
         return self, None, None
+
+    def mayRaiseException(self, exception_type):
+        return self.getBody().mayRaiseException(exception_type)
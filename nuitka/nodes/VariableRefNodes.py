@@ -38,6 +38,13 @@ from .NodeBases import ExpressionMixin, NodeBase
 class ExpressionVariableRef(NodeBase, ExpressionMixin):
     kind = "EXPRESSION_VARIABLE_REF"
 
+    __slots__ = (
+        "global_trace",
+        "variable",
+        "variable_name",
+        "variable_trace"
+    )
+
     def __init__(self, variable_name, source_ref, variable = None):
         NodeBase.__init__(
             self,
@@ -91,6 +98,9 @@ class ExpressionVariableRef(NodeBase, ExpressionMixin):
 
         self.variable = variable
 
+        # Replacing with another variable, e.g. during in-lining, renames too.
+        self.variable_name = variable.getName()
+
     def computeExpression(self, constraint_collection):
         variable = self.variable
 
@@ -194,6 +204,9 @@ Replaced read-only module attribute '__package__' with constant value."""
 
         constraint_collection.onControlFlowEscape(self)
 
+        # Calls allow to propagate created functions for in-lining.
+        self.variable_trace.addCallUsage()
+
         if self.global_trace is None and \
            self.variable_name in ("dir", "eval", "exec", "execfile", "locals", "vars") and \
            self.variable.isModuleVariable():
@@ -320,6 +333,9 @@ Check '%s' on dictionary lowered to dictionary '%s'.""" % (
     def hasShapeDictionaryExact(self):
         return self.variable_trace.hasShapeDictionaryExact()
 
+    def hasShapeTupleExact(self):
+        return self.variable_trace.hasShapeTupleExact()
+
     def onContentEscapes(self, constraint_collection):
         constraint_collection.onVariableContentEscapes(self.variable)
 
@@ -338,6 +354,8 @@ Check '%s' on dictionary lowered to dictionary '%s'.""" % (
 class ExpressionTempVariableRef(NodeBase, ExpressionMixin):
     kind = "EXPRESSION_TEMP_VARIABLE_REF"
 
+    __slots__ = ("variable", "variable_trace")
+
     def __init__(self, variable, source_ref):
         assert variable.isTempVariable()
 
@@ -402,6 +420,12 @@ class ExpressionTempVariableRef(NodeBase, ExpressionMixin):
         # TODO: See through the variable current trace.
         return None
 
+    def getIterationLength(self):
+        if self.variable_trace is None:
+            return None
+
+        return self.variable_trace.getIterationLength()
+
     # Python3 only, it updates temporary variables that are closure variables.
     def setVariable(self, variable):
         self.variable = variable
@@ -43,6 +43,8 @@ class ExpressionYield(ExpressionChildrenHavingBase):
 
     kind = "EXPRESSION_YIELD"
 
+    __slots__ = ("exception_preserving",)
+
     named_children = ("expression",)
 
     def __init__(self, expression, source_ref):
@@ -89,6 +91,8 @@ class ExpressionYieldFrom(ExpressionChildrenHavingBase):
     """
     kind = "EXPRESSION_YIELD_FROM"
 
+    __slots__ = ("exception_preserving",)
+
     named_children = ("expression",)
 
     def __init__(self, expression, source_ref):
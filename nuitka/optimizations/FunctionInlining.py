@@ -27,15 +27,94 @@ from nuitka.nodes.OutlineNodes import ExpressionOutlineBody
 from nuitka.tree.Extractions import updateVariableUsage
 from nuitka.tree.Helpers import makeStatementsSequence
 
+# Nodes that work with the locals of the running function, these would see the
+# ones of the caller after in-lining.
+_inline_blocking_kinds = frozenset(
+    (
+        "EXPRESSION_BUILTIN_LOCALS",
+        "EXPRESSION_BUILTIN_EVAL",
+        "EXPRESSION_BUILTIN_EXEC",
+        "EXPRESSION_BUILTIN_EXECFILE",
+        "STATEMENT_EXEC",
+        "STATEMENT_LOCALS_DICT_SYNC",
+        "STATEMENT_SET_LOCALS",
+    )
+)
+
+# Largest function body to in-line, in number of nodes.
+max_inline_cost = 60
+
+# Nodes a module may grow by through in-lining, so call sites in loops of many
+# small functions cannot blow it up.
+max_module_inline_growth = 2000
+
+
+def getFunctionInlineCost(function_body):
+    """ Cost of in-lining a function body, or None if that is not possible.
+
+        The cost is the number of nodes, counting stops once above the limit
+        for in-lining.
+    """
+
+    if not function_body.isExpressionFunctionBody() or \
+       function_body.isUnoptimized() or \
+       function_body.getClosureVariables():
+        return None
+
+    for variable in function_body.getLocalVariables():
+        if variable.isSharedTechnically():
+            return None
+
+    cost = 0
+    pending = [function_body.getBody()]
+
+    while pending:
+        node = pending.pop()
+
+        if node is None:
+            continue
+
+        if node.kind in _inline_blocking_kinds:
+            return None
+
+        # Nested functions that take closure from us, or do it dynamically,
+        # would need the variables to be moved too.
+        if node.isExpressionFunctionRef():
+            nested_body = node.getFunctionBody()
+
+            if nested_body.isUnoptimized() or \
+               nested_body.getClosureVariables():
+                return None
+
+        cost += 1
+
+        if cost > max_inline_cost:
+            break
+
+        pending.extend(node.getVisitableNodes())
+
+    return cost
+
+
+def consumeInlineBudget(module, cost):
+    """ Decide if a call of the given cost may be in-lined into the module. """
+
+    if cost > max_inline_cost:
+        return False
 
-def convertFunctionCallToOutline(provider, function_ref, values):
+    if module.getInlineGrowth() + cost > max_module_inline_growth:
+        return False
+
+    module.addInlineGrowth(cost)
+
+    return True
+
+
+def convertFunctionCallToOutline(provider, function_ref, values, source_ref):
     # This has got to have pretty man details, pylint: disable=R0914
 
     function_body = function_ref.getFunctionBody()
 
-    # TODO: Use the call location
-    source_ref = function_body.getSourceReference()
-
     outline_body = ExpressionOutlineBody(
         provider   = provider,
         name       = "inline",
@@ -45,6 +124,21 @@ def convertFunctionCallToOutline(provider, function_ref, values):
 
     clone = function_body.getBody().makeClone()
 
+    # The frames of the function keep giving their own traceback entries, but
+    # live in the C function of the caller now. Their locals get updated to the
+    # variables of the caller below, together with all other usages.
+    pending = [clone]
+
+    while pending:
+        node = pending.pop()
+
+        if node.isStatementsFrame() and node.getGuardMode() == "full":
+            node.markAsInlined(
+                inlined_variables = function_body.getLocalVariables()
+            )
+
+        pending.extend(node.getVisitableNodes())
+
     temp_scope = outline_body.getOutlineTempScope()
 
     translation = {}
@@ -67,6 +161,20 @@ def convertFunctionCallToOutline(provider, function_ref, values):
 
         translation[variable.getName()] = new_variable
 
+    # Temporary variables, e.g. of loops, or from earlier in-lining into the
+    # function, become ones of the caller too.
+    for variable in function_body.getTempVariables():
+        new_variable = outline_body.allocateTempVariable(
+            temp_scope = temp_scope,
+            name       = variable.getName()
+        )
+
+        updateVariableUsage(
+            clone,
+            old_variable = variable,
+            new_variable = new_variable
+        )
+
     statements = []
 
     argument_names = function_body.getParameters().getParameterNames()
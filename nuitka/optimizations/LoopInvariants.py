@@ -0,0 +1,323 @@
+#     Copyright 2016, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Loop-invariant loads.
+
+Loads of module variables and attribute chains of local variables, that nothing
+in a loop body can change, are done only once per loop execution. The value is
+kept in a temporary variable, and the first use does the load, so exceptions
+happen where they did, and loops that don't get there don't do it at all.
+"""
+
+from nuitka.containers.odict import OrderedDict
+from nuitka.nodes.AssignNodes import (
+    ExpressionTargetTempVariableRef,
+    StatementAssignmentVariable,
+    StatementReleaseVariable
+)
+from nuitka.nodes.ConditionalNodes import ExpressionConditional
+from nuitka.nodes.ConstantRefNodes import makeConstantRefNode
+from nuitka.nodes.OutlineNodes import ExpressionOutlineBody
+from nuitka.nodes.ReturnNodes import StatementReturn
+from nuitka.nodes.VariableRefNodes import ExpressionTempVariableRef
+from nuitka.tree.Extractions import getVariablesWritten
+from nuitka.tree.Helpers import makeStatementsSequenceFromStatements
+from nuitka.tree.ReformulationTryFinallyStatements import (
+    makeTryFinallyStatement
+)
+
+# Nodes that may be in a loop body, for loads to be invariant in it. None of
+# these calls anything, and they store only to variables, which must not be
+# module variables. The special methods of objects, e.g. for operators,
+# attribute lookups, or iteration, are assumed to not rebind module variables
+# or attributes.
+_loop_invariant_safe_kinds = frozenset(
+    (
+        "STATEMENTS_SEQUENCE",
+        "STATEMENT_ASSIGNMENT_VARIABLE",
+        "STATEMENT_CONDITIONAL",
+        "STATEMENT_DEL_VARIABLE",
+        "STATEMENT_EXPRESSION_ONLY",
+        "STATEMENT_LOOP",
+        "STATEMENT_LOOP_BREAK",
+        "STATEMENT_LOOP_CONTINUE",
+        "STATEMENT_PRESERVE_FRAME_EXCEPTION",
+        "STATEMENT_PUBLISH_EXCEPTION",
+        "STATEMENT_RAISE_EXCEPTION",
+        "STATEMENT_RAISE_EXCEPTION_IMPLICIT",
+        "STATEMENT_RELEASE_VARIABLE",
+        "STATEMENT_RESTORE_FRAME_EXCEPTION",
+        "STATEMENT_RETURN",
+        "STATEMENT_SPECIAL_UNPACK_CHECK",
+        "STATEMENT_TRY",
+        "EXPRESSION_ATTRIBUTE_LOOKUP",
+        "EXPRESSION_BUILTIN_ANONYMOUS_REF",
+        "EXPRESSION_BUILTIN_EXCEPTION_REF",
+        "EXPRESSION_BUILTIN_ISINSTANCE",
+        "EXPRESSION_BUILTIN_ITER1",
+        "EXPRESSION_BUILTIN_LEN",
+        "EXPRESSION_BUILTIN_MAKE_EXCEPTION",
+        "EXPRESSION_BUILTIN_NEXT1",
+        "EXPRESSION_BUILTIN_ORIGINAL_REF",
+        "EXPRESSION_BUILTIN_REF",
+        "EXPRESSION_BUILTIN_TYPE1",
+        "EXPRESSION_CAUGHT_EXCEPTION_TRACEBACK_REF",
+        "EXPRESSION_CAUGHT_EXCEPTION_TYPE_REF",
+        "EXPRESSION_CAUGHT_EXCEPTION_VALUE_REF",
+        "EXPRESSION_COMPARISON",
+        "EXPRESSION_COMPARISON_EXCEPTION_MATCH",
+        "EXPRESSION_COMPARISON_IN",
+        "EXPRESSION_COMPARISON_IS",
+        "EXPRESSION_COMPARISON_IS_NOT",
+        "EXPRESSION_COMPARISON_NOT_IN",
+        "EXPRESSION_CONDITIONAL",
+        "EXPRESSION_CONDITIONAL_AND",
+        "EXPRESSION_CONDITIONAL_OR",
+        "EXPRESSION_KEY_VALUE_PAIR",
+        "EXPRESSION_MAKE_DICT",
+        "EXPRESSION_MAKE_LIST",
+        "EXPRESSION_MAKE_SET",
+        "EXPRESSION_MAKE_TUPLE",
+        "EXPRESSION_OPERATION_BINARY",
+        "EXPRESSION_OPERATION_BINARY_INPLACE",
+        "EXPRESSION_OPERATION_NOT",
+        "EXPRESSION_OPERATION_UNARY",
+        "EXPRESSION_OUTLINE_BODY",
+        "EXPRESSION_RAISE_EXCEPTION",
+        "EXPRESSION_SIDE_EFFECTS",
+        "EXPRESSION_SLICE_LOOKUP",
+        "EXPRESSION_SPECIAL_UNPACK",
+        "EXPRESSION_SUBSCRIPT_LOOKUP",
+        "EXPRESSION_TARGET_TEMP_VARIABLE_REF",
+        "EXPRESSION_TARGET_VARIABLE_REF",
+        "EXPRESSION_TEMP_VARIABLE_REF",
+        "EXPRESSION_VARIABLE_REF",
+    )
+)
+
+
+def _isLoopBodySafe(node):
+    if node.kind not in _loop_invariant_safe_kinds and \
+       not node.isExpressionConstantRef():
+        return False
+
+    if node.kind == "EXPRESSION_TARGET_VARIABLE_REF" and \
+       node.getVariable().isModuleVariable():
+        return False
+
+    for child in node.getVisitableNodes():
+        if not _isLoopBodySafe(child):
+            return False
+
+    return True
+
+
+def _getLoadKey(node, variables_written):
+    """ Key of an invariant load, or None if it is not one.
+
+        Loads with the same key give the same value in the loop.
+    """
+
+    if node.kind == "EXPRESSION_VARIABLE_REF":
+        if node.getVariable().isModuleVariable():
+            return (node.getVariable(),)
+    elif node.kind == "EXPRESSION_ATTRIBUTE_LOOKUP":
+        source = node.getLookupSource()
+
+        if source.kind == "EXPRESSION_VARIABLE_REF" and \
+           not source.getVariable().isModuleVariable():
+            if source.getVariable() not in variables_written:
+                return (source.getVariable(), node.getAttributeName())
+        else:
+            source_key = _getLoadKey(source, variables_written)
+
+            if source_key is not None:
+                return source_key + (node.getAttributeName(),)
+
+    return None
+
+
+def _collectLoads(node, variables_written, loads):
+    # Outlines may be in-lined functions with their own variables, but also our
+    # own caching code, so never look into these.
+    if node.isExpressionOutlineBody():
+        return
+
+    key = _getLoadKey(node, variables_written)
+
+    # The outermost load only, the ones of its attribute chain come with it.
+    if key is not None:
+        loads.setdefault(key, []).append(node)
+    else:
+        for child in node.getVisitableNodes():
+            _collectLoads(child, variables_written, loads)
+
+
+def _makeCachedLoad(provider, load, flag_variable, value_variable):
+    source_ref = load.getSourceReference()
+
+    outline_body = ExpressionOutlineBody(
+        provider   = provider,
+        name       = "loop_invariant",
+        source_ref = source_ref
+    )
+
+    outline_body.setBody(
+        makeStatementsSequenceFromStatements(
+            StatementAssignmentVariable(
+                variable_ref = ExpressionTargetTempVariableRef(
+                    variable   = value_variable,
+                    source_ref = source_ref
+                ),
+                source       = load,
+                source_ref   = source_ref
+            ),
+            StatementAssignmentVariable(
+                variable_ref = ExpressionTargetTempVariableRef(
+                    variable   = flag_variable,
+                    source_ref = source_ref
+                ),
+                source       = makeConstantRefNode(
+                    constant   = True,
+                    source_ref = source_ref
+                ),
+                source_ref   = source_ref
+            ),
+            StatementReturn(
+                expression = ExpressionTempVariableRef(
+                    variable   = value_variable,
+                    source_ref = source_ref
+                ),
+                source_ref = source_ref
+            )
+        )
+    )
+
+    return ExpressionConditional(
+        condition      = ExpressionTempVariableRef(
+            variable   = flag_variable,
+            source_ref = source_ref
+        ),
+        expression_yes = ExpressionTempVariableRef(
+            variable   = value_variable,
+            source_ref = source_ref
+        ),
+        expression_no  = outline_body,
+        source_ref     = source_ref
+    )
+
+
+def hoistLoopInvariants(loop_node):
+    """ Make the invariant loads of a loop use cached values.
+
+        Returns the statements to replace the loop with, or None if there
+        are no invariant loads.
+    """
+
+    provider = loop_node.getParentVariableProvider()
+
+    # Module and class variables are written by assignments in the loop, and
+    # unoptimized functions by anything.
+    if not provider.isExpressionFunctionBody() or provider.isUnoptimized():
+        return None
+
+    loop_body = loop_node.getLoopBody()
+
+    if loop_body is None or not _isLoopBodySafe(loop_body):
+        return None
+
+    loads = OrderedDict()
+    _collectLoads(
+        node              = loop_body,
+        variables_written = getVariablesWritten(loop_body),
+        loads             = loads
+    )
+
+    if not loads:
+        return None
+
+    source_ref = loop_node.getSourceReference()
+
+    temp_scope = provider.allocateTempScope("loop_invariant")
+
+    init_statements = []
+    release_statements = []
+
+    for count, key_loads in enumerate(loads.values()):
+        flag_variable = provider.allocateTempVariable(
+            temp_scope = temp_scope,
+            name       = "loaded_%d" % (count+1)
+        )
+        value_variable = provider.allocateTempVariable(
+            temp_scope = temp_scope,
+            name       = "value_%d" % (count+1)
+        )
+
+        for load in key_loads:
+            # The load becomes part of the replacement, so remember where it
+            # was first.
+            parent = load.getParent()
+
+            parent.replaceChild(
+                old_node = load,
+                new_node = _makeCachedLoad(
+                    provider       = provider,
+                    load           = load,
+                    flag_variable  = flag_variable,
+                    value_variable = value_variable
+                )
+            )
+
+        init_statements.append(
+            StatementAssignmentVariable(
+                variable_ref = ExpressionTargetTempVariableRef(
+                    variable   = flag_variable,
+                    source_ref = source_ref
+                ),
+                source       = makeConstantRefNode(
+                    constant   = False,
+                    source_ref = source_ref
+                ),
+                source_ref   = source_ref
+            )
+        )
+
+        release_statements.append(
+            StatementReleaseVariable(
+                variable   = flag_variable,
+                source_ref = source_ref
+            )
+        )
+        release_statements.append(
+            StatementReleaseVariable(
+                variable   = value_variable,
+                source_ref = source_ref
+            )
+        )
+
+    return makeStatementsSequenceFromStatements(
+        *(
+            init_statements + [
+                makeTryFinallyStatement(
+                    provider   = provider,
+                    tried      = loop_node,
+                    final      = release_statements,
+                    source_ref = source_ref
+                )
+            ]
+        )
+    )
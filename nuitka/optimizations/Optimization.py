@@ -26,9 +26,9 @@ make others possible.
 import inspect
 from logging import debug, info
 
-from nuitka import ModuleRegistry, Options, VariableRegistry
+from nuitka import ModuleRegistry, Options, Reports, VariableRegistry
 from nuitka.importing import ImportCache
-from nuitka.optimizations import Graphs, TraceCollections
+from nuitka.optimizations import Graphs, TraceCollections, TreeShaking
 from nuitka.plugins.Plugins import Plugins
 from nuitka.Tracing import printLine
 from nuitka.utils import MemoryUsage
@@ -38,6 +38,9 @@ from .Tags import TagSet
 
 _progress = Options.isShowProgress()
 
+# Count of the optimization passes made, for the report.
+_pass_count = 0
+
 def _attemptRecursion(module):
     new_modules = module.attemptRecursion()
 
@@ -338,6 +341,10 @@ def makeOptimizationPass(initial_pass):
     """
     finished = True
 
+    # Singleton, pylint: disable=W0603
+    global _pass_count
+    _pass_count += 1
+
     ModuleRegistry.startTraversal()
 
     if _progress:
@@ -360,7 +367,12 @@ def makeOptimizationPass(initial_pass):
         global tag_set
         tag_set = TagSet()
 
-        changed = optimizeModule(current_module)
+        with Reports.withPhase(
+            "module_optimization",
+            module      = current_module.getFullName(),
+            pass_number = _pass_count
+        ):
+            changed = optimizeModule(current_module)
 
         if changed:
             finished = False
@@ -383,6 +395,43 @@ def makeOptimizationPass(initial_pass):
     return finished
 
 
+def _getUsedFunctionCount():
+    return sum(
+        len(module.getUsedFunctions())
+        for module in
+        ModuleRegistry.getDoneModules()
+        if module.isCompiledPythonModule()
+    )
+
+
+def _shakeTree():
+    if _progress:
+        info("Tree shaking:")
+
+    function_count = _getUsedFunctionCount()
+
+    removed = []
+
+    # Removing functions can make others unused, so repeat until nothing
+    # more is found.
+    while True:
+        newly_removed = TreeShaking.shakeTree()
+
+        if not newly_removed:
+            break
+
+        removed += newly_removed
+
+        finished = False
+        while not finished:
+            finished = makeOptimizationPass(True)
+
+    TreeShaking.reportTreeShaking(
+        removed                = removed,
+        removed_function_count = function_count - _getUsedFunctionCount()
+    )
+
+
 def optimize():
     Graphs.startGraph()
 
@@ -432,4 +481,8 @@ def optimize():
     while not finished:
         finished = makeOptimizationPass(True)
 
+    if Options.shallShakeTree():
+        with Reports.withPhase("tree_shaking"):
+            _shakeTree()
+
     Graphs.endGraph()
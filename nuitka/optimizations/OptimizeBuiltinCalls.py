@@ -126,9 +126,13 @@ from nuitka.tree.Helpers import (
     makeStatementsSequence,
     makeStatementsSequenceFromStatement
 )
-from nuitka.tree.ReformulationExecStatements import wrapEvalGlobalsAndLocals
+from nuitka.tree.ReformulationExecStatements import (
+    buildConstantSourceNode,
+    wrapEvalGlobalsAndLocals
+)
 from nuitka.tree.ReformulationTryFinallyStatements import \
     makeTryFinallyStatement
+from nuitka.tree.VariableClosure import completeVariableClosures
 from nuitka.VariableRegistry import addVariableUsage
 
 from . import BuiltinOptimization
@@ -588,6 +592,26 @@ def eval_extractor(node):
     def wrapEvalBuiltin(source, globals_arg, locals_arg, source_ref):
         provider = node.getParentVariableProvider()
 
+        # Constant source code evaluated in the module scope, is built as if
+        # it were part of the module.
+        if provider.isCompiledPythonModule() and \
+           source.isExpressionConstantRef() and \
+           (globals_arg is None or globals_arg.isExpressionBuiltinGlobals()) and \
+           locals_arg is None:
+            result = buildConstantSourceNode(
+                provider    = provider,
+                source_code = source.getConstant(),
+                mode        = "eval",
+                source_ref  = source_ref
+            )
+
+            if result is not None:
+                # Variables are resolved in the place of the call.
+                result.parent = node.getParent()
+                completeVariableClosures(result)
+
+                return result
+
         outline_body = ExpressionOutlineBody(
             provider   = node.getParentVariableProvider(),
             name       = "eval_call",
@@ -1119,6 +1143,10 @@ Replaced call to built-in '%s' with call.""" % (
             tags = "new_expression"
             message = """\
 Replaced call to built-in '%s' with outlined call.""" % builtin_name
+        elif builtin_name == "eval":
+            tags = "new_expression"
+            message = """\
+Replaced call to built-in 'eval' with constant source code expression."""
         else:
 
             assert False, (builtin_name, "->", inspect_node)
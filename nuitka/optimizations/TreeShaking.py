@@ -0,0 +1,407 @@
+#     Copyright 2016, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Tree shaking, removal of module level functions nobody can reach.
+
+This is whole program analysis, only valid in standalone mode, where all the
+code that may use a module is known. Module level function definitions are
+removed, if their variable is not referenced by any code of the module, their
+name is not used as an attribute, in an import, or as a string constant
+anywhere in the program, e.g. in "__all__" or for "getattr".
+
+Modules that use "globals()", "exec" or "eval", that are star imported, or
+that are subject to "getattr", "vars" or "dir" with names not known at compile
+time, are left alone. Other reflection, e.g. through "sys.modules", cannot be
+seen, which is why this is opt-in and has an allowlist of modules to keep.
+"""
+
+import marshal
+from logging import info
+
+from nuitka import ModuleRegistry, Options
+from nuitka.__past__ import unicode  # pylint: disable=W0622
+from nuitka.tree import Operations
+
+# Nodes that expose the variables of the module they are used in.
+_module_reflection_kinds = frozenset(
+    (
+        "EXPRESSION_BUILTIN_GLOBALS",
+        "EXPRESSION_BUILTIN_EVAL",
+        "EXPRESSION_BUILTIN_EXEC",
+        "EXPRESSION_BUILTIN_EXECFILE",
+        "STATEMENT_EXEC",
+    )
+)
+
+
+class ShakingReferences(Operations.VisitorNoopMixin):
+    """ What code references, by variable, by name, or as a whole module. """
+
+    def __init__(self):
+        self.variables = set()
+        self.names = set()
+        self.module_names = set()
+
+    def update(self, other):
+        self.variables.update(other.variables)
+        self.names.update(other.names)
+        self.module_names.update(other.module_names)
+
+    def _addStringConstant(self, constant):
+        if type(constant) is str:
+            self.names.add(constant)
+        elif type(constant) is unicode:
+            # Variable names are ASCII on Python2, others cannot match them.
+            try:
+                self.names.add(str(constant))
+            except UnicodeError:
+                pass
+        elif type(constant) in (tuple, list, set, frozenset):
+            for element in constant:
+                self._addStringConstant(element)
+        elif type(constant) is dict:
+            for key, value in constant.items():
+                self._addStringConstant(key)
+                self._addStringConstant(value)
+
+    def _addReflectedModule(self, node):
+        module_names = _getReferencedModuleNames(node)
+
+        if module_names is not None:
+            self.module_names.update(module_names)
+
+    def onEnterNode(self, node):
+        if node.isExpressionVariableRef() or \
+           node.isExpressionTargetVariableRef():
+            self.variables.add(node.getVariable())
+        elif node.isExpressionConstantRef():
+            self._addStringConstant(node.getConstant())
+        elif node.isExpressionImportName():
+            self.names.add(node.getImportName())
+        elif node.isStatementImportStar():
+            self._addReflectedModule(node.getModule())
+        elif node.kind in _module_reflection_kinds:
+            self.module_names.add(node.getParentModule().getFullName())
+        elif node.isExpressionBuiltinLocals():
+            if node.getParentVariableProvider().isCompiledPythonModule():
+                self.module_names.add(node.getParentModule().getFullName())
+        elif node.isExpressionBuiltinVars() or \
+             node.isExpressionBuiltinDir1():
+            self._addReflectedModule(
+                node.getSource() if node.isExpressionBuiltinVars() else node.getValue()
+            )
+        elif node.isExpressionBuiltinGetattr() or \
+             node.isExpressionBuiltinHasattr() or \
+             node.isExpressionBuiltinSetattr():
+            if node.getAttribute().getStringValue() is None:
+                self._addReflectedModule(node.getLookupSource())
+
+        if hasattr(node, "getAttributeName"):
+            attribute_name = node.getAttributeName()
+            self.names.add(attribute_name)
+
+            if attribute_name == "__dict__":
+                self._addReflectedModule(node.getLookupSource())
+
+    def addCodeObject(self, code_object):
+        """ Names referenced by uncompiled code, it may import or look up. """
+
+        self.names.update(code_object.co_names)
+
+        for constant in code_object.co_consts:
+            if type(constant) is type(code_object):
+                self.addCodeObject(constant)
+            else:
+                self._addStringConstant(constant)
+
+
+def _getModuleVariableAssignSource(variable):
+    if not variable.isModuleVariable():
+        return None
+
+    global_trace = variable.getGlobalVariableTrace()
+
+    if global_trace is None or \
+       global_trace.hasWritesOutsideOf(variable.getModule()):
+        return None
+
+    assign_trace = global_trace.getSingleAssignTrace()
+
+    if assign_trace is None:
+        return None
+
+    return assign_trace.getAssignNode().getAssignSource()
+
+
+def _getReferencedModuleNames(node):
+    """ Names of the modules a value may be, if it is an imported module. """
+
+    if node.isExpressionVariableRef():
+        node = _getModuleVariableAssignSource(node.getVariable())
+
+        if node is None:
+            return None
+
+    if node.isExpressionImportModule():
+        module_name = node.getImportedModuleName()
+
+        if module_name is None:
+            return None
+
+        # Without import list, the top level package is given.
+        return set((module_name, module_name.split('.')[0]))
+    elif node.isExpressionImportName() and \
+         node.getModule().isExpressionImportModule():
+        module_name = node.getModule().getImportedModuleName()
+
+        if module_name is None:
+            return None
+
+        return set((module_name + '.' + node.getImportName(),))
+    else:
+        return None
+
+
+def _getModuleLevelStatements(module):
+    statements = [module.getBody()]
+
+    while statements:
+        statement = statements.pop(0)
+
+        if statement is None:
+            continue
+
+        if statement.isStatementsSequence():
+            statements[0:0] = statement.getStatements()
+        else:
+            yield statement
+
+
+def _isRemovableFunctionDefinition(statement):
+    if not statement.isStatementAssignmentVariable():
+        return False
+
+    variable = statement.getTargetVariableRef().getVariable()
+
+    if not variable.isModuleVariable():
+        return False
+
+    variable_name = variable.getName()
+
+    # Dunder names are special to Python, never touch them.
+    if variable_name.startswith("__") and variable_name.endswith("__"):
+        return False
+
+    assign_source = statement.getAssignSource()
+
+    # Decorated functions are calls, and decorators may register them
+    # somewhere, so only plain definitions are considered.
+    if not assign_source.isExpressionFunctionCreation():
+        return False
+
+    # The defaults and annotations are computed, but unused then.
+    for child in assign_source.getVisitableNodes():
+        if child.mayHaveSideEffects():
+            return False
+
+    return True
+
+
+def _getOwningFunctionBody(function_body, candidate_bodies):
+    while not function_body.isCompiledPythonModule():
+        if function_body in candidate_bodies:
+            return function_body
+
+        function_body = function_body.getParentVariableProvider()
+
+    return None
+
+
+def _isKeptModule(module_name, keep_modules):
+    for keep_module in keep_modules:
+        if module_name == keep_module or \
+           module_name.startswith(keep_module + '.'):
+            return True
+
+    return False
+
+
+def _getFunctionSourceLines(statement):
+    class LastLineFinder(Operations.VisitorNoopMixin):
+        last_line = 0
+
+        def onEnterNode(self, node):
+            self.last_line = max(
+                self.last_line,
+                node.getSourceReference().getLineNumber()
+            )
+
+    visitor = LastLineFinder()
+
+    function_body = statement.getAssignSource().getFunctionRef().getFunctionBody()
+    Operations.visitTree(function_body, visitor)
+
+    return max(visitor.last_line, statement.getSourceReference().getLineNumber()) - \
+           statement.getSourceReference().getLineNumber() + 1
+
+
+def shakeTree():
+    """ Remove module level functions no code can reach.
+
+        Returns a list of module name, function name, and source line count
+        for the removed definitions. The optimization has to be run again
+        afterwards, so their bodies are no longer considered used.
+    """
+
+    # Quite a few things to consider, pylint: disable=R0912
+
+    modules = [
+        module
+        for module in
+        ModuleRegistry.getDoneModules()
+        if module.isCompiledPythonModule()
+        if not module.isInternalModule()
+    ]
+
+    root_references = ShakingReferences()
+
+    for module in ModuleRegistry.getDoneModules() + \
+                  ModuleRegistry.getUncompiledModules():
+        if module.isUncompiledPythonModule():
+            root_references.addCodeObject(marshal.loads(module.getByteCode()))
+
+    # The references made by each candidate definition, only count when the
+    # definition itself is kept.
+    candidates = {}
+    candidate_bodies = {}
+
+    keep_modules = Options.getTreeShakingKeepModules()
+
+    for module in modules:
+        for statement in _getModuleLevelStatements(module):
+            if not _isKeptModule(module.getFullName(), keep_modules) and \
+               _isRemovableFunctionDefinition(statement):
+                candidates[statement] = ShakingReferences()
+
+                function_body = statement.getAssignSource().getFunctionRef().getFunctionBody()
+                candidate_bodies[function_body] = statement
+
+                Operations.visitTree(statement.getAssignSource(), candidates[statement])
+            else:
+                Operations.visitTree(statement, root_references)
+
+        for function_body in module.getUsedFunctions():
+            owner = _getOwningFunctionBody(function_body, candidate_bodies)
+
+            if owner is None:
+                references = root_references
+            else:
+                references = candidates[candidate_bodies[owner]]
+
+            Operations.visitTree(function_body, references)
+
+    # Propagate from what is known to be reachable, until nothing changes.
+    alive = ShakingReferences()
+    alive.update(root_references)
+
+    changed = True
+
+    while changed:
+        changed = False
+
+        for statement, references in list(candidates.items()):
+            variable = statement.getTargetVariableRef().getVariable()
+
+            if variable in alive.variables or \
+               variable.getName() in alive.names or \
+               variable.getModule().getFullName() in alive.module_names:
+                alive.update(references)
+                del candidates[statement]
+
+                changed = True
+
+    # Remaining candidates are unreachable, and their own variable references
+    # are the only ones left.
+    removed = []
+
+    def sourceOrder(statement):
+        source_ref = statement.getSourceReference()
+
+        return source_ref.getFilename(), source_ref.getLineNumber()
+
+    for statement in sorted(candidates, key = sourceOrder):
+        removed.append(
+            (
+                statement.getParentModule().getFullName(),
+                statement.getTargetVariableRef().getVariableName(),
+                _getFunctionSourceLines(statement)
+            )
+        )
+
+        statement.getParent().removeStatement(statement)
+
+    return removed
+
+
+def reportTreeShaking(removed, removed_function_count):
+    """ Report what tree shaking removed.
+
+        The removed definitions are given as produced by "shakeTree", the
+        count of function bodies includes nested functions, that are no
+        longer used as well.
+    """
+
+    if not removed:
+        info("Tree shaking found no unused module level functions.")
+        return
+
+    modules = {}
+
+    for module_name, function_name, source_lines in removed:
+        modules.setdefault(module_name, []).append(
+            (function_name, source_lines)
+        )
+
+    for module_name in sorted(modules):
+        info(
+            "Tree shaking removed from '%s': %s (%d lines)." % (
+                module_name,
+                ", ".join(
+                    function_name
+                    for function_name, _source_lines in
+                    modules[module_name]
+                ),
+                sum(
+                    source_lines
+                    for _function_name, source_lines in
+                    modules[module_name]
+                )
+            )
+        )
+
+    info(
+        """\
+Tree shaking removed %d module level functions from %d modules, %d lines of \
+source code, %d function bodies less to compile, and %d function creations \
+less at startup.""" % (
+            len(removed),
+            len(modules),
+            sum(source_lines for _module_name, _function_name, source_lines in removed),
+            removed_function_count,
+            len(removed)
+        )
+    )
@@ -32,12 +32,20 @@ Variable version can start as:
 
 from logging import debug
 
+from nuitka.Options import isShowMemory
 from nuitka.utils import InstanceCounters
 
 
-class VariableTraceBase:
+class VariableTraceBase(object):
     # We are going to have many instance attributes, pylint: disable=R0902
 
+    # Created in large numbers, so no instance dictionary.
+    __slots__ = (
+        "owner", "variable", "version", "usage_count", "call_usage_count",
+        "has_potential_usages", "has_releases", "has_name_usages", "is_escaped",
+        "previous"
+    )
+
     @InstanceCounters.counted_init
     def __init__(self, owner, variable, version, previous):
         self.owner = owner
@@ -47,6 +55,9 @@ class VariableTraceBase:
         # Definite usage indicator.
         self.usage_count = 0
 
+        # Definite usages that are calls of the value, part of the above.
+        self.call_usage_count = 0
+
         # Potential usages indicator that an assignment value may be used.
         self.has_potential_usages = False
 
@@ -62,7 +73,9 @@ class VariableTraceBase:
         # Previous trace this is replacing.
         self.previous = previous
 
-    __del__ = InstanceCounters.counted_del()
+    # Only when counting, a "__del__" makes reference cycles uncollectable.
+    if isShowMemory():
+        __del__ = InstanceCounters.counted_del()
 
     def getVariable(self):
         return self.variable
@@ -73,6 +86,9 @@ class VariableTraceBase:
     def addUsage(self):
         self.usage_count += 1
 
+    def addCallUsage(self):
+        self.call_usage_count += 1
+
     def addPotentialUsage(self):
         self.has_potential_usages = True
 
@@ -95,6 +111,9 @@ class VariableTraceBase:
     def getDefiniteUsages(self):
         return self.usage_count
 
+    def getDefiniteCallUsages(self):
+        return self.call_usage_count
+
     def hasPotentialUsages(self):
         return self.has_potential_usages
 
@@ -152,9 +171,19 @@ class VariableTraceBase:
         # Virtual method, pylint: disable=R0201
         return False
 
+    def hasShapeTupleExact(self):
+        # Virtual method, pylint: disable=R0201
+        return False
+
+    def getIterationLength(self):
+        # Virtual method, pylint: disable=R0201
+        return None
+
 
 
 class VariableTraceUninit(VariableTraceBase):
+    __slots__ = ()
+
     def __init__(self, owner, variable, version, previous):
         VariableTraceBase.__init__(
             self,
@@ -193,6 +222,8 @@ class VariableTraceUninit(VariableTraceBase):
 
 
 class VariableTraceInit(VariableTraceBase):
+    __slots__ = ()
+
     def __init__(self, owner, variable, version):
         VariableTraceBase.__init__(
             self,
@@ -229,8 +260,24 @@ class VariableTraceInit(VariableTraceBase):
     def isInitTrace():
         return True
 
+    def hasShapeDictionaryExact(self):
+        # The function call creates a new dictionary for the star parameter.
+        owner = self.variable.getOwner()
+
+        return owner is self.owner and \
+               owner.getParameters().getDictStarArgVariable() is self.variable
+
+    def hasShapeTupleExact(self):
+        # The function call creates a new tuple for the star parameter.
+        owner = self.variable.getOwner()
+
+        return owner is self.owner and \
+               owner.getParameters().getListStarArgVariable() is self.variable
+
 
 class VariableTraceUnknown(VariableTraceBase):
+    __slots__ = ()
+
     def __init__(self, owner, variable, version, previous):
         VariableTraceBase.__init__(
             self,
@@ -290,6 +337,8 @@ class VariableTraceUnknown(VariableTraceBase):
 
 
 class VariableTraceAssign(VariableTraceBase):
+    __slots__ = ("assign_node", "replace_it")
+
     def __init__(self, owner, assign_node, variable, version, previous):
         VariableTraceBase.__init__(
             self,
@@ -344,6 +393,12 @@ class VariableTraceAssign(VariableTraceBase):
     def hasShapeDictionaryExact(self):
         return self.assign_node.getAssignSource().hasShapeDictionaryExact()
 
+    def hasShapeTupleExact(self):
+        return self.assign_node.getAssignSource().hasShapeTupleExact()
+
+    def getIterationLength(self):
+        return self.assign_node.getAssignSource().getIterationLength()
+
 
 class VariableTraceMerge(VariableTraceBase):
     """ Merge of two or more traces.
@@ -352,6 +407,9 @@ class VariableTraceMerge(VariableTraceBase):
         SSA theory. Also used for merging multiple "return", "break" or
         "continue" exits.
     """
+
+    __slots__ = ()
+
     def __init__(self, variable, version, traces):
         VariableTraceBase.__init__(
             self,
@@ -439,6 +497,13 @@ class VariableTraceMerge(VariableTraceBase):
 
         return True
 
+    def hasShapeTupleExact(self):
+        for previous in self.previous:
+            if not previous.hasShapeTupleExact():
+                return False
+
+        return True
+
 
 class VariableTraceLoopMerge(VariableTraceBase):
     """ Merge of loop wrap around with loop start value.
@@ -451,6 +516,9 @@ class VariableTraceLoopMerge(VariableTraceBase):
         all of the variable versions at loop continue times.
         .
     """
+
+    __slots__ = ("loop_finished",)
+
     def __init__(self, variable, version, previous):
         VariableTraceBase.__init__(
             self,
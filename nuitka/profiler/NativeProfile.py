@@ -0,0 +1,197 @@
+#     Copyright 2016, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Report on native profiles of Nuitka compiled programs.
+
+Programs compiled with "--native-profile" write the file
+"nuitka-native-profile-<pid>.dat" at exit, call this with one or more of them,
+to show calls, self and cumulative time by qualified name and source line:
+
+    python -m nuitka.profiler.NativeProfile nuitka-native-profile-*.dat
+"""
+
+from __future__ import print_function
+
+import struct
+import sys
+from optparse import OptionParser
+
+_profile_magic = b"NUITKAPROF1"
+
+
+class NativeProfileEntry:
+    """ Calls and times of a compiled function, in seconds. """
+
+    __slots__ = ("name", "filename", "line", "calls", "self_time", "total_time")
+
+    def __init__(self, name, filename, line):
+        self.name = name
+        self.filename = filename
+        self.line = line
+
+        self.calls = 0
+        self.self_time = 0.0
+        self.total_time = 0.0
+
+
+def _readFormat(profile_file, value_format):
+    size = struct.calcsize(value_format)
+    data = profile_file.read(size)
+
+    if len(data) != size:
+        sys.exit("Error, truncated profile file '%s'." % profile_file.name)
+
+    return struct.unpack(value_format, data)
+
+
+def _readString(profile_file):
+    size, = _readFormat(profile_file, "=H")
+
+    return profile_file.read(size).decode("utf8", "replace")
+
+
+def readNativeProfiles(filenames):
+    """ Read and merge profile files.
+
+        Every binary of a process writes a chunk of its own, and entries for
+        the same function are added up.
+    """
+
+    result = {}
+
+    for filename in filenames:
+        with open(filename, "rb") as profile_file:
+            while True:
+                magic = profile_file.read(len(_profile_magic))
+
+                if not magic:
+                    break
+
+                if magic != _profile_magic:
+                    sys.exit(
+                        "Error, '%s' is not a native profile file." % filename
+                    )
+
+                ticks_per_second, count = _readFormat(profile_file, "=dI")
+
+                for _count in range(count):
+                    calls, self_ticks, total_ticks, line = _readFormat(
+                        profile_file,
+                        "=QQQi"
+                    )
+                    name = _readString(profile_file)
+                    source_filename = _readString(profile_file)
+
+                    key = name, source_filename, line
+
+                    if key not in result:
+                        result[key] = NativeProfileEntry(
+                            name     = name,
+                            filename = source_filename,
+                            line     = line
+                        )
+
+                    entry = result[key]
+
+                    entry.calls += calls
+                    entry.self_time += self_ticks / ticks_per_second
+                    entry.total_time += total_ticks / ticks_per_second
+
+    return list(result.values())
+
+
+_sort_keys = {
+    "self"       : lambda entry: entry.self_time,
+    "cumulative" : lambda entry: entry.total_time,
+    "calls"      : lambda entry: entry.calls,
+}
+
+
+def showNativeProfile(entries, sort_by, limit):
+    entries = sorted(entries, key = _sort_keys[sort_by], reverse = True)
+
+    # The percentages are of the whole run, not only of the shown entries.
+    total_self_time = sum(entry.self_time for entry in entries) or 1.0
+
+    if limit:
+        entries = entries[:limit]
+
+    print(
+        "%10s %10s %7s %10s %12s  %s" % (
+            "calls",
+            "self s",
+            "self %",
+            "cumul s",
+            "per call us",
+            "name (filename:line)"
+        )
+    )
+
+    for entry in entries:
+        print(
+            "%10d %10.4f %6.1f%% %10.4f %12.3f  %s (%s:%d)" % (
+                entry.calls,
+                entry.self_time,
+                entry.self_time / total_self_time * 100,
+                entry.total_time,
+                entry.total_time / entry.calls * 1e6 if entry.calls else 0,
+                entry.name,
+                entry.filename,
+                entry.line
+            )
+        )
+
+
+def main():
+    parser = OptionParser(
+        usage = "%prog [options] profile_file..."
+    )
+
+    parser.add_option(
+        "--sort",
+        action  = "store",
+        dest    = "sort_by",
+        choices = sorted(_sort_keys),
+        default = "self",
+        help    = """\
+Sort by "self" time, "cumulative" time, or "calls". Defaults to "self"."""
+    )
+
+    parser.add_option(
+        "--limit",
+        action  = "store",
+        dest    = "limit",
+        type    = "int",
+        default = 0,
+        help    = """\
+Show only this many entries. Defaults to all."""
+    )
+
+    options, filenames = parser.parse_args()
+
+    if not filenames:
+        parser.error("Need at least one profile file.")
+
+    showNativeProfile(
+        entries = readNativeProfiles(filenames),
+        sort_by = options.sort_by,
+        limit   = options.limit
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -51,7 +51,7 @@ catching and passing in exceptions raised.
 
 import sys
 
-from nuitka import Options, SourceCodeReferences, Tracing
+from nuitka import Options, Reports, SourceCodeReferences, Tracing
 from nuitka.__past__ import long, unicode  # pylint: disable=W0622
 from nuitka.importing import Importing
 from nuitka.importing.ImportCache import addImportedModule
@@ -1040,31 +1040,34 @@ def createModuleTree(module, source_ref, source_code, is_main):
     if Options.isShowMemory():
         memory_watch = MemoryUsage.MemoryWatch()
 
-    try:
-        module_body = buildParseTree(
-            provider    = module,
-            source_code = source_code,
-            source_ref  = source_ref,
-            is_module   = True,
-            is_main     = is_main
-        )
-    except RuntimeError as e:
-        if "maximum recursion depth" in e.args[0]:
-            raise CodeTooComplexCode(
-                module.getFullName(),
-                module.getCompileTimeFilename()
+    # Modules found by recursion are built during optimization, this is
+    # reported as part of it then.
+    with Reports.withPhase("module_tree_building", module = module.getFullName()):
+        try:
+            module_body = buildParseTree(
+                provider    = module,
+                source_code = source_code,
+                source_ref  = source_ref,
+                is_module   = True,
+                is_main     = is_main
             )
+        except RuntimeError as e:
+            if "maximum recursion depth" in e.args[0]:
+                raise CodeTooComplexCode(
+                    module.getFullName(),
+                    module.getCompileTimeFilename()
+                )
 
-        raise
+            raise
 
-    if module_body.isStatementsFrame():
-        module_body = makeStatementsSequenceFromStatement(
-            statement = module_body,
-        )
+        if module_body.isStatementsFrame():
+            module_body = makeStatementsSequenceFromStatement(
+                statement = module_body,
+            )
 
-    module.setBody(module_body)
+        module.setBody(module_body)
 
-    completeVariableClosures(module)
+        completeVariableClosures(module)
 
     if Options.isShowMemory():
         memory_watch.finish()
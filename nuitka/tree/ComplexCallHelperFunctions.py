@@ -1052,7 +1052,7 @@ def getFunctionCallHelperStarList():
             ps_default_count = 0,
             ps_kw_only_args  = ()
         ),
-        flags      = set(),
+        flags      = set(["star_arg_call"]),
         source_ref = internal_source_ref
     )
 
@@ -1554,7 +1554,7 @@ def getFunctionCallHelperStarDict():
             ps_default_count = 0,
             ps_kw_only_args  = ()
         ),
-        flags      = set(),
+        flags      = set(["star_arg_call"]),
         source_ref = internal_source_ref
     )
 
@@ -2115,7 +2115,7 @@ def getFunctionCallHelperStarListStarDict():
             ps_default_count = 0,
             ps_kw_only_args  = ()
         ),
-        flags      = set(),
+        flags      = set(["star_arg_call"]),
         source_ref = internal_source_ref
     )
 
@@ -61,6 +61,11 @@ class VariableUsageUpdater(VisitorNoopMixin):
            node.isStatementReleaseVariable():
             if node.getVariable() is self.old_variable:
                 node.setVariable(self.new_variable)
+        elif node.isStatementsFrame():
+            node.updateInlinedVariable(
+                old_variable = self.old_variable,
+                new_variable = self.new_variable
+            )
 
 
 def updateVariableUsage(provider, old_variable, new_variable):
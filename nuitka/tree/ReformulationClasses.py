@@ -22,6 +22,8 @@ source code comments with developer manual sections.
 
 """
 
+import ast
+
 from nuitka.nodes.AssignNodes import (
     ExpressionTargetTempVariableRef,
     ExpressionTargetVariableRef,
@@ -584,6 +586,70 @@ def _buildClassNode3(provider, node, source_ref):
     )
 
 
+# Names that give access to the class dictionary, so it can be written through
+# them.
+_class_dict_access_names = frozenset(
+    ("locals", "vars", "eval", "exec", "execfile")
+)
+
+
+def _mayBindClassVariable(class_statement_nodes, variable_name):
+    """ Check if the class body can bind a variable name in the class dict.
+
+        Nested functions, lambdas and generator expressions are their own
+        scope, only their names, defaults, decorators and first iterable are
+        evaluated in the class body.
+    """
+
+    pending = list(class_statement_nodes)
+
+    while pending:
+        node = pending.pop()
+        kind = getKind(node)
+
+        if kind in ("FunctionDef", "ClassDef"):
+            if node.name == variable_name:
+                return True
+
+            pending += node.decorator_list
+
+            if kind == "ClassDef":
+                pending += node.bases
+            else:
+                pending.append(node.args)
+
+            continue
+        elif kind == "Lambda":
+            pending.append(node.args)
+
+            continue
+        elif kind in ("GeneratorExp", "SetComp", "DictComp"):
+            pending.append(node.generators[0].iter)
+
+            continue
+        elif kind == "Name":
+            if node.id in _class_dict_access_names:
+                return True
+
+            # Parameters of functions are not bound in the class body.
+            if node.id == variable_name and \
+               getKind(node.ctx) not in ("Load", "Param"):
+                return True
+        elif kind in ("Exec", "Global"):
+            return True
+        elif kind in ("Import", "ImportFrom"):
+            for alias in node.names:
+                if alias.name == '*':
+                    return True
+
+                if (alias.asname or alias.name).split('.')[0] == variable_name:
+                    return True
+
+        pending.extend(ast.iter_child_nodes(node))
+
+    return False
+
+
 def _buildClassNode2(provider, node, source_ref):
     # This function is the Python2 special case with special re-formulation as
     # according to developer manual, and it's very detailed, pylint: disable=R0914
@@ -679,6 +745,47 @@ def _buildClassNode2(provider, node, source_ref):
     tmp_metaclass = provider.allocateTempVariable(temp_scope, "metaclass")
     tmp_class = provider.allocateTempVariable(temp_scope, "class")
 
+    metaclass = ExpressionSelectMetaclass(
+        metaclass  = None,
+        bases      = ExpressionTempVariableRef(
+            variable   = tmp_bases,
+            source_ref = source_ref
+        ),
+        source_ref = source_ref
+    )
+
+    # Only a class body that can bind "__metaclass__" needs to be checked for
+    # it, otherwise the selection from the bases is all there is to it.
+    if _mayBindClassVariable(class_statement_nodes, "__metaclass__"):
+        metaclass = ExpressionConditional(
+            condition      =  ExpressionComparisonIn(
+                left       = makeConstantRefNode(
+                    constant      = "__metaclass__",
+                    source_ref    = source_ref,
+                    user_provided = True
+                ),
+                right      = ExpressionTempVariableRef(
+                    variable   = tmp_class_dict,
+                    source_ref = source_ref
+                ),
+                source_ref = source_ref
+            ),
+            expression_yes = ExpressionDictOperationGet(
+                dict_arg   = ExpressionTempVariableRef(
+                    variable   = tmp_class_dict,
+                    source_ref = source_ref
+                ),
+                key        = makeConstantRefNode(
+                    constant      = "__metaclass__",
+                    source_ref    = source_ref,
+                    user_provided = True
+                ),
+                source_ref = source_ref
+            ),
+            expression_no  = metaclass,
+            source_ref     = source_ref
+        )
+
     statements = [
         StatementAssignmentVariable(
             variable_ref = ExpressionTargetTempVariableRef(
@@ -721,41 +828,7 @@ def _buildClassNode2(provider, node, source_ref):
                 variable   = tmp_metaclass,
                 source_ref = source_ref
             ),
-            source       = ExpressionConditional(
-                condition      =  ExpressionComparisonIn(
-                    left       = makeConstantRefNode(
-                        constant      = "__metaclass__",
-                        source_ref    = source_ref,
-                        user_provided = True
-                    ),
-                    right      = ExpressionTempVariableRef(
-                        variable   = tmp_class_dict,
-                        source_ref = source_ref
-                    ),
-                    source_ref = source_ref
-                ),
-                expression_yes = ExpressionDictOperationGet(
-                    dict_arg   = ExpressionTempVariableRef(
-                        variable   = tmp_class_dict,
-                        source_ref = source_ref
-                    ),
-                    key        = makeConstantRefNode(
-                        constant      = "__metaclass__",
-                        source_ref    = source_ref,
-                        user_provided = True
-                    ),
-                    source_ref = source_ref
-                ),
-                expression_no  = ExpressionSelectMetaclass(
-                    metaclass  = None,
-                    bases      = ExpressionTempVariableRef(
-                        variable   = tmp_bases,
-                        source_ref = source_ref
-                    ),
-                    source_ref = source_ref
-                ),
-                source_ref     = source_ref
-            ),
+            source       = metaclass,
             source_ref   = source_ref
         ),
         StatementAssignmentVariable(
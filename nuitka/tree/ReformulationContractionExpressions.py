@@ -35,6 +35,10 @@ from nuitka.nodes.BuiltinIteratorNodes import (
 from nuitka.nodes.CodeObjectSpecs import CodeObjectSpec
 from nuitka.nodes.ConditionalNodes import StatementConditional
 from nuitka.nodes.ConstantRefNodes import makeConstantRefNode
+from nuitka.nodes.ContainerMakingNodes import (
+    ExpressionMakeDictReserved,
+    ExpressionMakeListReserved
+)
 from nuitka.nodes.ContainerOperationNodes import (
     StatementListOperationAppend,
     StatementSetOperationAdd
@@ -151,6 +155,12 @@ def buildGeneratorExpressionNode(provider, node, source_ref):
     )
 
 
+_reserved_container_classes = {
+    StatementListOperationAppend : ExpressionMakeListReserved,
+    StatementDictOperationSet    : ExpressionMakeDictReserved
+}
+
+
 def _buildContractionBodyNode(provider, node, emit_class, start_value,
                               container_tmp, iter_tmp, temp_scope,
                               assign_provider, function_body, source_ref):
@@ -189,6 +199,19 @@ def _buildContractionBodyNode(provider, node, emit_class, start_value,
         statements = []
 
     if start_value is not None:
+        # When every value of a single iterator is added, there is no need to
+        # grow the container, room for all of them can be reserved.
+        if emit_class in _reserved_container_classes and \
+           len(node.generators) == 1 and \
+           not node.generators[0].ifs:
+            start_value = _reserved_container_classes[emit_class](
+                iterator   = makeVariableRefNode(
+                    variable   = iter_tmp,
+                    source_ref = source_ref
+                ),
+                source_ref = source_ref
+            )
+
         statements.append(
             StatementAssignmentVariable(
                 variable_ref = ExpressionTargetTempVariableRef(
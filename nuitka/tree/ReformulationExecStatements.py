@@ -22,6 +22,10 @@ source code comments with developer manual sections.
 
 """
 
+import __future__
+import ast
+
+from nuitka.__past__ import unicode  # pylint: disable=W0622
 from nuitka.nodes.AssignNodes import (
     ExpressionTargetTempVariableRef,
     ExpressionTempVariableRef,
@@ -50,9 +54,11 @@ from nuitka.nodes.GlobalsLocalsNodes import (
     ExpressionBuiltinLocals
 )
 from nuitka.nodes.TypeNodes import ExpressionBuiltinIsinstance
+from nuitka.PythonVersions import python_version
 
 from .Helpers import (
     buildNode,
+    buildStatementsNode,
     getKind,
     makeStatementsSequence,
     makeStatementsSequenceFromStatement,
@@ -61,6 +67,95 @@ from .Helpers import (
 from .ReformulationTryFinallyStatements import makeTryFinallyStatement
 
 
+# Source code parts, that have a scope of their own, or that are not the same,
+# when not compiled by "exec" and "eval" themselves.
+_constant_source_excluded_kinds = frozenset(
+    (
+        "Lambda", "GeneratorExp", "ListComp", "SetComp", "DictComp", "Yield",
+        "YieldFrom", "Await", "FunctionDef", "AsyncFunctionDef", "ClassDef",
+        "Return", "Global", "Nonlocal", "Starred"
+    )
+)
+
+
+def _getConstantSourceCompileFlags(source_ref):
+    # The future flags of the calling code are inherited, these are the ones
+    # that change the parsing.
+    future_spec = source_ref.getFutureSpec()
+
+    flags = 0
+
+    if future_spec.future_print:
+        flags |= __future__.print_function.compiler_flag
+    if future_spec.unicode_literals:
+        flags |= __future__.unicode_literals.compiler_flag
+    if future_spec.barry_bdfl and python_version >= 300:
+        flags |= __future__.barry_as_FLUFL.compiler_flag
+
+    return flags
+
+
+def buildConstantSourceNode(provider, source_code, mode, source_ref):
+    """ Build the node tree of constant source code of "exec" or "eval".
+
+        The nodes are built for the given provider, which must be the one
+        whose variables the source code uses. Returns "None" for source code
+        that is to be compiled at run time, e.g. as it has a syntax error.
+    """
+
+    if type(source_code) not in (str, unicode):
+        return None
+
+    if mode == "eval":
+        source_code = source_code.strip(" \t")
+
+    flags = _getConstantSourceCompileFlags(source_ref)
+
+    # Anything may be wrong with the source code, pylint: disable=W0703
+    try:
+        tree = compile(
+            source_code,
+            "<string>",
+            mode,
+            ast.PyCF_ONLY_AST | flags,
+            True
+        )
+
+        # Some errors, e.g. "break" outside of loops, are only detected when
+        # creating the byte code.
+        compile(tree, "<string>", mode, flags, True)
+    except Exception:
+        return None
+
+    for node in ast.walk(tree):
+        kind = getKind(node)
+
+        if kind in _constant_source_excluded_kinds:
+            return None
+
+        if kind == "ImportFrom" and node.module == "__future__":
+            return None
+
+        if kind == "Call" and \
+           (getattr(node, "starargs", None) is not None or \
+            getattr(node, "kwargs", None) is not None):
+            return None
+
+        if kind == "keyword" and node.arg is None:
+            return None
+
+        # Everything is reported for the line of the "exec" or "eval".
+        if hasattr(node, "lineno"):
+            node.lineno = source_ref.getLineNumber()
+
+    if mode == "eval":
+        return buildNode(provider, tree.body, source_ref)
+    elif tree.body:
+        return buildStatementsNode(provider, tree.body, source_ref)
+    else:
+        return None
+
+
 def _getLocalsClassNode(provider):
     if provider.isCompiledPythonModule():
         return ExpressionBuiltinGlobals
@@ -272,6 +367,22 @@ exec: arg 1 must be a string, file, or code object""",
                 source_ref      = source_ref
             )
 
+    # Constant source code executed in the module scope, is built as if it
+    # were part of the module.
+    if provider.isCompiledPythonModule() and \
+       exec_globals is None and \
+       exec_locals is None and \
+       getKind(body) == "Str":
+        result = buildConstantSourceNode(
+            provider    = provider,
+            source_code = body.s,
+            mode        = "exec",
+            source_ref  = source_ref
+        )
+
+        if result is not None:
+            return result
+
     if not provider.isCompiledPythonModule():
         provider.markAsExecContaining()
 
@@ -0,0 +1,295 @@
+#     Copyright 2016, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Reading and changing the dynamic section of ELF files.
+
+This is used in standalone mode on Linux, to find the shared libraries used
+by binaries, and to remove "RPATH" settings from the copied ones, without
+having to run "ldd", "readelf", or "chrpath" for every file.
+"""
+
+import struct
+
+from nuitka.utils import Utils
+
+# Values from the ELF specification, only the ones we need.
+_ELFCLASS32 = 1
+_ELFCLASS64 = 2
+
+_ELFDATA2LSB = 1
+_ELFDATA2MSB = 2
+
+_PT_LOAD = 1
+_PT_DYNAMIC = 2
+_PT_INTERP = 3
+
+_DT_NULL = 0
+_DT_NEEDED = 1
+_DT_STRTAB = 5
+_DT_RPATH = 15
+_DT_RUNPATH = 29
+
+
+class ElfFileError(Exception):
+    pass
+
+
+class ElfDynamicInfo:
+    """ The parts of an ELF file relevant to the dynamic loader. """
+
+    # Used a lot, and only data, so keep it small.
+    __slots__ = (
+        "elf_class", "elf_data", "machine", "interpreter", "needed", "rpath",
+        "runpath", "dynamic_offset", "dynamic_count"
+    )
+
+    def __init__(self, elf_class, elf_data, machine):
+        self.elf_class = elf_class
+        self.elf_data = elf_data
+        self.machine = machine
+
+        self.interpreter = None
+        self.needed = []
+        self.rpath = None
+        self.runpath = None
+
+        # Location of the dynamic section in the file, for editing it.
+        self.dynamic_offset = None
+        self.dynamic_count = 0
+
+    def isElf64(self):
+        return self.elf_class == _ELFCLASS64
+
+    def isCompatible(self, other):
+        """ Can a binary of this kind load the other one. """
+
+        return self.elf_class == other.elf_class and \
+               self.elf_data == other.elf_data and \
+               self.machine == other.machine
+
+
+def _getFormats(elf_class, elf_data):
+    endian = '<' if elf_data == _ELFDATA2LSB else '>'
+
+    if elf_class == _ELFCLASS32:
+        return (
+            endian + "HHIIIIIHHHHHH",
+            endian + "IIIIIIII",
+            endian + "iI",
+        )
+    else:
+        return (
+            endian + "HHIQQQIHHHHHH",
+            endian + "IIQQQQQQ",
+            endian + "qQ",
+        )
+
+
+def _getProgramHeader(elf_class, program_header_format, data):
+    values = struct.unpack(program_header_format, data)
+
+    # Order of fields differs, normalize to type, offset, address, size.
+    if elf_class == _ELFCLASS32:
+        p_type, p_offset, p_vaddr, _p_paddr, p_filesz = values[:5]
+    else:
+        p_type, _p_flags, p_offset, p_vaddr, _p_paddr, p_filesz = values[:6]
+
+    return p_type, p_offset, p_vaddr, p_filesz
+
+
+def _parseElfDynamicInfo(contents):
+    # Many cases to handle here, pylint: disable=R0912,R0914
+
+    if contents[:4] != b"\x7fELF":
+        raise ElfFileError("Not an ELF file.")
+
+    elf_class = ord(contents[4:5])
+    elf_data = ord(contents[5:6])
+
+    if elf_class not in (_ELFCLASS32, _ELFCLASS64) or \
+       elf_data not in (_ELFDATA2LSB, _ELFDATA2MSB):
+        raise ElfFileError("Unsupported ELF class or data encoding.")
+
+    header_format, program_header_format, dynamic_format = \
+      _getFormats(elf_class, elf_data)
+
+    header_size = struct.calcsize(header_format)
+    header = struct.unpack(header_format, contents[16:16+header_size])
+
+    machine = header[1]
+    phoff = header[4]
+    phentsize = header[8]
+    phnum = header[9]
+
+    result = ElfDynamicInfo(
+        elf_class = elf_class,
+        elf_data  = elf_data,
+        machine   = machine
+    )
+
+    program_header_size = struct.calcsize(program_header_format)
+
+    loads = []
+    dynamic = None
+
+    for count in range(phnum):
+        offset = phoff + count * phentsize
+
+        p_type, p_offset, p_vaddr, p_filesz = _getProgramHeader(
+            elf_class,
+            program_header_format,
+            contents[offset:offset+program_header_size]
+        )
+
+        if p_type == _PT_LOAD:
+            loads.append((p_vaddr, p_offset, p_filesz))
+        elif p_type == _PT_DYNAMIC:
+            dynamic = p_offset, p_filesz
+        elif p_type == _PT_INTERP:
+            result.interpreter = contents[p_offset:p_offset+p_filesz].rstrip(
+                b"\0"
+            )
+
+    # Static binaries have nothing for us.
+    if dynamic is None:
+        return result
+
+    dynamic_size = struct.calcsize(dynamic_format)
+    dynamic_offset, dynamic_filesz = dynamic
+
+    entries = []
+
+    for count in range(dynamic_filesz // dynamic_size):
+        offset = dynamic_offset + count * dynamic_size
+
+        tag, value = struct.unpack(
+            dynamic_format,
+            contents[offset:offset+dynamic_size]
+        )
+
+        if tag == _DT_NULL:
+            break
+
+        entries.append((tag, value))
+
+    result.dynamic_offset = dynamic_offset
+    result.dynamic_count = dynamic_filesz // dynamic_size
+
+    string_table_address = None
+
+    for tag, value in entries:
+        if tag == _DT_STRTAB:
+            string_table_address = value
+
+    if string_table_address is None:
+        raise ElfFileError("Dynamic section without string table.")
+
+    # The string table is given as an address, find it in the file.
+    for p_vaddr, p_offset, p_filesz in loads:
+        if p_vaddr <= string_table_address < p_vaddr + p_filesz:
+            string_table_offset = string_table_address - p_vaddr + p_offset
+            break
+    else:
+        raise ElfFileError("Dynamic string table not mapped.")
+
+    def getString(offset):
+        start = string_table_offset + offset
+        end = contents.index(b"\0", start)
+
+        return contents[start:end]
+
+    for tag, value in entries:
+        if tag == _DT_NEEDED:
+            result.needed.append(getString(value))
+        elif tag == _DT_RPATH:
+            result.rpath = getString(value)
+        elif tag == _DT_RUNPATH:
+            result.runpath = getString(value)
+
+    return result
+
+
+# Parsed information, per file contents hash.
+_dynamic_infos = {}
+
+def getElfDynamicInfo(filename):
+    """ Get the dynamic loader relevant information for an ELF file.
+
+        This is cached per file contents, so files that are copies of one
+        another are only parsed once.
+    """
+
+    file_hash = Utils.getFileContentsHash(filename)
+
+    if file_hash not in _dynamic_infos:
+        with open(filename, "rb") as input_file:
+            contents = input_file.read()
+
+        try:
+            _dynamic_infos[file_hash] = _parseElfDynamicInfo(contents)
+        except (ElfFileError, struct.error, ValueError) as e:
+            _dynamic_infos[file_hash] = ElfFileError(str(e))
+
+    result = _dynamic_infos[file_hash]
+
+    if isinstance(result, ElfFileError):
+        raise ElfFileError("%s: %s" % (filename, result))
+
+    return result
+
+
+def removeElfRunPaths(filename):
+    """ Remove "RPATH" and "RUNPATH" entries from an ELF file in place.
+
+        Like "chrpath -d" does it, later dynamic entries are moved forward,
+        and the end is padded with "DT_NULL" entries.
+    """
+
+    info = getElfDynamicInfo(filename)
+
+    _header_format, _program_header_format, dynamic_format = \
+      _getFormats(info.elf_class, info.elf_data)
+    dynamic_size = struct.calcsize(dynamic_format)
+
+    with open(filename, "r+b") as binary_file:
+        binary_file.seek(info.dynamic_offset)
+        dynamic_data = binary_file.read(dynamic_size * info.dynamic_count)
+
+        entries = []
+
+        for count in range(info.dynamic_count):
+            tag, value = struct.unpack(
+                dynamic_format,
+                dynamic_data[count*dynamic_size:(count+1)*dynamic_size]
+            )
+
+            if tag == _DT_NULL:
+                break
+
+            if tag not in (_DT_RPATH, _DT_RUNPATH):
+                entries.append((tag, value))
+
+        entries += [(_DT_NULL, 0)] * (info.dynamic_count - len(entries))
+
+        binary_file.seek(info.dynamic_offset)
+        binary_file.write(
+            b"".join(
+                struct.pack(dynamic_format, tag, value)
+                for tag, value in
+                entries
+            )
+        )
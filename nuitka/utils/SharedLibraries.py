@@ -19,9 +19,13 @@
 
 """
 
+import os
+import struct
 from sys import getfilesystemencoding
 
 from nuitka.PythonVersions import python_version
+from nuitka.utils import Utils
+from nuitka.utils.ElfFiles import ElfFileError, getElfDynamicInfo
 
 
 def locateDLL(dll_name):
@@ -29,27 +33,203 @@ def locateDLL(dll_name):
 
     dll_name = ctypes.util.find_library(dll_name)
 
-    import subprocess
-    process = subprocess.Popen(
-        args   = ["/sbin/ldconfig", "-p"],
-        stdout = subprocess.PIPE,
-        stderr = subprocess.PIPE,
-    )
-    stdout, _stderr = process.communicate()
+    return _getLdSoCache()[dll_name][0]
+
+
+_ld_so_cache = None
+
+def _getLdSoCache():
+    """ Read the library names and paths of the "/etc/ld.so.cache" file.
+
+        Returns a dictionary of library names to lists of paths, in the order
+        the loader would consider them. Only the "glibc-ld.so.cache1.1" format
+        is supported, for others the loader defaults have to do.
+    """
+
+    # Using a global, to read it only once, pylint: disable=W0603
+    global _ld_so_cache
+
+    if _ld_so_cache is not None:
+        return _ld_so_cache
+
+    _ld_so_cache = {}
+
+    try:
+        with open("/etc/ld.so.cache", "rb") as cache_file:
+            contents = cache_file.read()
+    except IOError:
+        return _ld_so_cache
+
+    magic = b"glibc-ld.so.cache1.1"
+
+    # The new format may follow an old format header, string offsets are
+    # relative to its start.
+    start = contents.find(magic)
+
+    if start == -1:
+        return _ld_so_cache
+
+    header_size = len(magic) + 28
+    entry_size = 24
+
+    # Byte order is that of the machine, which is what we run on.
+    nlibs, = struct.unpack("=I", contents[start+len(magic):start+len(magic)+4])
+
+    def getString(offset):
+        offset += start
 
-    dll_map = {}
+        return contents[offset:contents.index(b"\0", offset)]
 
-    for line in stdout.splitlines()[1:]:
-        assert line.count(b"=>") == 1, line
-        left, right = line.strip().split(b" => ")
-        assert b" (" in left, line
-        left = left[:left.rfind(b" (")]
+    for count in range(nlibs):
+        offset = start + header_size + count * entry_size
+
+        _flags, key, value = struct.unpack(
+            "=iII",
+            contents[offset:offset+12]
+        )
+
+        name = getString(key)
+        path = getString(value)
 
         if python_version >= 300:
-            left = left.decode(getfilesystemencoding())
-            right = right.decode(getfilesystemencoding())
+            name = name.decode(getfilesystemencoding())
+            path = path.decode(getfilesystemencoding())
+
+        _ld_so_cache.setdefault(name, []).append(path)
+
+    return _ld_so_cache
+
+
+def _isDynamicLoaderName(dll_name):
+    return dll_name.startswith(("ld-linux", "ld64.so", "ld.so"))
+
+
+def _expandLoaderPath(loader_path, origin):
+    result = []
+
+    for path in loader_path.split(':'):
+        if not path:
+            continue
+
+        path = path.replace("${ORIGIN}", origin).replace("$ORIGIN", origin)
+
+        result.append(path)
+
+    return result
+
+
+def _findNeededDLL(dll_name, search_path, requester_info):
+    def isUsable(candidate):
+        if not Utils.isFile(candidate):
+            return False
+
+        try:
+            return requester_info.isCompatible(getElfDynamicInfo(candidate))
+        except ElfFileError:
+            return False
+
+    if '/' in dll_name:
+        return dll_name if isUsable(dll_name) else None
+
+    for path in search_path:
+        candidate = Utils.joinpath(path, dll_name)
+
+        if isUsable(candidate):
+            return candidate
+
+    return None
+
+
+def getElfDLLDependencies(binary_filename):
+    """ Find the shared libraries an ELF binary uses, like "ldd" does.
+
+        This follows the search rules of the Linux dynamic loader, first the
+        "RPATH" of the binary and the ones loading it, unless there is a
+        "RUNPATH", then "LD_LIBRARY_PATH", then the "RUNPATH" itself, then the
+        loader cache and the default directories. The loader itself is not
+        part of the result, libraries not found are ignored.
+    """
+
+    # Many details to follow, pylint: disable=R0914
+
+    binary_info = getElfDynamicInfo(binary_filename)
+
+    ld_library_path = _expandLoaderPath(
+        loader_path = os.environ.get("LD_LIBRARY_PATH", ""),
+        origin      = ""
+    )
+
+    if binary_info.isElf64():
+        default_path = ["/lib64", "/usr/lib64", "/lib", "/usr/lib"]
+    else:
+        default_path = ["/lib", "/usr/lib"]
+
+    ld_so_cache = _getLdSoCache()
+
+    result = set()
+
+    # Libraries are only loaded once per name, no matter who needs them.
+    seen_names = set()
+
+    # Filename, information, and inherited "RPATH" of the binaries to scan.
+    pending = [(binary_filename, binary_info, [])]
+
+    while pending:
+        filename, dynamic_info, loader_rpath = pending.pop(0)
+
+        origin = Utils.dirname(Utils.abspath(filename))
+
+        if dynamic_info.runpath is None:
+            if dynamic_info.rpath is not None:
+                rpath = _expandLoaderPath(
+                    loader_path = dynamic_info.rpath.decode("utf-8"),
+                    origin      = origin
+                )
+            else:
+                rpath = []
+
+            rpath += loader_rpath
+            runpath = []
+        else:
+            rpath = []
+            runpath = _expandLoaderPath(
+                loader_path = dynamic_info.runpath.decode("utf-8"),
+                origin      = origin
+            )
+
+        for dll_name in dynamic_info.needed:
+            if python_version >= 300:
+                dll_name = dll_name.decode(getfilesystemencoding())
+
+            if dll_name in seen_names or _isDynamicLoaderName(dll_name):
+                continue
+
+            seen_names.add(dll_name)
+
+            cache_path = [
+                Utils.dirname(cache_filename)
+                for cache_filename in
+                ld_so_cache.get(dll_name, ())
+            ]
+
+            dll_filename = _findNeededDLL(
+                dll_name       = dll_name,
+                search_path    = rpath + ld_library_path + runpath + \
+                                 cache_path + default_path,
+                requester_info = binary_info
+            )
+
+            if dll_filename is None:
+                continue
+
+            result.add(Utils.abspath(dll_filename))
 
-        if left not in dll_map:
-            dll_map[left] = right
+            pending.append(
+                (
+                    dll_filename,
+                    getElfDynamicInfo(dll_filename),
+                    rpath if dynamic_info.runpath is None else loader_rpath
+                )
+            )
 
-    return dll_map[dll_name]
+    return result
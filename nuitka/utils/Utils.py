@@ -153,6 +153,65 @@ def deleteFile(path, must_exist):
         os.unlink(path)
 
 
+_file_hashes = {}
+
+def getFileContentsHash(path):
+    """ Hash of the file contents, computed only once per file version. """
+
+    stat = os.stat(path)
+    key = path, stat.st_mtime, stat.st_size
+
+    if key not in _file_hashes:
+        import hashlib
+
+        hash_value = hashlib.sha1()
+
+        with open(path, "rb") as input_file:
+            while True:
+                chunk = input_file.read(65536)
+
+                if not chunk:
+                    break
+
+                hash_value.update(chunk)
+
+        _file_hashes[key] = hash_value.hexdigest()
+
+    return _file_hashes[key]
+
+
+def getFileModificationTime(path):
+    return os.stat(path).st_mtime
+
+
+def renameFile(source, dest):
+    # There is no atomic replace on Windows with old Python.
+    if getOS() == "Windows" and isFile(dest):
+        os.unlink(dest)
+
+    os.rename(source, dest)
+
+
+def getCacheDir():
+    """ Directory to cache things across runs of Nuitka. """
+
+    if "NUITKA_CACHE_DIR" in os.environ:
+        return os.environ["NUITKA_CACHE_DIR"]
+
+    if getOS() == "Windows":
+        base_dir = os.environ.get(
+            "LOCALAPPDATA",
+            os.environ.get("APPDATA", os.path.expanduser('~'))
+        )
+    else:
+        base_dir = os.environ.get(
+            "XDG_CACHE_HOME",
+            joinpath(os.path.expanduser('~'), ".cache")
+        )
+
+    return joinpath(base_dir, "nuitka")
+
+
 def makePath(path):
     if not os.path.isdir(path):
         os.makedirs(path)
@@ -170,3 +170,22 @@ b = A('b',1)
 c = A('c',0)
 
 print(a < b < c)
+print('*' * 80)
+
+class Equal(object):
+    def __init__(self, name):
+        self.name = name
+
+    def __eq__(self, other):
+        print("equal called for:", self.name, other.name)
+
+        return True
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+# Tuples of different sizes still compare their items first.
+def compareTuples(a, b):
+    return (a,) == (b, b), (a, b) != (b,)
+
+print(compareTuples(Equal('x'), Equal('y')))
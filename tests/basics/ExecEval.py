@@ -319,3 +319,20 @@ def execWithShortTuple():
         return "gives exception: " + repr(e)
 
 print "Exec with too short tuple argument:", execWithShortTuple()
+
+x = 5
+
+exec """
+z = x * 2
+for i in range(2):
+    z += i
+"""
+
+print "Module scope exec of constant source code assigned", z, i
+
+print "Module scope eval of constant source code", eval("  z * x  "), eval("x < z", globals())
+
+try:
+    exec "x / 0"
+except ZeroDivisionError as e:
+    print "Module scope exec of constant source code raised", repr(e)
@@ -147,3 +147,64 @@ def loopingFunction(a = 1*2):
         print "Executed else branch of while loop without break"
 
 loopingFunction()
+
+threshold_scale = 3
+
+class LoopConfig:
+    threshold = 7
+
+class LoopHolder:
+    def __init__(self):
+        self.config = LoopConfig()
+
+def loopInvariantLoads(holder, n):
+    result = 0
+
+    for value in range(n):
+        if value > holder.config.threshold:
+            result += value * threshold_scale
+
+    print "Loop with invariant loads gives", result
+
+def loopInvariantNotEntered(n):
+    for x in range(n):
+        print undefined_name.attribute
+
+    print "Loop not entered does not load anything"
+
+    try:
+        loopInvariantNotEntered2(n+1)
+    except NameError as e:
+        print "Loop entered loads", e
+
+def loopInvariantNotEntered2(n):
+    for x in range(n):
+        print undefined_name.attribute
+
+def loopInvariantRaising(holder):
+    i = 0
+
+    while True:
+        i += 1
+
+        if i > 3:
+            return holder.config.missing
+
+def loopInvariantRebound(holder, n):
+    result = []
+
+    for x in range(n):
+        result.append(holder.config.threshold)
+        holder.config.threshold += 1
+
+    print "Loop rebinding the attribute sees", result
+
+loopInvariantLoads(LoopHolder(), 20)
+loopInvariantNotEntered(0)
+
+try:
+    loopInvariantRaising(LoopHolder())
+except AttributeError as e:
+    print "Loop load raises", e
+
+loopInvariantRebound(LoopHolder(), 3)
@@ -44,3 +44,54 @@ def catcher():
 catcher()
 
 print "Good bye."
+
+def inlinedRaiser(x):
+    def inner(a, b):
+        c = a + b
+
+        return c / 0
+
+    y = x * 2
+
+    return inner(y, x)
+
+def lambdaRaiser(x):
+    y = x * 5
+
+    return (lambda a: a / 0)(y)
+
+def constantArgumentRaiser(x):
+    w = x * 3
+
+    return (lambda q, r: q / r)(w, 0)
+
+def localHelperRaiser(x):
+    def helper(a):
+        return 10 / a
+
+    total = 0
+
+    for i in range(x, -1, -1):
+        total += helper(i)
+
+    return total
+
+def showTraceback(func):
+    try:
+        func(1)
+    except ZeroDivisionError:
+        tb = sys.exc_info()[2].tb_next
+
+        while tb is not None:
+            frame = tb.tb_frame
+
+            print "Frame", frame.f_code.co_name, "line", tb.tb_lineno, "locals", sorted(frame.f_locals)
+
+            tb = tb.tb_next
+
+        print "Innermost locals", sorted(frame.f_locals.items())
+
+showTraceback(inlinedRaiser)
+showTraceback(lambdaRaiser)
+showTraceback(constantArgumentRaiser)
+showTraceback(localHelperRaiser)
@@ -61,3 +61,36 @@ print "Function with plain arg, varargs list and varargs dict:"
 list_dict_args_function(2, z = 3)
 list_dict_args_function(2, 3)
 list_dict_args_function(a = 2, b = 3, c = 4)
+
+def star_arg_raiser(*arg_list, **arg_dict):
+    raise ValueError(arg_list, arg_dict)
+
+def star_arg_forwarder(called, *arg_list, **arg_dict):
+    result = "unassigned"
+
+    try:
+        result = called(*arg_list, **arg_dict)
+    except ValueError as e:
+        print "Caught from forwarded call:", e
+    finally:
+        print "Finally after forwarded call, result", result
+
+    return result
+
+def star_list_forwarder(called, *arg_list):
+    try:
+        return called(*arg_list)
+    except ValueError as e:
+        print "Caught from forwarded list call:", e
+
+def star_dict_forwarder(called, **arg_dict):
+    try:
+        return called(**arg_dict)
+    except ValueError as e:
+        print "Caught from forwarded dict call:", e
+
+print "Forwarding star arguments to a function that raises:"
+print star_arg_forwarder(star_arg_raiser, 1, 2, a = 3)
+print star_arg_forwarder(list_dict_args_function, 1, 2, a = 3)
+print star_list_forwarder(star_arg_raiser, 1, 2)
+print star_dict_forwarder(star_arg_raiser, a = 3)
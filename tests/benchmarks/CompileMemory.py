@@ -0,0 +1,114 @@
+#     Copyright 2016, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python test originally created or extracted from other peoples work. The
+#     parts from me are licensed as below. It is at least Free Software where
+#     it's copied from other people. In these cases, that will normally be
+#     indicated.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Memory and time of the compiler itself for a large program, Linux only.
+
+Generates a module with many functions, classes, and loops, and lets Nuitka
+translate it to C++ only, without the backend C++ compiler, then reports the
+peak memory of the compilation. Pass the number of functions to generate
+and additional Nuitka options on the command line.
+"""
+
+from __future__ import print_function
+
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+function_count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+nuitka_options = sys.argv[2:]
+
+function_template = '''
+def function%(count)d(a, b = %(count)d, *args, **kw):
+    result = []
+
+    for x in range(b):
+        if x %% 3 == 0 and a:
+            result.append((x, "text%(count)d", kw.get("key")))
+        elif len(args) > 2:
+            result.append({"x" : x, "args" : args[1:]})
+        else:
+            try:
+                result.append(a[x])
+            except (IndexError, TypeError) as e:
+                result.append(str(e))
+
+    return [value for value in result if value] + list(args)
+
+class Class%(count)d(object):
+    value = %(count)d
+
+    def __init__(self, a):
+        self.a = a
+
+    def method(self, b):
+        return function%(count)d(self.a, b) or self.value
+'''
+
+
+def main():
+    nuitka = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        "..",
+        "..",
+        "bin",
+        "nuitka"
+    )
+
+    work_dir = tempfile.mkdtemp()
+
+    try:
+        filename = os.path.join(work_dir, "LargeProgram.py")
+
+        with open(filename, 'w') as output:
+            for count in range(function_count):
+                output.write(function_template % {"count" : count})
+
+        start = time.time()
+
+        subprocess.check_call(
+            [
+                sys.executable,
+                nuitka,
+                "--generate-c++-only",
+                "--output-dir=" + work_dir
+            ] + nuitka_options + [
+                filename
+            ],
+            stdout = open(os.devnull, 'w')
+        )
+
+        duration = time.time() - start
+    finally:
+        shutil.rmtree(work_dir)
+
+    # Linux reports this in kB.
+    peak = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+
+    print("Functions:", function_count)
+    print("Compile time: %.2f s" % duration)
+    print("Peak memory: %d kB" % peak)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#     Copyright 2016, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python test originally created or extracted from other peoples work. The
+#     parts from me are licensed as below. It is at least Free Software where
+#     it's copied from other people. In these cases, that will normally be
+#     indicated.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Memory of pre-fork server style workers, Linux only.
+
+Loads a lot of modules, then forks workers, which do a little work and
+garbage collection, like a server would, and then report how much of their
+memory is still shared with the parent, and how much became private.
+
+Compile it with "--recurse-all --recurse-stdlib", with and without the
+"--immortal-constants" option, and compare the private memory.
+"""
+
+from __future__ import print_function
+
+import gc
+import os
+import sys
+
+# Just to have many modules with many constants loaded before forking.
+import codecs, collections, decimal, difflib, email.parser, fractions, json, \
+       optparse, pickle, pydoc, random, re, string, tarfile, textwrap, \
+       xml.dom.minidom, zipfile
+
+worker_count = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+
+
+def getMemoryUsage():
+    # Values in kB, newer kernels have a summary, otherwise add up the
+    # individual mappings.
+    result = {}
+
+    filename = "/proc/self/smaps_rollup"
+    if not os.path.exists(filename):
+        filename = "/proc/self/smaps"
+
+    with open(filename) as smaps_file:
+        for line in smaps_file:
+            parts = line.split()
+
+            if len(parts) == 3 and parts[2] == "kB":
+                key = parts[0].rstrip(':')
+                result[key] = result.get(key, 0) + int(parts[1])
+
+    return result
+
+
+def work():
+    for _count in range(20):
+        decimal.Decimal("1.5") * 3
+        json.dumps({"a" : [1, 2, 3], "b" : "text"})
+        textwrap.fill(string.ascii_letters * 5, 20)
+        re.sub("[aeiou]", "-", "some text to work on")
+        random.choice(list(collections.OrderedDict.fromkeys("abc")))
+
+        gc.collect()
+
+
+def runWorker(write_fd):
+    work()
+
+    usage = getMemoryUsage()
+
+    os.write(
+        write_fd,
+        ("%d %d\n" % (
+            usage.get("Shared_Clean", 0) + usage.get("Shared_Dirty", 0),
+            usage.get("Private_Dirty", 0)
+        )).encode("ascii")
+    )
+
+    os._exit(0)
+
+
+gc.collect()
+
+read_fd, write_fd = os.pipe()
+
+pids = []
+for _worker in range(worker_count):
+    pid = os.fork()
+
+    if pid == 0:
+        os.close(read_fd)
+        runWorker(write_fd)
+
+    pids.append(pid)
+
+os.close(write_fd)
+
+for pid in pids:
+    os.waitpid(pid, 0)
+
+with os.fdopen(read_fd) as reports:
+    results = [
+        [int(value) for value in line.split()]
+        for line in reports
+    ]
+
+shared = sum(result[0] for result in results) // len(results)
+private = sum(result[1] for result in results) // len(results)
+
+print("Workers:", len(results))
+print("Shared memory per worker:  %d kB" % shared)
+print("Private memory per worker: %d kB" % private)
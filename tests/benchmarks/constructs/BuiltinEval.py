@@ -0,0 +1,35 @@
+#     Copyright 2016, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python test originally created or extracted from other peoples work. The
+#     parts from me are licensed as below. It is at least Free Software where
+#     it's copied from other people. In these cases, that will normally be
+#     indicated.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+module_value1 = 1000
+
+import sys
+loop_count = 50000 if len(sys.argv) < 2 else int(sys.argv[1])
+
+def calledRepeatedly(value):
+# construct_begin
+    return eval("value + 1")
+# construct_alternative
+    return value + 1
+# construct_end
+
+for x in xrange(loop_count):
+    calledRepeatedly(module_value1)
+
+print("OK.")